@@ -5,8 +5,8 @@ Daily ETL pipeline for BigDataSmallPrice.
 Runs at 06:00 UTC – after ENTSO-E publishes next-day prices.
 
 Task graph:
-  fetch_entsoe               ─┐
-  fetch_entsoe_actual_load   ─┤
+  fetch_core                 ─┐  (ENTSO-E prices, weather, EKZ, BAFU – concurrent
+  fetch_entsoe_actual_load   ─┤   inside one task; see fetch_tasks.fetch_daily_core)
   fetch_entsoe_gen_ch_b12    ─┤
   fetch_entsoe_gen_ch_b16    ─┤
   fetch_entsoe_gen_de_b19    ─┤
@@ -19,11 +19,9 @@ Task graph:
   fetch_entsoe_flow_ch_at    ─┤
   fetch_entsoe_flow_at_ch    ─┤
   fetch_entsoe_load_forecast ─┤
-  fetch_weather              ─┤
-  fetch_bafu                 ─┤
   fetch_winterthur_load      ─┤
   fetch_winterthur_pv        ─┤
-  fetch_ekz ─► fetch_ckw ─► fetch_groupe_e ─┘  (tariff APIs sequential)
+  fetch_core ─► fetch_ckw ─► fetch_groupe_e ─┘  (tariff APIs sequential)
 
 Task logic lives in src/etl/fetch_tasks.py (shared with backfill_dag).
 """
@@ -47,11 +45,13 @@ default_args = {
 # ─── Task callables ───────────────────────────────────────────────────────────
 
 
-def _fetch_entsoe(**ctx) -> None:
-    from etl.fetch_tasks import fetch_entsoe
+def _fetch_core(**ctx) -> None:
+    from etl.fetch_tasks import fetch_daily_core
     # ENTSO-E day-ahead prices are for the delivery day = data_interval_end
-    date_str = ctx["data_interval_end"].strftime("%Y-%m-%d")
-    fetch_entsoe([date_str])
+    fetch_daily_core(
+        date_str=ctx["logical_date"].strftime("%Y-%m-%d"),
+        delivery_date_str=ctx["data_interval_end"].strftime("%Y-%m-%d"),
+    )
 
 
 def _fetch_entsoe_actual_load(**ctx) -> None:
@@ -61,16 +61,6 @@ def _fetch_entsoe_actual_load(**ctx) -> None:
     fetch_entsoe_actual_load([date_str])
 
 
-def _fetch_weather(**ctx) -> None:
-    from etl.fetch_tasks import fetch_weather
-    fetch_weather([ctx["logical_date"].strftime("%Y-%m-%d")])
-
-
-def _fetch_ekz(**ctx) -> None:
-    from etl.fetch_tasks import fetch_ekz
-    fetch_ekz([ctx["logical_date"].strftime("%Y-%m-%d")])
-
-
 def _fetch_ckw(**ctx) -> None:
     from etl.fetch_tasks import fetch_ckw
     fetch_ckw([ctx["logical_date"].strftime("%Y-%m-%d")])
@@ -81,11 +71,6 @@ def _fetch_groupe_e(**ctx) -> None:
     fetch_groupe_e([ctx["logical_date"].strftime("%Y-%m-%d")])
 
 
-def _fetch_bafu(**ctx) -> None:
-    from etl.fetch_tasks import fetch_bafu
-    fetch_bafu([ctx["logical_date"].strftime("%Y-%m-%d")])
-
-
 def _fetch_winterthur_load(**ctx) -> None:
     from etl.fetch_tasks import fetch_winterthur_load
     fetch_winterthur_load(all_files=False)
@@ -134,13 +119,10 @@ with DAG(
     tags=["bdsp", "etl", "phase-1"],
 ) as dag:
 
-    fetch_entsoe = PythonOperator(task_id="fetch_entsoe", python_callable=_fetch_entsoe)
+    fetch_core = PythonOperator(task_id="fetch_core", python_callable=_fetch_core)
     fetch_entsoe_actual_load = PythonOperator(task_id="fetch_entsoe_actual_load", python_callable=_fetch_entsoe_actual_load)
-    fetch_weather = PythonOperator(task_id="fetch_weather", python_callable=_fetch_weather)
-    fetch_ekz = PythonOperator(task_id="fetch_ekz", python_callable=_fetch_ekz)
     fetch_ckw = PythonOperator(task_id="fetch_ckw", python_callable=_fetch_ckw)
     fetch_groupe_e = PythonOperator(task_id="fetch_groupe_e", python_callable=_fetch_groupe_e)
-    fetch_bafu = PythonOperator(task_id="fetch_bafu", python_callable=_fetch_bafu)
     fetch_winterthur_load = PythonOperator(task_id="fetch_winterthur_load", python_callable=_fetch_winterthur_load)
     fetch_winterthur_pv = PythonOperator(task_id="fetch_winterthur_pv", python_callable=_fetch_winterthur_pv)
     log_summary = PythonOperator(task_id="log_summary", python_callable=_log_summary, trigger_rule="all_done")
@@ -164,11 +146,10 @@ with DAG(
     fetch_entsoe_flow_at_ch = PythonOperator(task_id="fetch_entsoe_flow_at_ch", python_callable=_make_flow_callable(_AT, _CH))
     fetch_entsoe_load_fc    = PythonOperator(task_id="fetch_entsoe_load_forecast", python_callable=_fetch_entsoe_load_forecast)
 
-    # Tariff APIs sequential; everything else parallel
-    fetch_ekz >> fetch_ckw >> fetch_groupe_e
+    # Tariff APIs sequential (EKZ is fetched inside fetch_core); everything else parallel
+    fetch_core >> fetch_ckw >> fetch_groupe_e
 
     [
-        fetch_entsoe,
         fetch_entsoe_actual_load,
         fetch_entsoe_gen_ch_b12,
         fetch_entsoe_gen_ch_b16,
@@ -182,8 +163,6 @@ with DAG(
         fetch_entsoe_flow_ch_at,
         fetch_entsoe_flow_at_ch,
         fetch_entsoe_load_fc,
-        fetch_weather,
-        fetch_bafu,
         fetch_winterthur_load,
         fetch_winterthur_pv,
         fetch_groupe_e,
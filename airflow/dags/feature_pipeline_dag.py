@@ -6,8 +6,10 @@ Runs at 07:00 UTC – one hour after the ETL DAG (06:00 UTC) to ensure
 fresh data is available in TimescaleDB before the export runs.
 
 Task graph:
-  run_feature_export   (single task – queries training_features view,
-                        splits data, writes parquet files to /opt/airflow/data/)
+  refresh_training_features → run_feature_export
+                        (recomputes the training_features materialized view,
+                         then splits it and writes parquet files to
+                         /opt/airflow/data/)
 """
 
 import sys
@@ -33,6 +35,12 @@ default_args = {
 # ─── Task function ────────────────────────────────────────────────────────────
 
 
+def _refresh_training_features(**ctx) -> None:
+    from processing.export_pipeline import refresh_training_features
+
+    refresh_training_features()
+
+
 def _run_feature_export(**ctx) -> None:
     from processing.export_pipeline import run_export
 
@@ -69,6 +77,11 @@ with DAG(
     tags=["bdsp", "features", "phase-2"],
 ) as dag:
 
+    refresh_features = PythonOperator(
+        task_id="refresh_training_features",
+        python_callable=_refresh_training_features,
+    )
+
     run_feature_export = PythonOperator(
         task_id="run_feature_export",
         python_callable=_run_feature_export,
@@ -80,4 +93,5 @@ with DAG(
     )
 
     # Both export tasks are independent (EPEX features vs. load features)
-    # and can run in parallel.
+    # and can run in parallel; only the EPEX export reads the materialized view.
+    refresh_features >> run_feature_export
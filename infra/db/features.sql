@@ -166,8 +166,19 @@ CREATE UNIQUE INDEX IF NOT EXISTS entsoe_load_forecast_time_domain_idx
 --   - ENTSO-E actual data (generation, load, flows) used ONLY as lag features
 --     (lag_24h for D+1, lag_168h for D+7) – never as current-time values.
 --   - Weather from 3 locations: CH, DE-Nord (wind proxy), DE-Süd (solar proxy).
-DROP VIEW IF EXISTS training_features CASCADE;
-CREATE VIEW training_features AS
+-- Materialized (not a TimescaleDB continuous aggregate: those reject the
+-- LAG/AVG window functions and hypertable-to-hypertable joins used below).
+-- Refreshed by the bdsp_feature_daily DAG before each export; the unique
+-- index on time allows REFRESH ... CONCURRENTLY so readers never block.
+DO $$
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_class
+             WHERE relname = 'training_features' AND relkind = 'v') THEN
+    DROP VIEW training_features CASCADE;
+  END IF;
+END $$;
+DROP MATERIALIZED VIEW IF EXISTS training_features CASCADE;
+CREATE MATERIALIZED VIEW training_features AS
 WITH
   price_features AS (
     SELECT
@@ -311,6 +322,8 @@ LEFT JOIN net_pos       np  ON np.time     = pf.time
 LEFT JOIN entsoe_load_forecast lf
   ON  lf.time   = pf.time
   AND lf.domain = '10YCH-SWISSGRIDZ';
+CREATE UNIQUE INDEX IF NOT EXISTS training_features_time_idx
+    ON training_features (time);
 
 -- ─── Winterthur Load (OGD Bruttolastgang) ─────────────────────────────────────
 CREATE TABLE IF NOT EXISTS winterthur_load (
@@ -2,7 +2,7 @@
 ENTSO-E historical backfill script.
 
 Fetches Day-Ahead prices in monthly chunks from 2022-01-01 to yesterday
-and upserts them into TimescaleDB.
+(several chunks in flight at once) and upserts them into TimescaleDB.
 
 Usage:
     BDSP_DB_PASSWORD=xxx ENTSOE_API_TOKEN=xxx python scripts/backfill_entsoe.py
@@ -21,6 +21,7 @@ from pathlib import Path
 # Allow running from repo root without installing the package
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from data_collection.base_collector import run_concurrently
 from data_collection.entsoe_collector import EntsoeCollector
 from db.timescale_client import upsert_entsoe
 
@@ -63,19 +64,22 @@ def main() -> None:
 
     total_records = 0
     chunks = list(_month_chunks(start, end))
-    for i, (chunk_start, chunk_end) in enumerate(chunks, 1):
+    _LOG.info("Fetching %d monthly chunks concurrently", len(chunks))
+    results = run_concurrently(
+        EntsoeCollector(period_start=chunk_start, period_end=chunk_end)
+        for chunk_start, chunk_end in chunks
+    )
+    for i, ((chunk_start, chunk_end), records) in enumerate(zip(chunks, results), 1):
         _LOG.info(
-            "[%d/%d] Fetching %s → %s",
+            "[%d/%d] %s → %s",
             i, len(chunks),
             chunk_start.strftime("%Y-%m-%d"),
             chunk_end.strftime("%Y-%m-%d"),
         )
+        if isinstance(records, BaseException):
+            _LOG.error("  Failed: %s", records)
+            continue
         try:
-            collector = EntsoeCollector(
-                period_start=chunk_start,
-                period_end=chunk_end,
-            )
-            records = collector.run()
             if records:
                 upsert_entsoe(records)
                 total_records += len(records)
@@ -15,7 +15,6 @@ Optional env vars:
     BACKFILL_END    – override end date   (YYYY-MM-DD), default yesterday
 """
 
-import json
 import logging
 import os
 import sys
@@ -27,6 +26,7 @@ import httpx
 # Allow running from repo root without installing the package
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from data_collection.openmeteo_collector import OpenMeteoCollector
 from db.timescale_client import upsert_weather
 
 logging.basicConfig(
@@ -57,16 +57,13 @@ def _date_chunks(start: datetime, end: datetime, chunk_days: int):
         current = chunk_end
 
 
-def _safe_float(lst: list, idx: int):
-    try:
-        v = lst[idx]
-        return float(v) if v is not None else None
-    except (IndexError, TypeError, ValueError):
-        return None
+def fetch_archive(start: datetime, end: datetime) -> dict[str, list]:
+    """
+    Fetch historical weather from Open-Meteo archive API.
 
-
-def fetch_archive(start: datetime, end: datetime) -> list[dict]:
-    """Fetch historical weather from Open-Meteo archive API."""
+    Returns the column-oriented form of ``OpenMeteoCollector.parse_columns``
+    (all timestamps parsed in one vectorized call), ready for upsert_weather.
+    """
     params = {
         "latitude": _LATITUDE,
         "longitude": _LONGITUDE,
@@ -77,32 +74,9 @@ def fetch_archive(start: datetime, end: datetime) -> list[dict]:
     }
     response = httpx.get(_ARCHIVE_URL, params=params, timeout=60)
     response.raise_for_status()
-    data = json.loads(response.text)
-
-    hourly = data.get("hourly", {})
-    times = hourly.get("time", [])
-    temps = hourly.get("temperature_2m", [])
-    winds = hourly.get("wind_speed_10m", [])
-    radiations = hourly.get("shortwave_radiation", [])
-    clouds = hourly.get("cloud_cover", [])
-    precip = hourly.get("precipitation", [])
-
-    records = []
-    for i, t_str in enumerate(times):
-        ts_utc = datetime.fromisoformat(t_str).replace(tzinfo=timezone.utc)
-        records.append(
-            {
-                "time": ts_utc,
-                "latitude": _LATITUDE,
-                "longitude": _LONGITUDE,
-                "temperature_2m": _safe_float(temps, i),
-                "wind_speed_10m": _safe_float(winds, i),
-                "shortwave_radiation": _safe_float(radiations, i),
-                "cloud_cover": _safe_float(clouds, i),
-                "precipitation_mm": _safe_float(precip, i),
-            }
-        )
-    return records
+    return OpenMeteoCollector(latitude=_LATITUDE, longitude=_LONGITUDE).parse_columns(
+        response.content
+    )
 
 
 def main() -> None:
@@ -127,11 +101,12 @@ def main() -> None:
             (chunk_end - timedelta(days=1)).strftime("%Y-%m-%d"),
         )
         try:
-            records = fetch_archive(chunk_start, chunk_end)
-            if records:
-                upsert_weather(records)
-                total_records += len(records)
-                _LOG.info("  Upserted %d records", len(records))
+            columns = fetch_archive(chunk_start, chunk_end)
+            n_records = len(columns["time"])
+            if n_records:
+                upsert_weather(columns)
+                total_records += n_records
+                _LOG.info("  Upserted %d records", n_records)
             else:
                 _LOG.warning("  No records returned for this chunk")
         except Exception as exc:  # noqa: BLE001
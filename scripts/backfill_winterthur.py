@@ -33,14 +33,14 @@ def main() -> None:
     load_records = BruttolastgangCollector(all_files=True).run()
     _LOG.info("Fetched %d load records", len(load_records))
     if load_records:
-        upsert_winterthur_load(load_records)
+        upsert_winterthur_load(load_records, method="copy")
         _LOG.info("Upserted %d load records into winterthur_load", len(load_records))
 
     _LOG.info("Fetching Netzeinspeisung (PV) CSV…")
     pv_records = NetzEinspeisungCollector().run()
     _LOG.info("Fetched %d PV records", len(pv_records))
     if pv_records:
-        upsert_winterthur_pv(pv_records)
+        upsert_winterthur_pv(pv_records, method="copy")
         _LOG.info("Upserted %d PV records into winterthur_pv", len(pv_records))
 
     _LOG.info(
@@ -24,22 +24,39 @@ Serves:
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import os
+import threading
 import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
 from decimal import Decimal
 from pathlib import Path
+from uuid import UUID
 
 import httpx
 import jwt
+import orjson
 import pandas as pd
-import psycopg2
+from psycopg2 import pool
+from psycopg2.extras import RealDictCursor
 from fastapi import Depends, FastAPI, HTTPException, Query, status
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel
 
-app = FastAPI(title="BDSP API", docs_url="/docs")
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    yield
+    # Pool is created lazily on first request; close it on shutdown.
+    if _pool is not None and not _pool.closed:
+        _pool.closeall()
+
+
+app = FastAPI(title="BDSP API", docs_url="/docs", lifespan=_lifespan)
 
 # In Docker the static directory is volume-mounted; locally it lives at src/frontend/static
 _STATIC = Path(os.getenv("BDSP_STATIC_DIR", str(Path(__file__).parent.parent / "frontend" / "static")))
@@ -71,10 +88,40 @@ _TABLES = {
 _AIRFLOW_URL  = os.getenv("AIRFLOW_API_URL",     "http://airflow-webserver:8080")
 _AIRFLOW_USER = os.getenv("AIRFLOW_API_USER",     "admin")
 _AIRFLOW_PASS = os.getenv("AIRFLOW_API_PASSWORD", "")
+_AIRFLOW_PAGE_LIMIT = 100  # Airflow's default maximum_page_limit
 
 # Whitelist – prevents SQL injection via table name parameter
 _ALLOWED_TABLES = set(_TABLES.values())
 
+# Materialized views – approximate_row_count() only works on (hyper)tables
+_VIEWS = {"training_features"}
+
+
+def _db_status_select(key: str, table: str) -> str:
+    # approximate_row_count() reads chunk statistics instead of scanning every
+    # chunk; ORDER BY time LIMIT 1 walks the time index rather than aggregating
+    # the whole hypertable.
+    count_sql = (
+        f"(SELECT count(*) FROM {table})"
+        if table in _VIEWS
+        else f"approximate_row_count('{table}')"
+    )
+    return (
+        f"SELECT '{key}', {count_sql}, "  # noqa: S608
+        f"(SELECT time FROM {table} ORDER BY time ASC LIMIT 1), "
+        f"(SELECT time FROM {table} ORDER BY time DESC LIMIT 1)"
+    )
+
+
+# One round-trip for all tables; keys and names come from the _TABLES whitelist
+_DB_STATUS_SQL = " UNION ALL ".join(
+    _db_status_select(key, table) for key, table in _TABLES.items()
+)
+
+# Shared psycopg2 pool (see _connect); avoids a TCP + auth handshake per request
+_pool: pool.ThreadedConnectionPool | None = None
+_POOL_LOCK = threading.Lock()
+
 # ── JWT config ────────────────────────────────────────────────────────────────
 
 _JWT_SECRET    = os.getenv("BDSP_JWT_SECRET", "change-me-in-production")
@@ -85,6 +132,7 @@ _JWT_EXPIRE_H  = 24
 
 _USERS: dict[str, str] = {}   # username → SHA-256 hashed password
 _model_cache: dict = {}        # prefix → loaded model object
+_response_cache: dict[str, tuple[float, object]] = {}  # endpoint → (expires_at, payload)
 
 _bearer = HTTPBearer()
 
@@ -124,18 +172,107 @@ class PredictResponse(BaseModel):
 # ── Internal helpers ──────────────────────────────────────────────────────────
 
 
+@functools.singledispatch
 def _serialize(v):
-    if v is None:
-        return None
-    if hasattr(v, "isoformat"):
-        return v.isoformat()
-    if isinstance(v, Decimal):
-        return float(v)
-    return v
+    """
+    orjson ``default`` hook for DB values it cannot encode natively.
+
+    Dispatches on the value's type (registered below) instead of probing it
+    with ``isinstance`` / ``hasattr`` on every cell.
+    """
+    raise TypeError(f"Type is not JSON serializable: {type(v).__name__}")
+
+
+_serialize.register(Decimal, float)
+
+
+@_serialize.register(date)
+@_serialize.register(dt_time)
+def _serialize_isoformat(v) -> str:
+    # Covers datetime subclasses orjson rejects (e.g. pandas.Timestamp).
+    return v.isoformat()
+
+
+# Types jsonable_encoder used to handle for db_rows (interval, uuid, bytea).
+_serialize.register(timedelta, timedelta.total_seconds)
+_serialize.register(UUID, str)
+
 
+@_serialize.register(bytes)
+@_serialize.register(memoryview)
+def _serialize_hex(v) -> str:
+    return v.hex()
 
+
+class _ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered by orjson.
+
+    orjson encodes datetimes natively and far faster than the stdlib encoder;
+    anything else (e.g. ``Decimal``) falls back to ``_serialize``.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_serialize,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+def _cached(ttl: float):
+    """
+    Cache a parameterless endpoint's payload in-process for *ttl* seconds.
+
+    Error responses (``JSONResponse``) are never cached, so a transient DB or
+    Airflow outage does not stick around for the whole TTL.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper():
+            now = time.monotonic()
+            hit = _response_cache.get(fn.__name__)
+            if hit is not None and hit[0] > now:
+                return hit[1]
+            result = fn()
+            if not isinstance(result, JSONResponse):
+                _response_cache[fn.__name__] = (now + ttl, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def _get_pool() -> pool.ThreadedConnectionPool:
+    """Return the shared connection pool, creating it on first use."""
+    global _pool
+    p = _pool
+    if p is None or p.closed:
+        # Sync endpoints run in a threadpool; recheck under the lock so
+        # concurrent first requests don't each open a pool.
+        with _POOL_LOCK:
+            p = _pool
+            if p is None or p.closed:
+                p = _pool = pool.ThreadedConnectionPool(minconn=2, maxconn=10, **_DB)
+    return p
+
+
+@contextmanager
 def _connect():
-    return psycopg2.connect(**_DB)
+    """
+    Borrow a pooled connection for the duration of a ``with`` block.
+
+    Any open transaction is rolled back before the connection is returned,
+    so read-only endpoints never leave it idle-in-transaction.  Broken
+    connections are discarded instead of being put back into the pool.
+    """
+    p = _get_pool()
+    conn = p.getconn()
+    try:
+        yield conn
+    finally:
+        if not conn.closed:
+            conn.rollback()
+        p.putconn(conn, close=bool(conn.closed))
 
 
 def _ensure_api_call_log_table(conn) -> None:
@@ -273,22 +410,21 @@ def forecast():
     from processing.export_pipeline import FEATURE_COLS  # noqa: PLC0415
     from processing.tariff_formulas import compute_tariff  # noqa: PLC0415
     try:
-        conn = _connect()
-        df_epex = pd.read_sql(
-            "SELECT * FROM training_features ORDER BY time DESC LIMIT 1",
-            conn,
-            parse_dates=["time"],
-        )
-        # Try to fetch latest load feature row as well
-        try:
-            df_load = pd.read_sql(
-                "SELECT * FROM winterthur_net_load_features ORDER BY time DESC LIMIT 1",
+        with _connect() as conn:
+            df_epex = pd.read_sql(
+                "SELECT * FROM training_features ORDER BY time DESC LIMIT 1",
                 conn,
                 parse_dates=["time"],
             )
-        except Exception:
-            df_load = pd.DataFrame()
-        conn.close()
+            # Try to fetch latest load feature row as well
+            try:
+                df_load = pd.read_sql(
+                    "SELECT * FROM winterthur_net_load_features ORDER BY time DESC LIMIT 1",
+                    conn,
+                    parse_dates=["time"],
+                )
+            except Exception:
+                df_load = pd.DataFrame()
 
         if df_epex.empty:
             return JSONResponse({"error": "No feature data available"}, status_code=503)
@@ -356,15 +492,14 @@ def forecast():
 def price_history(hours: int = Query(default=24, ge=1, le=168)):
     """Return the last *hours* of actual ENTSO-E day-ahead prices."""
     try:
-        conn = _connect()
-        df = pd.read_sql(
-            "SELECT time, price_eur_mwh FROM entsoe_day_ahead_prices "
-            "ORDER BY time DESC LIMIT %s",
-            conn,
-            params=(hours,),
-            parse_dates=["time"],
-        )
-        conn.close()
+        with _connect() as conn:
+            df = pd.read_sql(
+                "SELECT time, price_eur_mwh FROM entsoe_day_ahead_prices "
+                "ORDER BY time DESC LIMIT %s",
+                conn,
+                params=(hours,),
+                parse_dates=["time"],
+            )
         df = df.sort_values("time")
         return {
             "times": [t.isoformat() for t in df["time"]],
@@ -378,21 +513,18 @@ def price_history(hours: int = Query(default=24, ge=1, le=168)):
 
 
 @app.get("/api/db-status")
+@_cached(ttl=300)
 def db_status():
     result = {}
     try:
-        conn = _connect()
-        cur = conn.cursor()
-        for key, table in _TABLES.items():
-            cur.execute(f"SELECT count(*), min(time), max(time) FROM {table}")  # noqa: S608
-            count, oldest, newest = cur.fetchone()
-            result[key] = {
-                "count": count,
-                "oldest": oldest.isoformat() if oldest else None,
-                "newest": newest.isoformat() if newest else None,
-            }
-        cur.close()
-        conn.close()
+        with _connect() as conn, conn.cursor() as cur:
+            cur.execute(_DB_STATUS_SQL)
+            for key, count, oldest, newest in cur.fetchall():
+                result[key] = {
+                    "count": count,
+                    "oldest": oldest.isoformat() if oldest else None,
+                    "newest": newest.isoformat() if newest else None,
+                }
     except Exception as exc:
         return JSONResponse({"error": str(exc)}, status_code=500)
     return result
@@ -410,17 +542,14 @@ def db_schema():
     """
     result: dict = {}
     try:
-        conn = _connect()
-        cur = conn.cursor()
-        cur.execute(sql, (list(_ALLOWED_TABLES),))
-        for table_name, col_name, data_type, nullable in cur.fetchall():
-            result.setdefault(table_name, []).append({
-                "column": col_name,
-                "type": data_type,
-                "nullable": nullable == "YES",
-            })
-        cur.close()
-        conn.close()
+        with _connect() as conn, conn.cursor() as cur:
+            cur.execute(sql, (list(_ALLOWED_TABLES),))
+            for table_name, col_name, data_type, nullable in cur.fetchall():
+                result.setdefault(table_name, []).append({
+                    "column": col_name,
+                    "type": data_type,
+                    "nullable": nullable == "YES",
+                })
     except Exception as exc:
         return JSONResponse({"error": str(exc)}, status_code=500)
     return result
@@ -431,25 +560,51 @@ def db_rows(
     table: str,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    before: datetime | None = Query(default=None),
 ):
-    """Return paginated rows for a whitelisted table, newest first."""
+    """
+    Return paginated rows for a whitelisted table, newest first.
+
+    Pass the previous page's ``next_before`` as *before* to page with a keyset
+    (``time < before``) instead of *offset*, so deep pages stay a short index
+    scan rather than reading and discarding every skipped row.  Rows sharing
+    the last timestamp are kept together on one page, which can make a keyset
+    page slightly longer than *limit*.
+    """
     if table not in _ALLOWED_TABLES:
         return JSONResponse({"error": f"Unknown table: {table!r}"}, status_code=400)
     try:
-        conn = _connect()
-        cur = conn.cursor()
-        cur.execute(  # noqa: S608
-            f"SELECT * FROM {table} ORDER BY time DESC LIMIT %s OFFSET %s",
-            (limit, offset),
-        )
-        cols = [desc[0] for desc in cur.description]
-        rows = [
-            {cols[i]: _serialize(v) for i, v in enumerate(row)}
-            for row in cur.fetchall()
-        ]
-        cur.close()
-        conn.close()
-        return {"columns": cols, "rows": rows, "offset": offset, "limit": limit}
+        # RealDictCursor builds the row dicts in C; values are encoded by orjson
+        with _connect() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
+            if before is None:
+                cur.execute(  # noqa: S608
+                    f"SELECT * FROM {table} ORDER BY time DESC LIMIT %s OFFSET %s",
+                    (limit, offset),
+                )
+            else:
+                cur.execute(  # noqa: S608
+                    f"SELECT * FROM {table} WHERE time < %s ORDER BY time DESC LIMIT %s",
+                    (before, limit),
+                )
+            cols = [desc[0] for desc in cur.description]
+            rows = cur.fetchall()
+
+            if len(rows) == limit and offset == 0:
+                # Complete the group of rows at the page's oldest timestamp so the
+                # next `time < next_before` page does not skip any of them.
+                # (Legacy offset paging keeps exact page sizes.)
+                last_t = rows[-1]["time"]
+                rows = [r for r in rows if r["time"] != last_t]
+                cur.execute(f"SELECT * FROM {table} WHERE time = %s", (last_t,))  # noqa: S608
+                rows.extend(cur.fetchall())
+
+        return _ORJSONResponse({
+            "columns":     cols,
+            "rows":        rows,
+            "offset":      offset,
+            "limit":       limit,
+            "next_before": rows[-1]["time"] if rows else None,
+        })
     except Exception as exc:
         return JSONResponse({"error": str(exc)}, status_code=500)
 
@@ -496,48 +651,43 @@ def timeseries(
     _SKIP_COLS = {"latitude", "longitude", "id"}
 
     try:
-        conn = _connect()
-        cur = conn.cursor()
+        with _connect() as conn, conn.cursor() as cur:
 
-        # Fetch column metadata
-        cur.execute(
-            """
-            SELECT column_name, data_type
-            FROM information_schema.columns
-            WHERE table_schema = 'public' AND table_name = %s
-            ORDER BY ordinal_position
-            """,
-            (table,),
-        )
-        schema = cur.fetchall()
-
-        numeric_types = {"double precision", "numeric", "integer", "bigint", "real", "smallint"}
-        group_cols = _GROUP_COLS.get(table, [])
-        num_cols = [
-            c for c, t in schema
-            if t in numeric_types and c not in _SKIP_COLS
-        ]
-
-        if not num_cols:
-            cur.close()
-            conn.close()
-            return {"traces": []}
+            # Fetch column metadata
+            cur.execute(
+                """
+                SELECT column_name, data_type
+                FROM information_schema.columns
+                WHERE table_schema = 'public' AND table_name = %s
+                ORDER BY ordinal_position
+                """,
+                (table,),
+            )
+            schema = cur.fetchall()
 
-        select_cols = ["time"] + group_cols + num_cols
-        # Use parameterized query for horizon but safe string interpolation for
-        # column/table names (already validated via whitelist)
-        sql = (
-            f"SELECT {', '.join(select_cols)} "  # noqa: S608
-            f"FROM {table} "
-            f"WHERE TRUE {where_extra} "
-            f"ORDER BY time ASC "
-            f"LIMIT 10000"
-        )
-        cur.execute(sql)
-        rows = cur.fetchall()
-        col_names = [desc[0] for desc in cur.description]
-        cur.close()
-        conn.close()
+            numeric_types = {"double precision", "numeric", "integer", "bigint", "real", "smallint"}
+            group_cols = _GROUP_COLS.get(table, [])
+            num_cols = [
+                c for c, t in schema
+                if t in numeric_types and c not in _SKIP_COLS
+            ]
+
+            if not num_cols:
+                return {"traces": []}
+
+            select_cols = ["time"] + group_cols + num_cols
+            # Use parameterized query for horizon but safe string interpolation for
+            # column/table names (already validated via whitelist)
+            sql = (
+                f"SELECT {', '.join(select_cols)} "  # noqa: S608
+                f"FROM {table} "
+                f"WHERE TRUE {where_extra} "
+                f"ORDER BY time ASC "
+                f"LIMIT 10000"
+            )
+            cur.execute(sql)
+            rows = cur.fetchall()
+            col_names = [desc[0] for desc in cur.description]
 
         if not rows:
             return {"traces": []}
@@ -587,6 +737,7 @@ def timeseries(
 
 
 @app.get("/api/feature-status")
+@_cached(ttl=300)
 def feature_status():
     sql = """
         SELECT
@@ -597,12 +748,9 @@ def feature_status():
         FROM training_features
     """
     try:
-        conn = _connect()
-        cur = conn.cursor()
-        cur.execute(sql)
-        row_count, oldest, newest, rows_with_lags = cur.fetchone()
-        cur.close()
-        conn.close()
+        with _connect() as conn, conn.cursor() as cur:
+            cur.execute(sql)
+            row_count, oldest, newest, rows_with_lags = cur.fetchone()
         return {
             "row_count":      int(row_count) if row_count else 0,
             "oldest":         oldest.isoformat() if oldest else None,
@@ -613,7 +761,53 @@ def feature_status():
         return JSONResponse({"error": str(exc)}, status_code=500)
 
 
+def _latest_dag_runs(
+    client: httpx.Client, base: str, auth: tuple[str, str], dag_ids: list[str]
+) -> dict[str, dict]:
+    """
+    Return the newest dag_run per DAG id, using as few Airflow calls as possible.
+
+    One batched ``POST /dags/~/dagRuns/list`` covers the common case.  The batch
+    is ordered newest-first across *all* DAGs, so a DAG whose runs are all
+    crowded out of the page falls back to a single per-DAG lookup.
+    """
+    if not dag_ids:
+        return {}
+    latest: dict[str, dict] = {}
+    resp = client.post(
+        f"{base}/dags/~/dagRuns/list",
+        json={
+            "dag_ids":    dag_ids,
+            "order_by":   "-execution_date",
+            "page_limit": _AIRFLOW_PAGE_LIMIT,
+        },
+        auth=auth,
+    )
+    if resp.is_success:
+        body = resp.json()
+        for run in body.get("dag_runs", []):
+            latest.setdefault(run["dag_id"], run)
+        # The page holds every matching run – DAGs missing from it never ran
+        if body.get("total_entries", 0) <= _AIRFLOW_PAGE_LIMIT:
+            return latest
+
+    for dag_id in dag_ids:
+        if dag_id in latest:
+            continue
+        runs_resp = client.get(
+            f"{base}/dags/{dag_id}/dagRuns",
+            params={"order_by": "-execution_date", "limit": 1},
+            auth=auth,
+        )
+        if runs_resp.is_success:
+            items = runs_resp.json().get("dag_runs", [])
+            if items:
+                latest[dag_id] = items[0]
+    return latest
+
+
 @app.get("/api/airflow/dags")
+@_cached(ttl=30)
 def airflow_dags():
     auth = (_AIRFLOW_USER, _AIRFLOW_PASS)
     base = _AIRFLOW_URL.rstrip("/") + "/api/v1"
@@ -623,25 +817,20 @@ def airflow_dags():
             dags_resp.raise_for_status()
             dags = dags_resp.json()["dags"]
 
+            latest = _latest_dag_runs(client, base, auth, [d["dag_id"] for d in dags])
+
             result = []
             for dag in dags:
                 dag_id = dag["dag_id"]
-                runs_resp = client.get(
-                    f"{base}/dags/{dag_id}/dagRuns",
-                    params={"order_by": "-execution_date", "limit": 1},
-                    auth=auth,
-                )
+                r = latest.get(dag_id)
                 last_run = None
-                if runs_resp.is_success:
-                    items = runs_resp.json().get("dag_runs", [])
-                    if items:
-                        r = items[0]
-                        last_run = {
-                            "state":          r.get("state"),
-                            "execution_date": r.get("execution_date"),
-                            "start_date":     r.get("start_date"),
-                            "end_date":       r.get("end_date"),
-                        }
+                if r is not None:
+                    last_run = {
+                        "state":          r.get("state"),
+                        "execution_date": r.get("execution_date"),
+                        "start_date":     r.get("start_date"),
+                        "end_date":       r.get("end_date"),
+                    }
                 schedule = dag.get("schedule_interval") or {}
                 result.append({
                     "dag_id":    dag_id,
@@ -679,17 +868,14 @@ def rate_limits():
         GROUP BY source
     """
     try:
-        conn = _connect()
-        _ensure_api_call_log_table(conn)
-        cur = conn.cursor()
-        cur.execute(sql_24h)
-        rows_24h = {r[0]: {"calls_last_24h": r[1], "rate_limited_last_24h": r[2],
-                            "last_429": r[3].isoformat() if r[3] else None}
-                    for r in cur.fetchall()}
-        cur.execute(sql_7d)
-        rows_7d = {r[0]: r[1] for r in cur.fetchall()}
-        cur.close()
-        conn.close()
+        with _connect() as conn, conn.cursor() as cur:
+            _ensure_api_call_log_table(conn)
+            cur.execute(sql_24h)
+            rows_24h = {r[0]: {"calls_last_24h": r[1], "rate_limited_last_24h": r[2],
+                                "last_429": r[3].isoformat() if r[3] else None}
+                        for r in cur.fetchall()}
+            cur.execute(sql_7d)
+            rows_7d = {r[0]: r[1] for r in cur.fetchall()}
     except Exception as exc:
         return JSONResponse({"error": str(exc)}, status_code=500)
 
@@ -728,13 +914,10 @@ def rate_limits_history():
         ORDER BY source, hour
     """
     try:
-        conn = _connect()
-        _ensure_api_call_log_table(conn)
-        cur = conn.cursor()
-        cur.execute(sql)
-        rows = cur.fetchall()
-        cur.close()
-        conn.close()
+        with _connect() as conn, conn.cursor() as cur:
+            _ensure_api_call_log_table(conn)
+            cur.execute(sql)
+            rows = cur.fetchall()
     except Exception as exc:
         return JSONResponse({"error": str(exc)}, status_code=500)
 
@@ -785,31 +968,28 @@ def backfill_estimate(req: BackfillRequest):
     sources = {}
     total_calls = 0
     try:
-        conn = _connect()
-        cur = conn.cursor()
-        for src, (table, cpd) in _SOURCE_TABLES.items():
-            cur.execute(
-                f"SELECT MIN(time)::date, MAX(time)::date FROM {table}"  # noqa: S608
-            )
-            db_min, db_max = cur.fetchone()
-            # Count days not yet in DB (simple heuristic: days outside DB range)
-            if db_min is None or db_max is None:
-                to_fetch = total_days
-            else:
-                already = sum(
-                    1 for i in range(total_days)
-                    if db_min <= (start + _dt.timedelta(days=i)) <= db_max
+        with _connect() as conn, conn.cursor() as cur:
+            for src, (table, cpd) in _SOURCE_TABLES.items():
+                cur.execute(
+                    f"SELECT MIN(time)::date, MAX(time)::date FROM {table}"  # noqa: S608
                 )
-                to_fetch = total_days - already
-            calls = to_fetch * cpd
-            total_calls += calls
-            sources[src] = {
-                "calls":        calls,
-                "already_in_db": total_days - to_fetch,
-                "to_fetch":     to_fetch,
-            }
-        cur.close()
-        conn.close()
+                db_min, db_max = cur.fetchone()
+                # Count days not yet in DB (simple heuristic: days outside DB range)
+                if db_min is None or db_max is None:
+                    to_fetch = total_days
+                else:
+                    already = sum(
+                        1 for i in range(total_days)
+                        if db_min <= (start + _dt.timedelta(days=i)) <= db_max
+                    )
+                    to_fetch = total_days - already
+                calls = to_fetch * cpd
+                total_calls += calls
+                sources[src] = {
+                    "calls":        calls,
+                    "already_in_db": total_days - to_fetch,
+                    "to_fetch":     to_fetch,
+                }
     except Exception as exc:
         return JSONResponse({"error": str(exc)}, status_code=500)
 
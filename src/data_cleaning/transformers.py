@@ -8,6 +8,7 @@ Functions:
   validate_ascending_timestamps() – Raise ValueError if timestamps are not sorted
 """
 
+import numpy as np
 import pandas as pd
 
 
@@ -18,16 +19,15 @@ def to_utc(df: pd.DataFrame, time_col: str = "time") -> pd.DataFrame:
     - If the column is already tz-aware, converts to UTC.
     - If it is tz-naive, assumes UTC and localizes.
 
-    Returns a new DataFrame with the converted column.
+    Returns a new DataFrame with the converted column; the other columns are
+    shared with *df* rather than deep-copied.
     """
-    df = df.copy()
     col = pd.to_datetime(df[time_col])
     if col.dt.tz is None:
         col = col.dt.tz_localize("UTC")
     else:
         col = col.dt.tz_convert("UTC")
-    df[time_col] = col
-    return df
+    return df.assign(**{time_col: col})
 
 
 def aggregate_to_hourly(
@@ -43,12 +43,10 @@ def aggregate_to_hourly(
 
     Returns a new DataFrame with columns [time_col, value_col].
     """
-    df = df.copy()
-    df[time_col] = pd.to_datetime(df[time_col], utc=True)
-    df = df.set_index(time_col)
-    hourly = df[[value_col]].resample("1h").mean()
-    hourly = hourly.reset_index().rename(columns={"index": time_col})
-    return hourly
+    # Resample just the value column on a DatetimeIndex – no full-frame copy
+    times = pd.DatetimeIndex(pd.to_datetime(df[time_col], utc=True), name=time_col)
+    hourly = df[value_col].set_axis(times).resample("1h").mean()
+    return hourly.reset_index()
 
 
 def validate_no_nulls(df: pd.DataFrame, cols: list[str]) -> None:
@@ -59,14 +57,16 @@ def validate_no_nulls(df: pd.DataFrame, cols: list[str]) -> None:
         df:   DataFrame to check.
         cols: Column names to validate.
     """
-    for col in cols:
-        if col not in df.columns:
-            raise ValueError(f"Column '{col}' not found in DataFrame.")
-        null_count = df[col].isna().sum()
-        if null_count > 0:
-            raise ValueError(
-                f"Column '{col}' contains {null_count} null value(s)."
-            )
+    missing = [col for col in cols if col not in df.columns]
+    if missing:
+        raise ValueError(f"Column '{missing[0]}' not found in DataFrame.")
+    # One isna() pass over all columns; per-column counts only on failure
+    mask = df[cols].isna()
+    if mask.to_numpy().any():
+        counts = mask.sum()
+        bad = counts[counts > 0].to_dict()
+        details = ", ".join(f"'{col}' ({n})" for col, n in bad.items())
+        raise ValueError(f"Column(s) contain null value(s): {details}.")
 
 
 def validate_ascending_timestamps(
@@ -79,8 +79,14 @@ def validate_ascending_timestamps(
         df:       DataFrame to check.
         time_col: Name of the timestamp column.
     """
-    times = pd.to_datetime(df[time_col])
-    if not times.is_monotonic_increasing:
+    times = df[time_col]
+    if not pd.api.types.is_datetime64_any_dtype(times):
+        # Strings / datetime objects – parse once (tz-aware values to UTC)
+        times = pd.to_datetime(times, utc=True)
+    # tz-aware columns come out as UTC datetime64; compare as raw int64
+    arr = times.to_numpy(dtype="datetime64[ns]").view("i8")
+    # One vectorised diff; NaT (min int64) also counts as out of order
+    if np.any(np.diff(arr) < 0):
         raise ValueError(
             f"Column '{time_col}' is not sorted in ascending order."
         )
@@ -6,10 +6,11 @@ Station: Rhein-Rekingen, ID 2018
 Parameters: flow = Abfluss (m³/s), height = Pegel (m.ü.M.)
 """
 
-import json
 import logging
 from datetime import datetime, timedelta, timezone
 
+import ijson
+
 from .base_collector import BaseCollector
 
 _LOG = logging.getLogger(__name__)
@@ -17,6 +18,9 @@ _LOG = logging.getLogger(__name__)
 _BASE_URL = "https://api.existenz.ch/apiv1/hydro/daterange"
 _STATION_ID = "2018"  # Rhein-Rekingen
 
+# API parameter name → record field
+_PARAM_COLUMNS = {"flow": "discharge_m3s", "height": "level_masl"}
+
 
 class BafuCollector(BaseCollector):
     """
@@ -41,7 +45,7 @@ class BafuCollector(BaseCollector):
         self.days_back = days_back
         self.date = date
 
-    def fetch(self) -> str:
+    def fetch(self) -> bytes:
         if self.date is not None:
             date_from = self.date
             date_to = self.date
@@ -62,45 +66,35 @@ class BafuCollector(BaseCollector):
             _BASE_URL, params=params,
             source=self._source_name, date_fetched=date_from,
         )
-        return response.text
+        return response.content
 
     def parse(self, raw: bytes | str) -> list[dict]:
-        if isinstance(raw, bytes):
-            raw = raw.decode()
-        data = json.loads(raw)
-
-        payload = data.get("payload", [])
-        if not payload:
-            _LOG.warning("BAFU parse: empty payload. Response keys: %s", list(data.keys()))
-            return []
-
-        # Merge flow and height entries that share the same timestamp into one record.
+        # Stream the payload entries one by one and merge flow and height
+        # readings that share a timestamp straight into one row each (last
+        # value wins), so the decoded payload list is never materialised.
         # Timestamps are Unix epoch integers.
-        by_ts: dict[int, dict] = {}
-        for entry in payload:
-            ts_unix = entry.get("timestamp")
-            par = entry.get("par")
-            val = entry.get("val")
-            if ts_unix is None or par is None:
+        if isinstance(raw, str):
+            raw = raw.encode()  # ijson reads bytes
+        rows: dict[int, dict[str, float | None]] = {}
+        for entry in ijson.items(raw, "payload.item", use_float=True):
+            ts, par = entry.get("timestamp"), entry.get("par")
+            if ts is None or par is None:
                 continue
-            if ts_unix not in by_ts:
-                by_ts[ts_unix] = {"ts_unix": ts_unix}
-            if par == "flow":
-                by_ts[ts_unix]["discharge_m3s"] = float(val) if val is not None else None
-            elif par == "height":
-                by_ts[ts_unix]["level_masl"] = float(val) if val is not None else None
-
-        records: list[dict] = []
-        for ts_unix, fields in by_ts.items():
-            ts_utc = datetime.fromtimestamp(fields["ts_unix"], tz=timezone.utc)
-            records.append(
-                {
-                    "time": ts_utc,
-                    "station_id": self.station_id,
-                    "discharge_m3s": fields.get("discharge_m3s"),
-                    "level_masl": fields.get("level_masl"),
-                }
-            )
-
-        records.sort(key=lambda r: r["time"])
-        return records
+            row = rows.setdefault(ts, dict.fromkeys(_PARAM_COLUMNS.values()))
+            column = _PARAM_COLUMNS.get(par)
+            if column is not None:
+                val = entry.get("val")
+                row[column] = None if val is None else float(val)
+
+        if not rows:
+            _LOG.warning("BAFU parse: empty payload.")
+            return []
+
+        return [
+            {
+                "time": datetime.fromtimestamp(ts, tz=timezone.utc),
+                "station_id": self.station_id,
+                **rows[ts],
+            }
+            for ts in sorted(rows)
+        ]
@@ -1,14 +1,54 @@
 """Abstract base class for all data collectors."""
 
+import asyncio
+import atexit
 import logging
+import os
+import threading
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import Iterable
 
 import httpx
 
 _LOG = logging.getLogger(__name__)
 
+# Shared keep-alive client: retries reuse the pooled TCP/TLS connection
+# instead of paying a fresh handshake per attempt, and HTTP/2 multiplexes
+# concurrent requests to the same host over one connection.  The transport
+# also retries failed connection attempts on its own before
+# _fetch_with_retry's back-off kicks in.
+_CLIENT: httpx.Client | None = None
+_CLIENT_LOCK = threading.Lock()
+_TRANSPORT_RETRIES = 2
+_LIMITS = httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60)
+# Upper bound for run_concurrently(); stays within the keep-alive pool size.
+_MAX_CONCURRENT_FETCHES = 8
+
+
+def _get_client() -> httpx.Client:
+    """Return the process-wide httpx.Client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                # http2 / limits must be set on the transport: a custom
+                # transport makes httpx ignore the Client-level options.
+                _CLIENT = httpx.Client(
+                    timeout=30,
+                    transport=httpx.HTTPTransport(
+                        http2=True, limits=_LIMITS, retries=_TRANSPORT_RETRIES,
+                    ),
+                )
+                atexit.register(_CLIENT.close)
+    return _CLIENT
+
+
+def _http_get(url: str, params: dict | None = None, timeout: int = 30) -> httpx.Response:
+    """GET *url* on the shared client."""
+    return _get_client().get(url, params=params, timeout=timeout)
+
 
 def _log_api_call(
     source: str,
@@ -22,8 +62,6 @@ def _log_api_call(
     Uses a standalone psycopg2 connection (not the connection pool) to avoid
     circular imports with timescale_client.py.
     """
-    import os  # noqa: PLC0415
-
     try:
         import psycopg2  # noqa: PLC0415
 
@@ -49,6 +87,39 @@ def _log_api_call(
         _LOG.warning("api_call_log insert failed (non-critical): %s", exc)
 
 
+def run_concurrently(
+    collectors: Iterable["BaseCollector"],
+    max_concurrency: int = _MAX_CONCURRENT_FETCHES,
+) -> list[list[dict] | BaseException]:
+    """
+    Run many collectors (e.g. backfill day/month slices) with overlapping fetches.
+
+    At most *max_concurrency* requests are in flight at once.  Results come
+    back in input order; a collector that raised contributes its exception
+    instead of cancelling the others.
+
+    Args:
+        collectors:      Collectors to run.
+        max_concurrency: Maximum number of concurrent fetches.
+
+    Returns:
+        One entry per collector: its validated records, or the exception.
+    """
+
+    async def _gather() -> list:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(collector: BaseCollector) -> list[dict]:
+            async with semaphore:
+                return await collector.arun()
+
+        return await asyncio.gather(
+            *(_one(c) for c in collectors), return_exceptions=True,
+        )
+
+    return asyncio.run(_gather())
+
+
 class BaseCollector(ABC):
     """
     Every collector must implement fetch() and parse().
@@ -76,13 +147,27 @@ class BaseCollector(ABC):
 
     def run(self) -> list[dict]:
         """Fetch, parse, and validate records."""
-        raw = self.fetch()
+        return self._finish(self.fetch())
+
+    async def afetch(self) -> bytes | str:
+        """
+        Awaitable ``fetch()``: runs it in a worker thread on the shared client,
+        so many collectors can wait on the network at the same time.
+        """
+        return await asyncio.to_thread(self.fetch)
+
+    async def arun(self) -> list[dict]:
+        """Awaitable ``run()``: concurrent fetch, then parse and validate."""
+        return self._finish(await self.afetch())
+
+    # ── Internal ──────────────────────────────────────────────────────────────
+
+    def _finish(self, raw: bytes | str) -> list[dict]:
+        """Parse and validate *raw*; the shared tail of ``run()`` and ``arun()``."""
         records = self.parse(raw)
         self._validate(records)
         return records
 
-    # ── Internal ──────────────────────────────────────────────────────────────
-
     @staticmethod
     def _fetch_with_retry(
         url: str,
@@ -100,6 +185,7 @@ class BaseCollector(ABC):
         - ConnectTimeout/ReadTimeout/ConnectError: exponential back-off.
         - All other errors raise immediately via raise_for_status().
 
+        All attempts go through the shared keep-alive client (see _get_client).
         If *source* is provided, each response is logged to api_call_log.
         """
         response: httpx.Response | None = None
@@ -107,7 +193,7 @@ class BaseCollector(ABC):
         for attempt in range(max_retries):
             t0 = time.monotonic()
             try:
-                response = httpx.get(url, params=params, timeout=timeout)
+                response = _http_get(url, params=params, timeout=timeout)
             except (httpx.ConnectTimeout, httpx.ReadTimeout, httpx.ConnectError) as exc:
                 last_exc = exc
                 wait = 2 ** attempt
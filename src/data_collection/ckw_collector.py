@@ -76,12 +76,15 @@ class CKWCollector(BaseCollector):
                 continue
             ts_utc = datetime.fromisoformat(ts_raw).astimezone(timezone.utc)
             for component in self.COMPONENTS:
-                for item in entry.get(component, []):
-                    if item.get("unit") == "CHF_kWh":
-                        records.append({
-                            "time": ts_utc,
-                            "tariff_type": component,
-                            "price_chf_kwh": float(item["value"]),
-                        })
+                price = next(
+                    (item["value"] for item in entry.get(component, ()) if item.get("unit") == "CHF_kWh"),
+                    None,
+                )
+                if price is not None:
+                    records.append({
+                        "time": ts_utc,
+                        "tariff_type": component,
+                        "price_chf_kwh": float(price),
+                    })
 
         return records
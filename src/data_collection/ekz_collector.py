@@ -13,10 +13,12 @@ Correct parameters (confirmed 2026-03):
   — NOT the old date/tariffType params which returned a flat rate.
 """
 
-import json
+import functools
 import logging
 from datetime import datetime, timezone
 
+import orjson
+
 from .base_collector import BaseCollector
 
 _LOG = logging.getLogger(__name__)
@@ -46,7 +48,7 @@ class EkzCollector(BaseCollector):
     def __init__(self, date: str | None = None) -> None:
         self.date = date or datetime.now(tz=timezone.utc).strftime("%Y-%m-%d")
 
-    def fetch(self) -> str:
+    def fetch(self) -> bytes:
         start = f"{self.date}T00:00:00+01:00"
         end   = f"{self.date}T23:59:59+01:00"
 
@@ -62,32 +64,46 @@ class EkzCollector(BaseCollector):
                 _API_URL, params=params,
                 source=self._source_name, date_fetched=self.date,
             )
-            data = json.loads(resp.text)
+            data = orjson.loads(resp.content)
             combined.extend(data.get("prices", []))
 
         if not combined:
             _LOG.warning("EKZ fetch: 0 price entries for date %s", self.date)
 
-        return json.dumps({"prices": combined})
+        return orjson.dumps({"prices": combined})
 
     def parse(self, raw: bytes | str) -> list[dict]:
-        if isinstance(raw, bytes):
-            raw = raw.decode()
-        data = json.loads(raw)
+        # orjson parses bytes directly – no intermediate str decode
+        data = orjson.loads(raw)
 
         records: list[dict] = []
         for entry in data.get("prices", []):
             ts_raw = entry.get("start_timestamp")
             if ts_raw is None:
                 continue
-            ts_utc = datetime.fromisoformat(ts_raw).astimezone(timezone.utc)
+            ts_utc = _parse_timestamp(ts_raw)
             for tariff_type, _ in _TARIFFS:
-                for item in entry.get(tariff_type, []):
-                    if item.get("unit") == "CHF_kWh":
-                        records.append({
-                            "time":         ts_utc,
-                            "tariff_type":  tariff_type,
-                            "price_chf_kwh": float(item["value"]),
-                        })
+                # Stop at the first CHF_kWh item instead of walking every unit
+                price = next(
+                    (item["value"] for item in entry.get(tariff_type, ()) if item.get("unit") == "CHF_kWh"),
+                    None,
+                )
+                if price is not None:
+                    records.append({
+                        "time":         ts_utc,
+                        "tariff_type":  tariff_type,
+                        "price_chf_kwh": float(price),
+                    })
 
         return records
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(ts_raw: str) -> datetime:
+    """
+    Parse an EKZ ``start_timestamp`` (ISO with offset) to UTC.
+
+    Cached: the electricity and integrated responses merged by ``fetch`` carry
+    the same 96 timestamps, and backfills re-parse overlapping days.
+    """
+    return datetime.fromisoformat(ts_raw).astimezone(timezone.utc)
@@ -6,9 +6,13 @@ Document type A44 = Day-ahead Prices
 Domain: 10YCH-SWISSGRIDZ (Switzerland / Swissgrid)
 """
 
+import functools
+import io
 import os
-import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta, timezone
+from typing import Iterator, NamedTuple
+
+from lxml import etree
 
 from .base_collector import BaseCollector
 
@@ -19,9 +23,9 @@ _IT_DOMAIN = "10YIT-GRTN-----B"  # Italy BZN
 _NS = {"ns": "urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:3"}
 
 
-def _ns_from_root(root: ET.Element) -> dict:
-    """Extract namespace from root element tag so parsing works across all ENTSO-E document types."""
-    tag = root.tag
+def _ns_from_root(element: etree._Element) -> dict:
+    """Extract namespace from an element tag so parsing works across all ENTSO-E document types."""
+    tag = element.tag
     if tag.startswith("{"):
         return {"ns": tag[1: tag.index("}")]}
     return _NS
@@ -68,41 +72,18 @@ class EntsoeCollector(BaseCollector):
         return response.content
 
     def parse(self, raw: bytes | str) -> list[dict]:
-        if isinstance(raw, str):
-            raw = raw.encode()
-        root = ET.fromstring(raw)
-
         records: list[dict] = []
-        for ts in root.findall(".//ns:TimeSeries", _NS):
-            currency = _text(ts, "ns:currency_Unit.name", _NS) or "EUR"
-            period = ts.find("ns:Period", _NS)
-            if period is None:
-                continue
-
-            start_str = _text(period, "ns:timeInterval/ns:start", _NS)
-            if start_str is None:
-                continue
-            interval_start = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-
-            resolution = _text(period, "ns:resolution", _NS) or "PT60M"
-            interval_minutes = _resolution_to_minutes(resolution)
-
-            for point in period.findall("ns:Point", _NS):
-                pos_str = _text(point, "ns:position", _NS)
-                price_str = _text(point, "ns:price.amount", _NS)
-                if pos_str is None or price_str is None:
-                    continue
-                position = int(pos_str) - 1  # 1-based → 0-based
-                ts_utc = interval_start + timedelta(minutes=position * interval_minutes)
-                records.append(
-                    {
-                        "time": ts_utc,
-                        "price_eur_mwh": float(price_str),
-                        "currency": currency,
-                        "domain": _DOMAIN,
-                    }
-                )
-
+        for ts, paths, points in _iter_series(raw, "price.amount", _NS):
+            currency = next(iter(paths.currency(ts)), "EUR")
+            records.extend(
+                {
+                    "time": ts_utc,
+                    "price_eur_mwh": value,
+                    "currency": currency,
+                    "domain": _DOMAIN,
+                }
+                for ts_utc, value in points
+            )
         return records
 
 
@@ -147,40 +128,12 @@ class EntsoeActualLoadCollector(BaseCollector):
         return response.content
 
     def parse(self, raw: bytes | str) -> list[dict]:
-        if isinstance(raw, str):
-            raw = raw.encode()
-        root = ET.fromstring(raw)
-        ns = _ns_from_root(root)
-
         records: list[dict] = []
-        for ts in root.findall(".//ns:TimeSeries", ns):
-            period = ts.find("ns:Period", ns)
-            if period is None:
-                continue
-
-            start_str = _text(period, "ns:timeInterval/ns:start", ns)
-            if start_str is None:
-                continue
-            interval_start = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-
-            resolution = _text(period, "ns:resolution", ns) or "PT60M"
-            interval_minutes = _resolution_to_minutes(resolution)
-
-            for point in period.findall("ns:Point", ns):
-                pos_str = _text(point, "ns:position", ns)
-                qty_str = _text(point, "ns:quantity", ns)
-                if pos_str is None or qty_str is None:
-                    continue
-                position = int(pos_str) - 1  # 1-based → 0-based
-                ts_utc = interval_start + timedelta(minutes=position * interval_minutes)
-                records.append(
-                    {
-                        "time": ts_utc,
-                        "load_mwh": float(qty_str),
-                        "domain": _DOMAIN,
-                    }
-                )
-
+        for _, _, points in _iter_series(raw, "quantity"):
+            records.extend(
+                {"time": ts_utc, "load_mwh": value, "domain": _DOMAIN}
+                for ts_utc, value in points
+            )
         return records
 
 
@@ -232,41 +185,17 @@ class EntsoeGenerationCollector(BaseCollector):
         return response.content
 
     def parse(self, raw: bytes | str) -> list[dict]:
-        if isinstance(raw, str):
-            raw = raw.encode()
-        root = ET.fromstring(raw)
-        ns = _ns_from_root(root)
-
         records: list[dict] = []
-        for ts in root.findall(".//ns:TimeSeries", ns):
-            period = ts.find("ns:Period", ns)
-            if period is None:
-                continue
-
-            start_str = _text(period, "ns:timeInterval/ns:start", ns)
-            if start_str is None:
-                continue
-            interval_start = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-
-            resolution = _text(period, "ns:resolution", ns) or "PT60M"
-            interval_minutes = _resolution_to_minutes(resolution)
-
-            for point in period.findall("ns:Point", ns):
-                pos_str = _text(point, "ns:position", ns)
-                qty_str = _text(point, "ns:quantity", ns)
-                if pos_str is None or qty_str is None:
-                    continue
-                position = int(pos_str) - 1  # 1-based → 0-based
-                ts_utc = interval_start + timedelta(minutes=position * interval_minutes)
-                records.append(
-                    {
-                        "time": ts_utc,
-                        "domain": self.domain,
-                        "psr_type": self.psr_type,
-                        "quantity_mwh": float(qty_str),
-                    }
-                )
-
+        for _, _, points in _iter_series(raw, "quantity"):
+            records.extend(
+                {
+                    "time": ts_utc,
+                    "domain": self.domain,
+                    "psr_type": self.psr_type,
+                    "quantity_mwh": value,
+                }
+                for ts_utc, value in points
+            )
         return records
 
 
@@ -317,41 +246,17 @@ class EntsoeCrossBorderFlowCollector(BaseCollector):
         return response.content
 
     def parse(self, raw: bytes | str) -> list[dict]:
-        if isinstance(raw, str):
-            raw = raw.encode()
-        root = ET.fromstring(raw)
-        ns = _ns_from_root(root)
-
         records: list[dict] = []
-        for ts in root.findall(".//ns:TimeSeries", ns):
-            period = ts.find("ns:Period", ns)
-            if period is None:
-                continue
-
-            start_str = _text(period, "ns:timeInterval/ns:start", ns)
-            if start_str is None:
-                continue
-            interval_start = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-
-            resolution = _text(period, "ns:resolution", ns) or "PT60M"
-            interval_minutes = _resolution_to_minutes(resolution)
-
-            for point in period.findall("ns:Point", ns):
-                pos_str = _text(point, "ns:position", ns)
-                qty_str = _text(point, "ns:quantity", ns)
-                if pos_str is None or qty_str is None:
-                    continue
-                position = int(pos_str) - 1  # 1-based → 0-based
-                ts_utc = interval_start + timedelta(minutes=position * interval_minutes)
-                records.append(
-                    {
-                        "time": ts_utc,
-                        "in_domain": self.in_domain,
-                        "out_domain": self.out_domain,
-                        "flow_mwh": float(qty_str),
-                    }
-                )
-
+        for _, _, points in _iter_series(raw, "quantity"):
+            records.extend(
+                {
+                    "time": ts_utc,
+                    "in_domain": self.in_domain,
+                    "out_domain": self.out_domain,
+                    "flow_mwh": value,
+                }
+                for ts_utc, value in points
+            )
         return records
 
 
@@ -399,48 +304,120 @@ class EntsoeLoadForecastCollector(BaseCollector):
         return response.content
 
     def parse(self, raw: bytes | str) -> list[dict]:
-        if isinstance(raw, str):
-            raw = raw.encode()
-        root = ET.fromstring(raw)
-        ns = _ns_from_root(root)
-
         records: list[dict] = []
-        for ts in root.findall(".//ns:TimeSeries", ns):
-            period = ts.find("ns:Period", ns)
-            if period is None:
-                continue
-
-            start_str = _text(period, "ns:timeInterval/ns:start", ns)
-            if start_str is None:
-                continue
-            interval_start = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-
-            resolution = _text(period, "ns:resolution", ns) or "PT60M"
-            interval_minutes = _resolution_to_minutes(resolution)
-
-            for point in period.findall("ns:Point", ns):
-                pos_str = _text(point, "ns:position", ns)
-                qty_str = _text(point, "ns:quantity", ns)
-                if pos_str is None or qty_str is None:
+        for _, _, points in _iter_series(raw, "quantity"):
+            records.extend(
+                {"time": ts_utc, "domain": self.domain, "load_mwh": value}
+                for ts_utc, value in points
+            )
+        return records
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+class _SeriesPaths(NamedTuple):
+    """XPath queries for one ENTSO-E namespace / Point value tag."""
+
+    period: etree.XPath
+    start: etree.XPath
+    resolution: etree.XPath
+    currency: etree.XPath
+    point: etree.XPath
+    position: etree.XPath
+    value: etree.XPath
+
+
+@functools.lru_cache(maxsize=None)
+def _series_paths(ns_uri: str, value_tag: str) -> _SeriesPaths:
+    """
+    Compile the TimeSeries / Period / Point queries once per namespace and
+    value tag.  ``text()`` queries return plain strings (``smart_strings``
+    off, so results hold no back-reference to the tree being cleared).
+    """
+    ns = {"ns": ns_uri}
+
+    def text(path: str) -> etree.XPath:
+        return etree.XPath(f"{path}/text()", namespaces=ns, smart_strings=False)
+
+    return _SeriesPaths(
+        period=etree.XPath("ns:Period[1]", namespaces=ns),
+        start=text("ns:timeInterval/ns:start"),
+        resolution=text("ns:resolution"),
+        currency=text("ns:currency_Unit.name"),
+        point=etree.XPath("ns:Point", namespaces=ns),
+        position=text("ns:position"),
+        value=text(f"ns:{value_tag}"),
+    )
+
+
+def _iter_series(
+    raw: bytes | str,
+    value_tag: str,
+    ns: dict | None = None,
+) -> Iterator[tuple[etree._Element, _SeriesPaths, list[tuple[datetime, float]]]]:
+    """
+    Yield ``(TimeSeries element, paths, [(time_utc, value), ...])`` for an
+    ENTSO-E document; *paths* are the compiled queries for the series'
+    namespace, for callers that read further TimeSeries fields.
+
+    The document is stream-parsed with ``iterparse``: each TimeSeries is
+    handled as soon as its end tag is read and then cleared (together with
+    already-processed siblings), so peak memory is one TimeSeries rather than
+    the whole document.  The yielded element is only valid until the next
+    iteration.
+
+    Only the first ``Period`` of each TimeSeries is read.  Point timestamps are
+    derived from the period start, resolution and 1-based ``position``; points
+    missing ``position`` or *value_tag* are skipped.
+
+    Args:
+        raw:       XML document as bytes or str.
+        value_tag: Point child holding the value (``price.amount`` or ``quantity``).
+        ns:        Namespace map; taken from the TimeSeries tags when omitted.
+    """
+    if isinstance(raw, str):
+        raw = raw.encode()
+    tag = f"{{{ns['ns']}}}TimeSeries" if ns else "{*}TimeSeries"
+
+    for _, ts in etree.iterparse(io.BytesIO(raw), events=("end",), tag=tag):
+        paths = _series_paths((ns or _ns_from_root(ts))["ns"], value_tag)
+        period = next(iter(paths.period(ts)), None)
+        start = paths.start(period) if period is not None else []
+        if start:
+            interval_start = _parse_period_start(start[0])
+
+            resolution = paths.resolution(period)
+            interval_minutes = _resolution_to_minutes(resolution[0] if resolution else "PT60M")
+
+            points: list[tuple[datetime, float]] = []
+            for point in paths.point(period):
+                pos = paths.position(point)
+                value = paths.value(point)
+                if not pos or not value:
                     continue
-                position = int(pos_str) - 1  # 1-based → 0-based
-                ts_utc = interval_start + timedelta(minutes=position * interval_minutes)
-                records.append(
-                    {
-                        "time": ts_utc,
-                        "domain": self.domain,
-                        "load_mwh": float(qty_str),
-                    }
+                position = int(pos[0]) - 1  # 1-based → 0-based
+                points.append(
+                    (interval_start + timedelta(minutes=position * interval_minutes), float(value[0]))
                 )
+            yield ts, paths, points
 
-        return records
+        # Drop the parsed subtree and any earlier siblings still attached to
+        # the root so the tree never grows beyond one TimeSeries.
+        ts.clear(keep_tail=True)
+        while ts.getprevious() is not None:
+            del ts.getparent()[0]
 
 
-# ── Helpers ───────────────────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=1024)
+def _parse_period_start(start_str: str) -> datetime:
+    """
+    Parse a Period ``timeInterval/start`` such as ``2026-02-27T00:00Z``.
 
-def _text(element: ET.Element, path: str, ns: dict) -> str | None:
-    el = element.find(path, ns)
-    return el.text if el is not None else None
+    Python 3.11+ ``fromisoformat`` reads the trailing ``Z`` natively.  Cached
+    because every TimeSeries of a day (one per PSR type / border / document)
+    shares the same start string.
+    """
+    return datetime.fromisoformat(start_str)
 
 
 def _resolution_to_minutes(resolution: str) -> int:
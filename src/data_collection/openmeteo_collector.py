@@ -11,6 +11,9 @@ Auto-selects endpoint based on date age:
 
 from datetime import datetime, timezone
 
+import orjson
+import pandas as pd
+
 from .base_collector import BaseCollector
 
 _FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
@@ -18,6 +21,10 @@ _ARCHIVE_URL = "https://archive-api.open-meteo.com/v1/archive"
 _LATITUDE = 47.5001
 _LONGITUDE = 8.7502
 _HOURLY_VARS = "temperature_2m,wind_speed_10m,shortwave_radiation,cloud_cover,precipitation"
+# Hourly response arrays, in the order parse() unpacks them
+_RESPONSE_VARS = (
+    "temperature_2m", "wind_speed_10m", "shortwave_radiation", "cloud_cover", "precipitation",
+)
 
 
 def _is_historical(date_str: str) -> bool:
@@ -57,7 +64,7 @@ class OpenMeteoCollector(BaseCollector):
         self.forecast_days = forecast_days
         self.date = date
 
-    def fetch(self) -> str:
+    def fetch(self) -> bytes:
         if self.date is not None and _is_historical(self.date):
             params = {
                 "latitude": self.latitude,
@@ -88,45 +95,61 @@ class OpenMeteoCollector(BaseCollector):
                 source=self._source_name,
                 date_fetched=self.date,
             )
-        return response.text
+        return response.content
 
     def parse(self, raw: bytes | str) -> list[dict]:
-        import json
+        columns = self.parse_columns(raw)
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    def parse_columns(self, raw: bytes | str) -> dict[str, list]:
+        """
+        Parse *raw* into column-oriented data: field name → equal-length list.
 
-        if isinstance(raw, bytes):
-            raw = raw.decode()
-        data = json.loads(raw)
+        open-meteo already answers column-wise, so this keeps that shape for
+        ``upsert_weather`` instead of building one dict per hour.  Keys are
+        the ``weather_hourly`` columns, in table order.
+        """
+        # orjson parses bytes directly – no intermediate str decode
+        data = orjson.loads(raw)
 
         hourly = data.get("hourly", {})
         times = hourly.get("time", [])
-        temps = hourly.get("temperature_2m", [])
-        winds = hourly.get("wind_speed_10m", [])
-        radiations = hourly.get("shortwave_radiation", [])
-        clouds = hourly.get("cloud_cover", [])
-        precip = hourly.get("precipitation", [])
-
-        records: list[dict] = []
-        for i, t_str in enumerate(times):
-            ts_utc = datetime.fromisoformat(t_str).replace(tzinfo=timezone.utc)
-            records.append(
-                {
-                    "time": ts_utc,
-                    "latitude": self.latitude,
-                    "longitude": self.longitude,
-                    "temperature_2m": _safe_float(temps, i),
-                    "wind_speed_10m": _safe_float(winds, i),
-                    "shortwave_radiation": _safe_float(radiations, i),
-                    "cloud_cover": _safe_float(clouds, i),
-                    "precipitation_mm": _safe_float(precip, i),
-                }
-            )
-
-        return records
 
+        # Column-wise conversion: one vectorized parse for all timestamps and
+        # one numeric coercion per variable instead of per-cell try/except.
+        n = len(times)
+        ts_utc = list(pd.to_datetime(times, format="ISO8601", utc=True).to_pydatetime())
+        temps, winds, radiations, clouds, precip = (
+            _float_column(hourly.get(var, []), n) for var in _RESPONSE_VARS
+        )
+        return {
+            "time": ts_utc,
+            "latitude": [self.latitude] * n,
+            "longitude": [self.longitude] * n,
+            "temperature_2m": temps,
+            "wind_speed_10m": winds,
+            "shortwave_radiation": radiations,
+            "cloud_cover": clouds,
+            "precipitation_mm": precip,
+        }
+
+    def run_columns(self) -> dict[str, list]:
+        """
+        Like ``run()``, but returns ``parse_columns`` output.
+
+        No per-record validation is needed: every timestamp comes from
+        ``pd.to_datetime(..., utc=True)`` and is therefore UTC-aware.
+        """
+        return self.parse_columns(self.fetch())
+
+
+def _float_column(values: list | None, n: int) -> list[float | None]:
+    """
+    Coerce the first *n* entries of *values* to floats.
 
-def _safe_float(lst: list, idx: int) -> float | None:
-    try:
-        v = lst[idx]
-        return float(v) if v is not None else None
-    except (IndexError, TypeError, ValueError):
-        return None
+    Missing (short list), null and non-numeric entries become None; so does
+    every hour when the whole variable is null.
+    """
+    col = pd.to_numeric(pd.Series((values or [])[:n], dtype=object), errors="coerce")
+    col = col.reindex(range(n)).astype(float)
+    return col.astype(object).where(col.notna(), None).tolist()
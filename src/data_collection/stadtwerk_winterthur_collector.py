@@ -26,9 +26,7 @@ import os
 from datetime import datetime, timezone
 from pathlib import Path
 
-import httpx
-
-from .base_collector import BaseCollector
+from .base_collector import BaseCollector, _get_client
 
 _LOG = logging.getLogger(__name__)
 
@@ -72,9 +70,9 @@ _NETZEINSPEISUNG_URL = (
 
 
 def _stream_csv_text(url: str, timeout: int = 120) -> str:
-    """Download *url* with httpx streaming and return the decoded text."""
+    """Download *url* with httpx streaming (shared client) and return the decoded text."""
     chunks: list[str] = []
-    with httpx.stream("GET", url, timeout=timeout, follow_redirects=True) as resp:
+    with _get_client().stream("GET", url, timeout=timeout, follow_redirects=True) as resp:
         resp.raise_for_status()
         for chunk in resp.iter_text():
             chunks.append(chunk)
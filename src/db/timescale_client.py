@@ -3,18 +3,48 @@ TimescaleDB connection pool and upsert helpers.
 
 Environment variables (or .env):
   BDSP_DB_HOST, BDSP_DB_PORT, BDSP_DB_NAME, BDSP_DB_USER, BDSP_DB_PASSWORD
+
+Upserts are sent in bulk: batches below ``_COPY_THRESHOLD`` rows go out as
+multi-row ``INSERT ... VALUES`` pages of ``_PAGE_SIZE`` rows
+(``execute_values``); larger batches (historical backfills) are streamed via
+``COPY`` into a temporary staging table and merged with
+``INSERT ... SELECT ... ON CONFLICT DO NOTHING``.
+
+Every ``upsert_*`` helper takes ``method``: ``"auto"`` (default) picks by
+batch size as above, ``"values"`` / ``"copy"`` force one path (e.g. backfill
+scripts that know their batches are large).
+
+They also take an optional ``conn``: pass the connection from ``get_conn()``
+to write several tables in one transaction (one pool checkout and one commit
+instead of one per table); without it each call commits on its own.
 """
 
+import csv
+import io
 import os
+import threading
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import contextmanager
+from operator import itemgetter
 from typing import Generator
 
 import psycopg2
 from psycopg2 import pool
+from psycopg2.extras import execute_values
 
 # ─── Connection Pool ──────────────────────────────────────────────────────────
 
 _pool: pool.ThreadedConnectionPool | None = None
+_POOL_LOCK = threading.Lock()
+
+# Rows per multi-VALUES statement; batches at or above _COPY_THRESHOLD use COPY.
+_PAGE_SIZE = 5_000
+_COPY_THRESHOLD = 10_000
+_UPSERT_METHODS = ("auto", "values", "copy")
+
+# Upsert input: a list of record dicts, or column-oriented data – a mapping of
+# column name → equal-length value list (e.g. OpenMeteoCollector.parse_columns).
+Records = list[dict] | Mapping[str, Sequence]
 
 
 def _get_dsn() -> str:
@@ -28,16 +58,29 @@ def _get_dsn() -> str:
 
 
 def get_pool() -> pool.ThreadedConnectionPool:
+    """
+    Return the shared connection pool, creating it on first use.
+
+    Double-checked: the common already-open case skips the lock; the lock
+    only serialises creation so concurrent first callers share one pool.
+    """
     global _pool
-    if _pool is None or _pool.closed:
-        _pool = pool.ThreadedConnectionPool(minconn=1, maxconn=10, dsn=_get_dsn())
-    return _pool
+    p = _pool
+    if p is None or p.closed:
+        with _POOL_LOCK:
+            p = _pool
+            if p is None or p.closed:
+                p = _pool = pool.ThreadedConnectionPool(minconn=1, maxconn=10, dsn=_get_dsn())
+    return p
 
 
 @contextmanager
 def get_conn() -> Generator[psycopg2.extensions.connection, None, None]:
     """Context manager: yields a connection, auto-commits or rolls back."""
-    conn = get_pool().getconn()
+    # Return the connection to the pool it came from, even if get_pool()
+    # would hand out a different one by the time the block exits.
+    p = get_pool()
+    conn = p.getconn()
     try:
         yield conn
         conn.commit()
@@ -45,196 +88,331 @@ def get_conn() -> Generator[psycopg2.extensions.connection, None, None]:
         conn.rollback()
         raise
     finally:
-        get_pool().putconn(conn)
+        p.putconn(conn)
 
 
 # ─── Upsert Helpers ───────────────────────────────────────────────────────────
 
-def upsert_entsoe(records: list[dict]) -> int:
-    """
+def _make_upsert(
+    name: str,
+    table: str,
+    cols: tuple[str, ...],
+    conflict_cols: tuple[str, ...],
+    doc: str,
+) -> Callable[..., int]:
+    """
+    Build an ``upsert_*`` helper for *table* with its SQL and row getter bound.
+
+    The INSERT statement and the ``itemgetter`` over *cols* are created once
+    here at import time, so a call only has to turn its records into tuples.
+    """
+    sql = _values_sql(table, cols, conflict_cols)
+    getter = itemgetter(*cols)
+
+    def upsert(
+        records: Records,
+        method: str = "auto",
+        conn: psycopg2.extensions.connection | None = None,
+    ) -> int:
+        return _upsert(
+            table, cols, conflict_cols, records, method, conn,
+            sql=sql, getter=getter,
+        )
+
+    upsert.__name__ = upsert.__qualname__ = name
+    upsert.__doc__ = doc
+    return upsert
+
+
+def _values_sql(table: str, cols: tuple[str, ...], conflict_cols: tuple[str, ...]) -> str:
+    """``INSERT ... VALUES %s ON CONFLICT DO NOTHING RETURNING 1`` for execute_values."""
+    # cur.rowcount only reflects the last page; RETURNING 1 (one row per
+    # actual insert) keeps the count exact across pages.
+    return (
+        f"INSERT INTO {table} ({', '.join(cols)}) VALUES %s "  # noqa: S608
+        f"ON CONFLICT ({', '.join(conflict_cols)}) DO NOTHING "
+        f"RETURNING 1"
+    )
+
+
+upsert_entsoe = _make_upsert(
+    "upsert_entsoe",
+    "entsoe_day_ahead_prices",
+    ("time", "domain", "price_eur_mwh", "currency"),
+    conflict_cols=("time", "domain"),
+    doc="""
     Insert ENTSO-E day-ahead price records.
 
     Expected keys: time (UTC-aware datetime), domain, price_eur_mwh, currency
     Returns: number of rows inserted (duplicates silently skipped).
-    """
-    sql = """
-        INSERT INTO entsoe_day_ahead_prices (time, domain, price_eur_mwh, currency)
-        VALUES (%(time)s, %(domain)s, %(price_eur_mwh)s, %(currency)s)
-        ON CONFLICT (time, domain) DO NOTHING
-    """
-    return _bulk_execute(sql, records)
-
-
-def upsert_weather(records: list[dict]) -> int:
-    """
+    """,
+)
+
+upsert_weather = _make_upsert(
+    "upsert_weather",
+    "weather_hourly",
+    ("time", "latitude", "longitude", "temperature_2m", "wind_speed_10m",
+     "shortwave_radiation", "cloud_cover", "precipitation_mm"),
+    conflict_cols=("time", "latitude", "longitude"),
+    doc="""
     Insert open-meteo weather records.
 
     Expected keys: time, latitude, longitude, temperature_2m, wind_speed_10m,
                    shortwave_radiation, cloud_cover, precipitation_mm
-    """
-    sql = """
-        INSERT INTO weather_hourly
-            (time, latitude, longitude, temperature_2m, wind_speed_10m,
-             shortwave_radiation, cloud_cover, precipitation_mm)
-        VALUES
-            (%(time)s, %(latitude)s, %(longitude)s, %(temperature_2m)s,
-             %(wind_speed_10m)s, %(shortwave_radiation)s, %(cloud_cover)s,
-             %(precipitation_mm)s)
-        ON CONFLICT (time, latitude, longitude) DO NOTHING
-    """
-    return _bulk_execute(sql, records)
-
 
-def upsert_ekz(records: list[dict]) -> int:
-    """
+    Accepts record dicts or the column mapping from
+    ``OpenMeteoCollector.parse_columns`` (no per-row dicts are built).
+    """,
+)
+
+upsert_ekz = _make_upsert(
+    "upsert_ekz",
+    "ekz_tariffs_raw",
+    ("time", "tariff_type", "price_chf_kwh"),
+    conflict_cols=("time", "tariff_type"),
+    doc="""
     Insert EKZ tariff records (15-min raw).
 
     Expected keys: time, tariff_type, price_chf_kwh
-    """
-    sql = """
-        INSERT INTO ekz_tariffs_raw (time, tariff_type, price_chf_kwh)
-        VALUES (%(time)s, %(tariff_type)s, %(price_chf_kwh)s)
-        ON CONFLICT (time, tariff_type) DO NOTHING
-    """
-    return _bulk_execute(sql, records)
-
-
-def upsert_bafu(records: list[dict]) -> int:
-    """
+    """,
+)
+
+upsert_bafu = _make_upsert(
+    "upsert_bafu",
+    "bafu_hydro",
+    ("time", "station_id", "discharge_m3s", "level_masl"),
+    conflict_cols=("time", "station_id"),
+    doc="""
     Insert BAFU hydro records.
 
     Expected keys: time, station_id, discharge_m3s, level_masl
-    """
-    sql = """
-        INSERT INTO bafu_hydro (time, station_id, discharge_m3s, level_masl)
-        VALUES (%(time)s, %(station_id)s, %(discharge_m3s)s, %(level_masl)s)
-        ON CONFLICT (time, station_id) DO NOTHING
-    """
-    return _bulk_execute(sql, records)
-
-
-def upsert_ckw(records: list[dict]) -> int:
-    """
+    """,
+)
+
+upsert_ckw = _make_upsert(
+    "upsert_ckw",
+    "ckw_tariffs_raw",
+    ("time", "tariff_type", "price_chf_kwh"),
+    conflict_cols=("time", "tariff_type"),
+    doc="""
     Insert CKW tariff records (15-min raw).
 
     Expected keys: time, tariff_type, price_chf_kwh
-    """
-    sql = """
-        INSERT INTO ckw_tariffs_raw (time, tariff_type, price_chf_kwh)
-        VALUES (%(time)s, %(tariff_type)s, %(price_chf_kwh)s)
-        ON CONFLICT (time, tariff_type) DO NOTHING
-    """
-    return _bulk_execute(sql, records)
-
-
-def upsert_groupe_e(records: list[dict]) -> int:
-    """
+    """,
+)
+
+upsert_groupe_e = _make_upsert(
+    "upsert_groupe_e",
+    "groupe_e_tariffs_raw",
+    ("time", "tariff_type", "price_chf_kwh"),
+    conflict_cols=("time", "tariff_type"),
+    doc="""
     Insert Groupe E tariff records (15-min raw).
 
     Expected keys: time, tariff_type, price_chf_kwh
-    """
-    sql = """
-        INSERT INTO groupe_e_tariffs_raw (time, tariff_type, price_chf_kwh)
-        VALUES (%(time)s, %(tariff_type)s, %(price_chf_kwh)s)
-        ON CONFLICT (time, tariff_type) DO NOTHING
-    """
-    return _bulk_execute(sql, records)
-
-
-def upsert_entsoe_actual_load(records: list[dict]) -> int:
-    """
+    """,
+)
+
+upsert_entsoe_actual_load = _make_upsert(
+    "upsert_entsoe_actual_load",
+    "entsoe_actual_load",
+    ("time", "domain", "load_mwh"),
+    conflict_cols=("time", "domain"),
+    doc="""
     Insert ENTSO-E Actual Total Load records (A65).
 
     Expected keys: time (UTC-aware datetime), domain, load_mwh
     Returns: number of rows inserted (duplicates silently skipped).
-    """
-    sql = """
-        INSERT INTO entsoe_actual_load (time, domain, load_mwh)
-        VALUES (%(time)s, %(domain)s, %(load_mwh)s)
-        ON CONFLICT (time, domain) DO NOTHING
-    """
-    return _bulk_execute(sql, records)
-
-
-def upsert_entsoe_generation(records: list[dict]) -> int:
-    """
+    """,
+)
+
+upsert_entsoe_generation = _make_upsert(
+    "upsert_entsoe_generation",
+    "entsoe_generation",
+    ("time", "domain", "psr_type", "quantity_mwh"),
+    conflict_cols=("time", "domain", "psr_type"),
+    doc="""
     Insert ENTSO-E generation per type records (A75).
 
     Expected keys: time (UTC-aware datetime), domain, psr_type, quantity_mwh
     Returns: number of rows inserted (duplicates silently skipped).
-    """
-    sql = """
-        INSERT INTO entsoe_generation (time, domain, psr_type, quantity_mwh)
-        VALUES (%(time)s, %(domain)s, %(psr_type)s, %(quantity_mwh)s)
-        ON CONFLICT (time, domain, psr_type) DO NOTHING
-    """
-    return _bulk_execute(sql, records)
-
-
-def upsert_entsoe_crossborder_flows(records: list[dict]) -> int:
-    """
+    """,
+)
+
+upsert_entsoe_crossborder_flows = _make_upsert(
+    "upsert_entsoe_crossborder_flows",
+    "entsoe_crossborder_flows",
+    ("time", "in_domain", "out_domain", "flow_mwh"),
+    conflict_cols=("time", "in_domain", "out_domain"),
+    doc="""
     Insert ENTSO-E cross-border physical flow records (A11).
 
     Expected keys: time (UTC-aware datetime), in_domain, out_domain, flow_mwh
     Returns: number of rows inserted (duplicates silently skipped).
-    """
-    sql = """
-        INSERT INTO entsoe_crossborder_flows (time, in_domain, out_domain, flow_mwh)
-        VALUES (%(time)s, %(in_domain)s, %(out_domain)s, %(flow_mwh)s)
-        ON CONFLICT (time, in_domain, out_domain) DO NOTHING
-    """
-    return _bulk_execute(sql, records)
-
-
-def upsert_entsoe_load_forecast(records: list[dict]) -> int:
-    """
+    """,
+)
+
+upsert_entsoe_load_forecast = _make_upsert(
+    "upsert_entsoe_load_forecast",
+    "entsoe_load_forecast",
+    ("time", "domain", "load_mwh"),
+    conflict_cols=("time", "domain"),
+    doc="""
     Insert ENTSO-E day-ahead load forecast records (A65/A01).
 
     Expected keys: time (UTC-aware datetime), domain, load_mwh
     Returns: number of rows inserted (duplicates silently skipped).
-    """
-    sql = """
-        INSERT INTO entsoe_load_forecast (time, domain, load_mwh)
-        VALUES (%(time)s, %(domain)s, %(load_mwh)s)
-        ON CONFLICT (time, domain) DO NOTHING
-    """
-    return _bulk_execute(sql, records)
-
-
-def upsert_winterthur_load(records: list[dict]) -> int:
-    """
+    """,
+)
+
+upsert_winterthur_load = _make_upsert(
+    "upsert_winterthur_load",
+    "winterthur_load",
+    ("time", "load_kwh"),
+    conflict_cols=("time",),
+    doc="""
     Insert Winterthur grid load records (OGD Bruttolastgang).
 
     Expected keys: time (UTC-aware datetime), load_kwh
-    """
-    sql = """
-        INSERT INTO winterthur_load (time, load_kwh)
-        VALUES (%(time)s, %(load_kwh)s)
-        ON CONFLICT (time) DO NOTHING
-    """
-    return _bulk_execute(sql, records)
-
-
-def upsert_winterthur_pv(records: list[dict]) -> int:
-    """
+    """,
+)
+
+upsert_winterthur_pv = _make_upsert(
+    "upsert_winterthur_pv",
+    "winterthur_pv",
+    ("time", "pv_kwh"),
+    conflict_cols=("time",),
+    doc="""
     Insert Winterthur PV feed-in records (OGD Netzeinspeisung).
 
     Expected keys: time (UTC-aware datetime), pv_kwh
-    """
-    sql = """
-        INSERT INTO winterthur_pv (time, pv_kwh)
-        VALUES (%(time)s, %(pv_kwh)s)
-        ON CONFLICT (time) DO NOTHING
-    """
-    return _bulk_execute(sql, records)
-
+    """,
+)
 
 # ─── Internal ─────────────────────────────────────────────────────────────────
 
-def _bulk_execute(sql: str, records: list[dict]) -> int:
-    if not records:
+def _row_count(rows: Records, cols: tuple[str, ...]) -> int:
+    return len(rows[cols[0]]) if isinstance(rows, Mapping) else len(rows)
+
+
+def _row_tuples(
+    rows: Records,
+    cols: tuple[str, ...],
+    getter: Callable[[dict], tuple] | None = None,
+) -> Iterable[tuple]:
+    """Value tuples in *cols* order, from record dicts or a column mapping."""
+    if isinstance(rows, Mapping):
+        return zip(*(rows[c] for c in cols))
+    return map(getter or itemgetter(*cols), rows)
+
+
+def _upsert(
+    table: str,
+    cols: tuple[str, ...],
+    conflict_cols: tuple[str, ...],
+    records: Records,
+    method: str = "auto",
+    conn: psycopg2.extensions.connection | None = None,
+    *,
+    sql: str | None = None,
+    getter: Callable[[dict], tuple] | None = None,
+) -> int:
+    """
+    Run ``_bulk_upsert`` for *records* on *conn*, or in its own pooled
+    transaction when no connection is given.
+    """
+    if not _row_count(records, cols):
         return 0
+    if conn is not None:
+        return _bulk_upsert(conn, table, cols, records, conflict_cols, method,
+                            sql=sql, getter=getter)
     with get_conn() as conn:
-        with conn.cursor() as cur:
-            cur.executemany(sql, records)
-            return cur.rowcount
+        return _bulk_upsert(conn, table, cols, records, conflict_cols, method,
+                            sql=sql, getter=getter)
+
+
+def _bulk_upsert(
+    conn: psycopg2.extensions.connection,
+    table: str,
+    cols: tuple[str, ...],
+    rows: Records,
+    conflict_cols: tuple[str, ...],
+    method: str = "auto",
+    *,
+    sql: str | None = None,
+    getter: Callable[[dict], tuple] | None = None,
+) -> int:
+    """
+    Insert *rows* into *table* on *conn*, skipping rows that violate *conflict_cols*.
+
+    The caller owns the transaction.  Table and column names come from the
+    hard-coded upsert helpers above, never from user input, so interpolating
+    them into the SQL is safe.
+
+    Args:
+        rows:   Record dicts, or a mapping of column name → equal-length
+                value lists (see ``Records``).
+        method: ``"auto"`` uses COPY from ``_COPY_THRESHOLD`` rows on and
+                ``execute_values`` below it; ``"copy"`` / ``"values"`` force
+                one path.
+        sql:    Prebuilt ``_values_sql`` statement (from ``_make_upsert``);
+                built here when omitted.
+        getter: Prebuilt ``itemgetter(*cols)`` for record dicts.
+
+    Returns: number of rows actually inserted.
+    """
+    if method not in _UPSERT_METHODS:
+        raise ValueError(f"method must be one of {_UPSERT_METHODS}, got {method!r}")
+    n_rows = _row_count(rows, cols)
+    if not n_rows:
+        return 0
+    # Positional tuples bind with the default "(%s, ...)" template instead
+    # of a per-row dict lookup for every named placeholder.
+    values = _row_tuples(rows, cols, getter)
+    with conn.cursor() as cur:
+        if method == "copy" or (method == "auto" and n_rows >= _COPY_THRESHOLD):
+            return _copy_upsert(cur, table, cols, conflict_cols, values)
+        inserted = execute_values(
+            cur, sql or _values_sql(table, cols, conflict_cols), values,
+            page_size=_PAGE_SIZE, fetch=True,
+        )
+        return len(inserted)
+
+
+def _copy_upsert(
+    cur,
+    table: str,
+    cols: tuple[str, ...],
+    conflict_cols: tuple[str, ...],
+    values: Iterable[tuple],
+) -> int:
+    """
+    Bulk-load the row tuples *values* via COPY into a temp staging table, then merge.
+
+    COPY cannot express ON CONFLICT, so rows land in ``_stage_<table>`` first
+    and are moved over with a single ``INSERT ... SELECT ... ON CONFLICT DO
+    NOTHING``.  The stage table is dropped straight after the merge so several
+    COPY upserts into the same table can share one caller-owned transaction
+    (a failed merge rolls the CREATE back with everything else).
+    """
+    stage = f"_stage_{table}"
+    col_list = ", ".join(cols)
+
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    # csv writes None as an empty unquoted field, which COPY CSV reads as NULL
+    writer.writerows(values)
+    buf.seek(0)
+
+    cur.execute(
+        f"CREATE TEMP TABLE {stage} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+    )
+    cur.copy_expert(f"COPY {stage} ({col_list}) FROM STDIN WITH (FORMAT CSV)", buf)
+    cur.execute(
+        f"INSERT INTO {table} ({col_list}) "  # noqa: S608
+        f"SELECT {col_list} FROM {stage} "
+        f"ON CONFLICT ({', '.join(conflict_cols)}) DO NOTHING"
+    )
+    inserted = cur.rowcount
+    cur.execute(f"DROP TABLE {stage}")
+    return inserted
@@ -5,11 +5,46 @@ Each function accepts a list of date strings (YYYY-MM-DD) and an optional
 sleep interval between iterations (useful for backfilling to avoid rate limits).
 """
 
+import os
 import time
 from datetime import datetime, timedelta
 
 import httpx
 import pendulum
+import psycopg2
+
+from data_collection.bafu_collector import BafuCollector
+from data_collection.base_collector import run_concurrently
+from data_collection.ckw_collector import CKWCollector
+from data_collection.ekz_collector import EkzCollector
+from data_collection.entsoe_collector import (
+    EntsoeActualLoadCollector,
+    EntsoeCollector,
+    EntsoeCrossBorderFlowCollector,
+    EntsoeGenerationCollector,
+    EntsoeLoadForecastCollector,
+)
+from data_collection.groupe_e_collector import GroupeECollector
+from data_collection.openmeteo_collector import OpenMeteoCollector
+from data_collection.stadtwerk_winterthur_collector import (
+    BruttolastgangCollector,
+    NetzEinspeisungCollector,
+)
+from db.timescale_client import (
+    get_conn,
+    upsert_bafu,
+    upsert_ckw,
+    upsert_ekz,
+    upsert_entsoe,
+    upsert_entsoe_actual_load,
+    upsert_entsoe_crossborder_flows,
+    upsert_entsoe_generation,
+    upsert_entsoe_load_forecast,
+    upsert_groupe_e,
+    upsert_weather,
+    upsert_winterthur_load,
+    upsert_winterthur_pv,
+)
 
 _TABLES = [
     "entsoe_day_ahead_prices",
@@ -36,9 +71,6 @@ def _entsoe_skip_404(date_str: str, exc: Exception) -> bool:
 
 
 def fetch_entsoe(dates: list[str], sleep_s: float = 0) -> None:
-    from data_collection.entsoe_collector import EntsoeCollector
-    from db.timescale_client import upsert_entsoe
-
     for date_str in dates:
         period_start = datetime.fromisoformat(date_str).replace(tzinfo=pendulum.UTC)
         period_end = period_start + timedelta(days=1)
@@ -55,9 +87,6 @@ def fetch_entsoe(dates: list[str], sleep_s: float = 0) -> None:
 
 
 def fetch_entsoe_actual_load(dates: list[str], sleep_s: float = 0) -> None:
-    from data_collection.entsoe_collector import EntsoeActualLoadCollector
-    from db.timescale_client import upsert_entsoe_actual_load
-
     for date_str in dates:
         period_start = datetime.fromisoformat(date_str).replace(tzinfo=pendulum.UTC)
         period_end = period_start + timedelta(days=1)
@@ -74,8 +103,6 @@ def fetch_entsoe_actual_load(dates: list[str], sleep_s: float = 0) -> None:
 
 
 def fetch_entsoe_generation(dates: list[str], domain: str, psr_type: str, sleep_s: float = 0) -> None:
-    from data_collection.entsoe_collector import EntsoeGenerationCollector
-    from db.timescale_client import upsert_entsoe_generation
     for date_str in dates:
         period_start = datetime.fromisoformat(date_str).replace(tzinfo=pendulum.UTC)
         period_end = period_start + timedelta(days=1)
@@ -92,8 +119,6 @@ def fetch_entsoe_generation(dates: list[str], domain: str, psr_type: str, sleep_
 
 
 def fetch_entsoe_crossborder(dates: list[str], in_domain: str, out_domain: str, sleep_s: float = 0) -> None:
-    from data_collection.entsoe_collector import EntsoeCrossBorderFlowCollector
-    from db.timescale_client import upsert_entsoe_crossborder_flows
     for date_str in dates:
         period_start = datetime.fromisoformat(date_str).replace(tzinfo=pendulum.UTC)
         period_end = period_start + timedelta(days=1)
@@ -110,8 +135,6 @@ def fetch_entsoe_crossborder(dates: list[str], in_domain: str, out_domain: str,
 
 
 def fetch_entsoe_load_forecast(dates: list[str], sleep_s: float = 0) -> None:
-    from data_collection.entsoe_collector import EntsoeLoadForecastCollector
-    from db.timescale_client import upsert_entsoe_load_forecast
     for date_str in dates:
         period_start = datetime.fromisoformat(date_str).replace(tzinfo=pendulum.UTC)
         period_end = period_start + timedelta(days=1)
@@ -136,27 +159,21 @@ _WEATHER_LOCATIONS = [
 
 
 def fetch_weather(dates: list[str], sleep_s: float = 0) -> None:
-    from data_collection.openmeteo_collector import OpenMeteoCollector
-    from db.timescale_client import upsert_weather
-
     for date_str in dates:
         total_inserted = 0
         for loc in _WEATHER_LOCATIONS:
-            records = OpenMeteoCollector(
+            columns = OpenMeteoCollector(
                 latitude=loc["latitude"],
                 longitude=loc["longitude"],
                 date=date_str,
-            ).run()
-            total_inserted += upsert_weather(records)
+            ).run_columns()
+            total_inserted += upsert_weather(columns)
         print(f"Weather {date_str}: {total_inserted} inserted ({len(_WEATHER_LOCATIONS)} locations).")
         if sleep_s:
             time.sleep(sleep_s)
 
 
 def fetch_ekz(dates: list[str], sleep_s: float = 0) -> None:
-    from data_collection.ekz_collector import EkzCollector
-    from db.timescale_client import upsert_ekz
-
     for date_str in dates:
         records = EkzCollector(date=date_str).run()
         inserted = upsert_ekz(records)
@@ -166,9 +183,6 @@ def fetch_ekz(dates: list[str], sleep_s: float = 0) -> None:
 
 
 def fetch_ckw(dates: list[str], sleep_s: float = 0) -> None:
-    from data_collection.ckw_collector import CKWCollector
-    from db.timescale_client import upsert_ckw
-
     for date_str in dates:
         records = CKWCollector(date=date_str).run()
         inserted = upsert_ckw(records)
@@ -178,9 +192,6 @@ def fetch_ckw(dates: list[str], sleep_s: float = 0) -> None:
 
 
 def fetch_groupe_e(dates: list[str], sleep_s: float = 0) -> None:
-    from data_collection.groupe_e_collector import GroupeECollector
-    from db.timescale_client import upsert_groupe_e
-
     for date_str in dates:
         records = GroupeECollector(date=date_str).run()
         inserted = upsert_groupe_e(records)
@@ -190,9 +201,6 @@ def fetch_groupe_e(dates: list[str], sleep_s: float = 0) -> None:
 
 
 def fetch_bafu(dates: list[str], sleep_s: float = 0) -> None:
-    from data_collection.bafu_collector import BafuCollector
-    from db.timescale_client import upsert_bafu
-
     for date_str in dates:
         records = BafuCollector(date=date_str).run()
         inserted = upsert_bafu(records)
@@ -201,19 +209,60 @@ def fetch_bafu(dates: list[str], sleep_s: float = 0) -> None:
             time.sleep(sleep_s)
 
 
-def fetch_winterthur_load(all_files: bool = False) -> None:
-    from data_collection.stadtwerk_winterthur_collector import BruttolastgangCollector
-    from db.timescale_client import upsert_winterthur_load
+def fetch_daily_core(date_str: str, delivery_date_str: str) -> None:
+    """
+    Fetch ENTSO-E prices, weather, EKZ and BAFU for one day in a single task.
+
+    The four sources are independent and network-bound, so each collector
+    runs in its own worker thread via ``run_concurrently``; wall-clock time is the
+    slowest source instead of the sum.  Upserts run sequentially afterwards,
+    all in one transaction on one pooled connection.
+
+    If a source fails to fetch, the others are still written and the first
+    error is re-raised so Airflow retries the task (upserts are idempotent).
+    A failed upsert rolls back the whole day's batch; the retry rewrites it.
+
+    Args:
+        date_str:          Logical date (weather, EKZ, BAFU).
+        delivery_date_str: ENTSO-E delivery day (data_interval_end).
+    """
+    period_start = datetime.fromisoformat(delivery_date_str).replace(tzinfo=pendulum.UTC)
+    jobs = [
+        ("ENTSO-E", EntsoeCollector(period_start=period_start, period_end=period_start + timedelta(days=1)), upsert_entsoe),
+        *[
+            (f"Weather {loc['label']}", OpenMeteoCollector(latitude=loc["latitude"], longitude=loc["longitude"], date=date_str), upsert_weather)
+            for loc in _WEATHER_LOCATIONS
+        ],
+        ("EKZ", EkzCollector(date=date_str), upsert_ekz),
+        ("BAFU", BafuCollector(date=date_str), upsert_bafu),
+    ]
+
+    results = run_concurrently(collector for _, collector, _ in jobs)
+
+    first_exc: BaseException | None = None
+    # All sources share one connection and commit once at the end of the block.
+    with get_conn() as conn:
+        for (label, _, upsert), result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                if label == "ENTSO-E" and _entsoe_skip_404(delivery_date_str, result):
+                    continue
+                print(f"{label} {date_str}: fetch failed – {result!r}")
+                first_exc = first_exc or result
+                continue
+            inserted = upsert(result, conn=conn)
+            print(f"{label} {date_str}: {len(result)} fetched, {inserted} inserted.")
+
+    if first_exc is not None:
+        raise first_exc
+
 
+def fetch_winterthur_load(all_files: bool = False) -> None:
     records = BruttolastgangCollector(all_files=all_files).run()
     inserted = upsert_winterthur_load(records)
     print(f"Winterthur Load: {len(records)} fetched, {inserted} inserted.")
 
 
 def fetch_winterthur_pv() -> None:
-    from data_collection.stadtwerk_winterthur_collector import NetzEinspeisungCollector
-    from db.timescale_client import upsert_winterthur_pv
-
     records = NetzEinspeisungCollector().run()
     inserted = upsert_winterthur_pv(records)
     print(f"Winterthur PV: {len(records)} fetched, {inserted} inserted.")
@@ -221,9 +270,6 @@ def fetch_winterthur_pv() -> None:
 
 def log_row_counts(date_str: str | None = None) -> None:
     """Print row counts for all tables. If date_str is given, filter by that date."""
-    import os
-    import psycopg2
-
     try:
         conn = psycopg2.connect(
             host=os.getenv("BDSP_DB_HOST", "timescaledb"),
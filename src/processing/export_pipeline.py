@@ -1,9 +1,13 @@
 """
 Feature export pipeline for BigDataSmallPrice – Phase 2.
 
-Reads the `training_features` view from TimescaleDB, validates for data
+Reads the `training_features` materialized view from TimescaleDB, validates for data
 leakage, performs a chronological train/test split, and saves parquet files.
 
+``run_export`` streams the view through a server-side cursor in batches of
+``EXPORT_BATCH_ROWS`` and appends each batch to per-split ``ParquetWriter``s,
+so peak memory is bounded by one batch rather than the whole history.
+
 Usage (standalone):
     python src/processing/export_pipeline.py
 
@@ -14,12 +18,16 @@ Usage (from Airflow):
 
 from __future__ import annotations
 
+import io
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 if TYPE_CHECKING:
     pass
@@ -89,8 +97,12 @@ def query_features(conn) -> pd.DataFrame:
     Returns:
         DataFrame with all feature and target columns, sorted by time ascending.
     """
-    sql = "SELECT * FROM training_features ORDER BY time"
-    return pd.read_sql(sql, conn, parse_dates=["time"])
+    return _query_frame(conn, "SELECT * FROM training_features ORDER BY time")
+
+
+# api_call_log is operational metadata; none of its columns may be a feature.
+_API_CALL_LOG_COLS = frozenset({"id", "source", "called_at", "status_code",
+                                "was_rate_limited", "response_ms", "date_fetched"})
 
 
 def validate_no_leakage(
@@ -99,8 +111,13 @@ def validate_no_leakage(
 ) -> None:
     """
     Raise ValueError if the target column appears in the feature column list,
+    if a feature is named after the target (e.g. ``price_eur_mwh_lag_1h``),
     or if any api_call_log column appears in features (isolation guard).
 
+    Vetted target lags are named ``lag_*`` / ``load_lag_*`` in the views; a
+    ``<target>_*`` column is a derived copy of the target that has not been
+    through that review, so it is rejected as well.
+
     ISOLATION GUARANTEE: api_call_log is operational metadata only.
     It MUST NEVER appear in training_features, winterthur_net_load_features,
     FEATURE_COLS, or LOAD_FEATURE_COLS.
@@ -109,16 +126,21 @@ def validate_no_leakage(
         feature_cols: List of column names used as model inputs.
         target_col:   Name of the prediction target.
     """
-    if target_col in feature_cols:
+    features = frozenset(feature_cols)
+    if target_col in features:
         raise ValueError(
             f"Data leakage detected: target column '{target_col}' is present "
             "in feature_cols. Remove it before training."
         )
+    derived = sorted(c for c in features if c.startswith(f"{target_col}_"))
+    if derived:
+        raise ValueError(
+            f"Data leakage detected: feature column(s) {derived} are derived "
+            f"from target column '{target_col}'. Remove them before training."
+        )
     # Guard: api_call_log columns must never appear in feature lists
-    _API_CALL_LOG_COLS = {"id", "source", "called_at", "status_code",
-                          "was_rate_limited", "response_ms", "date_fetched"}
-    leaked = _API_CALL_LOG_COLS & set(feature_cols)
-    if leaked:
+    if not features.isdisjoint(_API_CALL_LOG_COLS):
+        leaked = set(_API_CALL_LOG_COLS & features)
         raise ValueError(
             f"Isolation violation: api_call_log column(s) {leaked} found in "
             "feature_cols. api_call_log is operational metadata and must never "
@@ -146,6 +168,7 @@ def split_chronological(
 
     Returns:
         (train_df, test_df) – non-overlapping DataFrames in temporal order.
+        Both are row slices of *df*, not copies; copy before mutating in place.
 
     Raises:
         ValueError: If test_ratio is not in (0, 1) or produces an empty split.
@@ -158,7 +181,7 @@ def split_chronological(
             f"test_ratio={test_ratio} produces an empty train or test set "
             f"for a dataset of {len(df)} rows."
         )
-    return df.iloc[:split_idx].copy(), df.iloc[split_idx:].copy()
+    return df.iloc[:split_idx], df.iloc[split_idx:]
 
 
 def split_chronological_three_way(
@@ -182,29 +205,37 @@ def split_chronological_three_way(
         test_ratio: Fraction of rows for the test set.
 
     Returns:
-        (train_df, val_df, test_df) – non-overlapping in temporal order.
+        (train_df, val_df, test_df) – non-overlapping in temporal order; row
+        slices of *df*, not copies.
 
     Raises:
         ValueError: If ratios are invalid or any split would be empty.
     """
-    train_ratio = 1.0 - val_ratio - test_ratio
-    if not (0 < train_ratio < 1) or not (0 < val_ratio < 1) or not (0 < test_ratio < 1):
-        raise ValueError(
-            f"Invalid ratios: val_ratio={val_ratio}, test_ratio={test_ratio}. "
-            "All three splits must be non-empty."
-        )
-    n = len(df)
-    train_end = int(n * train_ratio)
-    val_end = int(n * (train_ratio + val_ratio))
-    if train_end == 0 or val_end == train_end or val_end == n:
-        raise ValueError(
-            f"Ratios produce an empty split for a dataset of {n} rows."
-        )
-    return (
-        df.iloc[:train_end].copy(),
-        df.iloc[train_end:val_end].copy(),
-        df.iloc[val_end:].copy(),
-    )
+    train_end, val_end = _three_way_bounds(len(df), val_ratio, test_ratio)
+    return df.iloc[:train_end], df.iloc[train_end:val_end], df.iloc[val_end:]
+
+
+# Shared by every parquet file the exports write.  zstd beats snappy on the
+# many float columns of X_*; dictionary/RLE encoding shrinks the calendar
+# flags and the single-column y_* files.
+_PARQUET_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+    "data_page_size": 1 << 20,
+    "write_statistics": True,
+}
+
+
+def _write_parquet(frame: pd.DataFrame, path: Path) -> None:
+    """Write *frame* (without its index) to *path* with ``_PARQUET_OPTIONS``."""
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    if any(isinstance(dtype, pd.ArrowDtype) for dtype in frame.dtypes):
+        # Arrow-backed frames (``_query_frame``) would otherwise be read back
+        # as ArrowDtype, while train.py expects the default numpy dtypes a
+        # plain read_parquet gives.  numpy-backed frames keep their metadata.
+        table = table.replace_schema_metadata(None)
+    pq.write_table(table, path, row_group_size=EXPORT_ROW_GROUP_ROWS, **_PARQUET_OPTIONS)
 
 
 def save_parquet(
@@ -258,7 +289,7 @@ def save_parquet(
     for name, frame in splits.items():
         fname = f"{name}_{timestamp}.parquet" if versioned else f"{name}.parquet"
         p = out / fname
-        frame.to_parquet(p, index=False)
+        _write_parquet(frame, p)
         paths[name] = p
 
     return paths
@@ -267,6 +298,28 @@ def save_parquet(
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
 
+def _three_way_bounds(n: int, val_ratio: float, test_ratio: float) -> tuple[int, int]:
+    """
+    Return the (train_end, val_end) row indices for a chronological 3-way split.
+
+    Raises:
+        ValueError: If ratios are invalid or any split would be empty.
+    """
+    train_ratio = 1.0 - val_ratio - test_ratio
+    if not (0 < train_ratio < 1) or not (0 < val_ratio < 1) or not (0 < test_ratio < 1):
+        raise ValueError(
+            f"Invalid ratios: val_ratio={val_ratio}, test_ratio={test_ratio}. "
+            "All three splits must be non-empty."
+        )
+    train_end = int(n * train_ratio)
+    val_end = int(n * (train_ratio + val_ratio))
+    if train_end == 0 or val_end == train_end or val_end == n:
+        raise ValueError(
+            f"Ratios produce an empty split for a dataset of {n} rows."
+        )
+    return train_end, val_end
+
+
 def _check_data_freshness(df: pd.DataFrame, max_age_hours: int = 26) -> None:
     """
     Raise RuntimeError if the newest timestamp in df is older than max_age_hours.
@@ -280,7 +333,18 @@ def _check_data_freshness(df: pd.DataFrame, max_age_hours: int = 26) -> None:
     """
     if df.empty:
         return  # Empty DataFrame is handled separately by the caller
-    latest = df["time"].max()
+    _check_latest_freshness(df["time"].max(), max_age_hours)
+
+
+def _check_latest_freshness(latest, max_age_hours: int = 26) -> None:
+    """
+    Raise RuntimeError if the *latest* timestamp is older than max_age_hours.
+
+    Args:
+        latest:        UTC-aware datetime / Timestamp of the newest record.
+        max_age_hours: Maximum allowed age of the newest record in hours.
+    """
+    latest = pd.Timestamp(latest)
     age_hours = (pd.Timestamp.now(tz="UTC") - latest).total_seconds() / 3600
     if age_hours > max_age_hours:
         raise RuntimeError(
@@ -290,9 +354,221 @@ def _check_data_freshness(df: pd.DataFrame, max_age_hours: int = 26) -> None:
         )
 
 
+# ─── Streaming export ─────────────────────────────────────────────────────────
+
+EXPORT_BATCH_ROWS = 50_000
+# Batches are buffered per file and written as one contiguous row group of
+# this size – many tiny multi-chunk writes make parquet slow and bloated.
+EXPORT_ROW_GROUP_ROWS = 200_000
+
+# PostgreSQL type OID → Arrow type, so every batch shares one schema even when
+# a column happens to be all-NULL in the first batch.  Integers are widened to
+# int64 to match what pandas wrote before.
+_PG_ARROW_TYPES: dict[int, pa.DataType] = {
+    16:   pa.bool_(),                      # bool
+    20:   pa.int64(),                      # int8
+    21:   pa.int64(),                      # int2
+    23:   pa.int64(),                      # int4
+    700:  pa.float32(),                    # float4
+    701:  pa.float64(),                    # float8
+    1700: pa.float64(),                    # numeric (cast from decimal)
+    1114: pa.timestamp("us"),              # timestamp
+    1184: pa.timestamp("us", tz="UTC"),    # timestamptz
+    25:   pa.string(),                     # text
+    1043: pa.string(),                     # varchar
+}
+
+
+def _batch_to_table(rows: list[tuple], description) -> pa.Table:
+    """Transpose a ``fetchmany`` batch into an Arrow table typed from *description*."""
+    columns = list(zip(*rows)) or [()] * len(description)
+    arrays = []
+    for desc, values in zip(description, columns):
+        arrow_type = _PG_ARROW_TYPES.get(desc.type_code)
+        if desc.type_code == 1700:
+            arrays.append(pa.array(values).cast(arrow_type))
+        else:
+            arrays.append(pa.array(values, type=arrow_type))
+    return pa.Table.from_arrays(arrays, names=[d.name for d in description])
+
+
+# Export dtypes: prices and weather fit float32 comfortably; the calendar
+# columns are small non-NULL integers (computed from pf.time in the view).
+_INT8_COLS = frozenset({"hour_of_day", "day_of_week", "month"})
+_BOOL_COLS = frozenset({"is_weekend", "is_peak_hour"})
+
+
+def _compact_table(table: pa.Table) -> pa.Table:
+    """
+    Narrow a feature batch for export: calendar columns → int8 / bool,
+    every other float64 column → float32.
+
+    Decided by column name and type only, so every batch gets the same schema.
+    """
+    fields = []
+    for field in table.schema:
+        if field.name in _INT8_COLS:
+            field = field.with_type(pa.int8())
+        elif field.name in _BOOL_COLS:
+            field = field.with_type(pa.bool_())
+        elif pa.types.is_float64(field.type):
+            field = field.with_type(pa.float32())
+        fields.append(field)
+    return table.cast(pa.schema(fields))
+
+
+# How PostgreSQL's COPY ... (FORMAT csv) renders values: booleans as t / f,
+# NULL as an unquoted empty field (a quoted "" stays an empty string).
+_COPY_CSV_OPTIONS = {
+    "true_values": ["t"],
+    "false_values": ["f"],
+    "null_values": [""],
+    "strings_can_be_null": True,
+    "quoted_strings_can_be_null": False,
+}
+
+
+def _query_frame(conn, sql: str) -> pd.DataFrame:
+    """
+    Run *sql* on *conn* and return the result as a DataFrame.
+
+    The result set is streamed with ``COPY (<sql>) TO STDOUT`` as CSV and
+    parsed by Arrow's multithreaded CSV reader, so psycopg2 never builds a
+    Python tuple per row.  Column types come from ``_PG_ARROW_TYPES`` via a
+    ``LIMIT 0`` probe of the same query; TIMESTAMPTZ values keep their UTC
+    offset in the CSV and arrive as UTC-aware timestamps.  The columns stay
+    Arrow-backed (``pd.ArrowDtype``, the ``dtype_backend="pyarrow"`` layout).
+    """
+    buf = io.BytesIO()
+    with conn.cursor() as cur:
+        cur.execute(f"SELECT * FROM ({sql}) AS q LIMIT 0")  # noqa: S608
+        description = cur.description
+        cur.copy_expert(f"COPY ({sql}) TO STDOUT WITH (FORMAT csv, HEADER)", buf)
+    buf.seek(0)
+
+    column_types = {
+        d.name: _PG_ARROW_TYPES[d.type_code]
+        for d in description
+        if d.type_code in _PG_ARROW_TYPES
+    }
+    table = pacsv.read_csv(
+        buf,
+        convert_options=pacsv.ConvertOptions(column_types=column_types, **_COPY_CSV_OPTIONS),
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _feature_stats(conn) -> tuple[int, object]:
+    """Return (row_count, newest_time) of the ``training_features`` view."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT count(*), max(time) FROM training_features")
+        return cur.fetchone()
+
+
+def _stream_feature_splits(
+    conn,
+    bounds: tuple[int, int],
+    output_dir: Path,
+    batch_rows: int = EXPORT_BATCH_ROWS,
+) -> tuple[dict[str, Path], list[str]]:
+    """
+    Stream ``training_features`` into X/y parquet files for train / val / test.
+
+    Rows are read in time order through a named (server-side) cursor and each
+    batch is routed to the split its global row index falls into, using the
+    *bounds* from ``_three_way_bounds``.  Slices are buffered per file and
+    flushed as single-chunk row groups of ``EXPORT_ROW_GROUP_ROWS`` rows.
+    Files are written with ``_PARQUET_OPTIONS`` (zstd, level 3).
+
+    Args:
+        conn:       Open psycopg2 connection.
+        bounds:     (train_end, val_end) row indices.
+        output_dir: Directory for the parquet files (must exist).
+        batch_rows: Rows fetched and written per batch.
+
+    Returns:
+        (paths, available) – written paths keyed by split name, and the
+        FEATURE_COLS that were present in the view.
+    """
+    train_end, val_end = bounds
+    ranges = {"train": (0, train_end), "val": (train_end, val_end), "test": (val_end, None)}
+    writers: dict[str, pq.ParquetWriter] = {}
+    buffers: dict[str, list[pa.Table]] = {}
+    paths: dict[str, Path] = {}
+    available: list[str] = []
+
+    def _flush(name: str) -> None:
+        pending = buffers.pop(name, [])
+        if not pending:
+            return
+        table = pa.concat_tables(pending).combine_chunks()
+        if name not in writers:
+            paths[name] = output_dir / f"{name}.parquet"
+            writers[name] = pq.ParquetWriter(paths[name], table.schema, **_PARQUET_OPTIONS)
+        writers[name].write_table(table, row_group_size=EXPORT_ROW_GROUP_ROWS)
+
+    def _write(name: str, table: pa.Table) -> None:
+        buffers.setdefault(name, []).append(table)
+        if sum(len(t) for t in buffers[name]) >= EXPORT_ROW_GROUP_ROWS:
+            _flush(name)
+
+    try:
+        with conn.cursor(name="training_features_export") as cur:
+            cur.itersize = batch_rows
+            cur.execute("SELECT * FROM training_features ORDER BY time")
+            offset = 0
+            while rows := cur.fetchmany(batch_rows):
+                table = _compact_table(_batch_to_table(rows, cur.description))
+                if offset == 0:
+                    missing = [c for c in FEATURE_COLS if c not in table.column_names]
+                    if missing:
+                        _LOG.warning(
+                            "run_export: %d feature column(s) missing from training_features view and will be skipped: %s",
+                            len(missing),
+                            missing,
+                        )
+                    available = [c for c in FEATURE_COLS if c in table.column_names]
+
+                for split, (lo, hi) in ranges.items():
+                    hi = offset + len(table) if hi is None else hi
+                    start, stop = max(lo, offset), min(hi, offset + len(table))
+                    if start >= stop:
+                        continue
+                    part = table.slice(start - offset, stop - start)
+                    _write(f"X_{split}", part.select(available))
+                    _write(f"y_{split}", part.select([TARGET_COL]))
+                    if split == "val":
+                        # Used by the dashboard validation chart
+                        _write("timestamps_val", part.select(["time"]))
+                offset += len(table)
+            for name in list(buffers):
+                _flush(name)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    paths.pop("timestamps_val", None)
+    return paths, available
+
+
 # ─── Orchestration ────────────────────────────────────────────────────────────
 
 
+def refresh_training_features() -> None:
+    """
+    Recompute the ``training_features`` materialized view.
+
+    ``CONCURRENTLY`` (backed by the unique index on ``time``) keeps the old
+    contents readable for the API and any running export while the refresh
+    runs.  Must be called outside ``run_export``'s read-only transaction.
+    """
+    from db.timescale_client import get_conn  # noqa: PLC0415
+
+    with get_conn() as conn, conn.cursor() as cur:
+        cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY training_features")
+    _LOG.info("refresh_training_features: training_features refreshed")
+
+
 def run_export(
     output_dir: str = "data/energy/",
     val_ratio: float = 0.15,
@@ -302,11 +578,15 @@ def run_export(
     End-to-end feature export for Model B (EPEX energy price):
 
     1. Validate no target leakage in FEATURE_COLS.
-    2. Query the ``training_features`` view from TimescaleDB.
+    2. Count rows of the ``training_features`` view and find the newest one.
     3. Check data freshness (newest record ≤ 26 h old).
-    4. Chronological 70 / 15 / 15 train / val / test split.
-    5. Save six parquet files (X_train, X_val, X_test, y_train, y_val, y_test)
-       with a timestamp suffix for reproducibility.
+    4. Chronological 70 / 15 / 15 train / val / test split by row index.
+    5. Stream the view batch by batch into six parquet files (X_train, X_val,
+       X_test, y_train, y_val, y_test) plus ``timestamps_val.parquet``,
+       narrowed to float32 / int8 / bool by ``_compact_table``.
+
+    The count and the streaming read run in one REPEATABLE READ transaction so
+    a concurrent ETL load cannot shift the split boundaries.
 
     Args:
         output_dir: Directory for parquet files (default ``data/energy/``).
@@ -322,46 +602,28 @@ def run_export(
 
     validate_no_leakage(FEATURE_COLS, TARGET_COL)
 
-    with get_conn() as conn:
-        df = query_features(conn)
-
-    if df.empty:
-        raise RuntimeError(
-            "training_features view returned 0 rows. "
-            "Ensure the ETL pipeline has loaded data before running the export."
-        )
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
 
-    _check_data_freshness(df)
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY")
+        n_rows, latest = _feature_stats(conn)
 
-    train_df, val_df, test_df = split_chronological_three_way(df, val_ratio, test_ratio)
+        if not n_rows:
+            raise RuntimeError(
+                "training_features view returned 0 rows. "
+                "Ensure the ETL pipeline has loaded data before running the export."
+            )
 
-    missing = [c for c in FEATURE_COLS if c not in df.columns]
-    if missing:
-        _LOG.warning(
-            "run_export: %d feature column(s) missing from training_features view and will be skipped: %s",
-            len(missing),
-            missing,
-        )
-    available = [c for c in FEATURE_COLS if c in df.columns]
-
-    X_train = train_df[available]
-    y_train = train_df[[TARGET_COL]]
-    X_val = val_df[available]
-    y_val = val_df[[TARGET_COL]]
-    X_test = test_df[available]
-    y_test = test_df[[TARGET_COL]]
-
-    paths = save_parquet(
-        X_train, X_test, y_train, y_test, output_dir,
-        X_val=X_val, y_val=y_val,
-    )
+        _check_latest_freshness(latest)
 
-    # Save timestamps for the validation set (used by the dashboard validation chart)
-    val_df[["time"]].to_parquet(Path(output_dir) / "timestamps_val.parquet", index=False)
+        train_end, val_end = _three_way_bounds(n_rows, val_ratio, test_ratio)
+        paths, _ = _stream_feature_splits(conn, (train_end, val_end), out)
 
     print(
-        f"Export complete – {len(train_df)} train, "
-        f"{len(val_df)} val, {len(test_df)} test rows."
+        f"Export complete – {train_end} train, "
+        f"{val_end - train_end} val, {n_rows - val_end} test rows."
     )
     for name, p in paths.items():
         print(f"  {name}: {p}")
@@ -402,8 +664,7 @@ LOAD_FEATURE_COLS: list[str] = [
 
 def query_load_features(conn) -> pd.DataFrame:
     """Read the ``winterthur_net_load_features`` view, ordered by time."""
-    sql = "SELECT * FROM winterthur_net_load_features ORDER BY time"
-    return pd.read_sql(sql, conn, parse_dates=["time"])
+    return _query_frame(conn, "SELECT * FROM winterthur_net_load_features ORDER BY time")
 
 
 # Schulferien Kanton Zürich 2013–2026 (Volksschulamt Kanton Zürich).
@@ -550,14 +811,15 @@ def split_by_dates(
         time_col:  Name of the UTC-aware timestamp column.
 
     Returns:
-        (train_df, val_df, test_df)
+        (train_df, val_df, test_df) – boolean-mask selections, which are
+        already new frames, so no extra copy is made.
     """
     col = df[time_col]
     train_mask = col.dt.date <= pd.Timestamp(train_end).date()
     val_mask   = (col.dt.date > pd.Timestamp(train_end).date()) & \
                  (col.dt.date <= pd.Timestamp(val_end).date())
     test_mask  = col.dt.date > pd.Timestamp(val_end).date()
-    return df[train_mask].copy(), df[val_mask].copy(), df[test_mask].copy()
+    return df[train_mask], df[val_mask], df[test_mask]
 
 
 def run_load_export(
@@ -658,14 +920,14 @@ def run_load_export(
     for split_name, split_df in [("train", train_df), ("val", val_df), ("test", test_df)]:
         x_path = out / f"X_{split_name}.parquet"
         y_path = out / f"y_{split_name}.parquet"
-        split_df[available].to_parquet(x_path, index=False)
-        split_df[[LOAD_TARGET_COL]].to_parquet(y_path, index=False)
+        _write_parquet(split_df[available], x_path)
+        _write_parquet(split_df[[LOAD_TARGET_COL]], y_path)
         paths[f"X_{split_name}"] = x_path
         paths[f"y_{split_name}"] = y_path
 
     # Save timestamps for val/test (used by the dashboard validation chart)
-    val_df[["time"]].to_parquet(out / "timestamps_val.parquet", index=False)
-    test_df[["time"]].to_parquet(out / "timestamps_test.parquet", index=False)
+    _write_parquet(val_df[["time"]], out / "timestamps_val.parquet")
+    _write_parquet(test_df[["time"]], out / "timestamps_test.parquet")
 
     total = len(train_df) + len(val_df) + len(test_df)
     print(
@@ -685,4 +947,5 @@ if __name__ == "__main__":
 
     # Allow override via env variable for Docker usage
     out_dir = os.environ.get("BDSP_ENERGY_EXPORT_DIR", "data/energy/")
+    refresh_training_features()
     run_export(output_dir=out_dir)
@@ -1,18 +1,34 @@
 """
 Shared pytest fixtures for BigDataSmallPrice tests.
+
+Sample payloads are immutable ``bytes`` literals, so they are session-scoped
+and built once per run instead of once per test.  They are handed to the
+parsers as raw bytes – exactly what ``fetch`` returns from ``response.content`` –
+so ``orjson`` / ``json`` parse them without a ``str`` decode first.
+
+Float assertions: compare with ``==`` when both sides are exact in float64
+(integers, small-integer means, values copied by a shift); use
+``pytest.approx`` for anything parsed from decimal text (JSON / XML
+payloads such as ``245.3``) or computed with rounding.
 """
 
 import pytest
 from datetime import datetime, timezone
+from types import SimpleNamespace
 
+from src.data_collection.bafu_collector import BafuCollector
+from src.data_collection.ekz_collector import EkzCollector
+from src.data_collection.entsoe_collector import EntsoeCollector
+from src.data_collection.openmeteo_collector import OpenMeteoCollector
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def utc_now() -> datetime:
     """Return a fixed UTC-aware datetime for reproducible tests."""
     return datetime(2026, 2, 28, 6, 0, 0, tzinfo=timezone.utc)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_entsoe_xml() -> bytes:
     """Minimal valid ENTSO-E Day-Ahead XML response with 2 price points."""
     return b"""<?xml version="1.0" encoding="UTF-8"?>
@@ -39,10 +55,10 @@ def sample_entsoe_xml() -> bytes:
 </Publication_MarketDocument>"""
 
 
-@pytest.fixture
-def sample_openmeteo_json() -> str:
+@pytest.fixture(scope="session")
+def sample_openmeteo_json() -> bytes:
     """Minimal open-meteo JSON response with 2 hourly entries (incl. precipitation)."""
-    return """{
+    return b"""{
   "latitude": 47.5001,
   "longitude": 8.7502,
   "hourly": {
@@ -56,14 +72,14 @@ def sample_openmeteo_json() -> str:
 }"""
 
 
-@pytest.fixture
-def sample_ekz_json() -> str:
+@pytest.fixture(scope="session")
+def sample_ekz_json() -> bytes:
     """
     Combined EKZ JSON (as returned by EkzCollector.fetch):
     3 electricity_dynamic entries + 3 integrated_400D entries = 6 records.
     Timestamps use +01:00 (CET), matching the real API.
     """
-    return """{
+    return b"""{
   "prices": [
     {
       "start_timestamp": "2026-02-28T00:00:00+01:00",
@@ -99,10 +115,10 @@ def sample_ekz_json() -> str:
 }"""
 
 
-@pytest.fixture
-def sample_ckw_json() -> str:
+@pytest.fixture(scope="session")
+def sample_ckw_json() -> bytes:
     """Minimal CKW tariff JSON response with 3 intervals (15-min), 4 components each."""
-    return """{
+    return b"""{
   "prices": [
     {
       "start_timestamp": "2026-02-28T00:00:00+01:00",
@@ -132,10 +148,10 @@ def sample_ckw_json() -> str:
 }"""
 
 
-@pytest.fixture
-def sample_groupe_e_json() -> str:
+@pytest.fixture(scope="session")
+def sample_groupe_e_json() -> bytes:
     """Minimal Groupe E tariff JSON response with 3 intervals (15-min), 2 components each."""
-    return """{
+    return b"""{
   "prices": [
     {
       "start_timestamp": "2026-02-28T00:00:00+01:00",
@@ -159,11 +175,11 @@ def sample_groupe_e_json() -> str:
 }"""
 
 
-@pytest.fixture
-def sample_bafu_json() -> str:
+@pytest.fixture(scope="session")
+def sample_bafu_json() -> bytes:
     """Minimal existenz.ch hydro JSON response (Unix timestamps, flow+height per slot)."""
     # 1772236800 = 2026-02-28T00:00:00Z, 1772240400 = 2026-02-28T01:00:00Z
-    return """{
+    return b"""{
   "payload": [
     {"timestamp": 1772236800, "loc": "2018", "par": "flow",   "val": 245.3},
     {"timestamp": 1772236800, "loc": "2018", "par": "height", "val": 322.1},
@@ -171,3 +187,68 @@ def sample_bafu_json() -> str:
     {"timestamp": 1772240400, "loc": "2018", "par": "height", "val": 321.9}
   ]
 }"""
+
+
+# ─── HTTP ─────────────────────────────────────────────────────────────────────
+
+
+def _fake_response(*, text: str = "", content: bytes = b"", status: int = 200) -> SimpleNamespace:
+    return SimpleNamespace(
+        text=text, content=content, status_code=status, headers={},
+        raise_for_status=lambda: None,
+    )
+
+
+@pytest.fixture(scope="session")
+def fake_response():
+    """
+    Factory for lightweight stand-ins of a successful ``httpx.Response``.
+
+    A plain namespace with the attributes the collectors read – much cheaper
+    to build than a ``MagicMock``.
+    """
+    return _fake_response
+
+
+@pytest.fixture
+def mock_http_get(monkeypatch) -> list[tuple[str, dict]]:
+    """
+    Stub the collectors' shared ``_http_get`` and record every call.
+
+    Returns the list of ``(url, kwargs)`` calls.  Each call answers with an
+    empty JSON body (``{}``), which every collector's ``fetch`` accepts;
+    tests that need specific payloads patch ``_http_get`` themselves.
+    """
+    calls: list[tuple[str, dict]] = []
+    response = _fake_response(text="{}", content=b"{}")
+
+    def _get(url, **kwargs):
+        calls.append((url, kwargs))
+        return response
+
+    monkeypatch.setattr("src.data_collection.base_collector._http_get", _get)
+    return calls
+
+
+# ─── Parsed records (default collectors, parsed once per session) ────────────
+# Shared across tests – treat the returned lists as read-only.
+
+
+@pytest.fixture(scope="session")
+def entsoe_records(sample_entsoe_xml) -> list[dict]:
+    return EntsoeCollector(token="test-token").parse(sample_entsoe_xml)
+
+
+@pytest.fixture(scope="session")
+def openmeteo_records(sample_openmeteo_json) -> list[dict]:
+    return OpenMeteoCollector().parse(sample_openmeteo_json)
+
+
+@pytest.fixture(scope="session")
+def ekz_records(sample_ekz_json) -> list[dict]:
+    return EkzCollector().parse(sample_ekz_json)
+
+
+@pytest.fixture(scope="session")
+def bafu_records(sample_bafu_json) -> list[dict]:
+    return BafuCollector().parse(sample_bafu_json)
@@ -20,8 +20,6 @@ skip_reason = "Integration tests disabled. Set BDSP_INTEGRATION_TESTS=1 to run."
 @pytest.fixture(scope="module")
 def db_client():
     """Return the timescale_client module (imports lazily to avoid connection on import)."""
-    import sys
-    sys.path.insert(0, str(__import__("pathlib").Path(__file__).parents[3]))
     import importlib
     return importlib.import_module("src.db.timescale_client")
 
@@ -7,15 +7,10 @@ All database and model calls are mocked.
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# ── Path setup ────────────────────────────────────────────────────────────────
-sys.path.insert(0, str(Path(__file__).parents[3]))
-
 # Set BDSP_DB_PASSWORD so main.py can be imported without env var
 import os
 os.environ.setdefault("BDSP_DB_PASSWORD", "test")
@@ -33,12 +28,14 @@ client = TestClient(app)
 
 @pytest.fixture(autouse=True)
 def reset_stores():
-    """Clear in-memory user store and model cache before/after every test."""
+    """Clear in-memory user store and caches before/after every test."""
     main_module._USERS.clear()
     main_module._model_cache.clear()
+    main_module._response_cache.clear()
     yield
     main_module._USERS.clear()
     main_module._model_cache.clear()
+    main_module._response_cache.clear()
 
 
 @pytest.fixture
@@ -208,3 +205,192 @@ def test_dashboard_returns_html():
     resp = client.get("/dashboard")
     assert resp.status_code == 200
     assert "text/html" in resp.headers["content-type"]
+
+
+# ── Connection pool ───────────────────────────────────────────────────────────
+
+
+def test_connect_returns_connection_to_pool():
+    fake_pool = MagicMock()
+    conn = fake_pool.getconn.return_value
+    conn.closed = 0
+    with patch("src.api.main._get_pool", return_value=fake_pool):
+        with main_module._connect() as borrowed:
+            assert borrowed is conn
+    conn.rollback.assert_called_once()
+    fake_pool.putconn.assert_called_once_with(conn, close=False)
+
+
+def test_connect_discards_broken_connection():
+    fake_pool = MagicMock()
+    conn = fake_pool.getconn.return_value
+    conn.closed = 2
+    with patch("src.api.main._get_pool", return_value=fake_pool):
+        with pytest.raises(RuntimeError):
+            with main_module._connect():
+                raise RuntimeError("connection lost")
+    conn.rollback.assert_not_called()
+    fake_pool.putconn.assert_called_once_with(conn, close=True)
+
+
+# ── Response cache ────────────────────────────────────────────────────────────
+
+
+def test_db_status_is_cached():
+    with patch("src.api.main._connect") as mock_conn:
+        cur = mock_conn.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        cur.fetchall.return_value = [("entsoe", 0, None, None)]
+        first = client.get("/api/db-status")
+        second = client.get("/api/db-status")
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    mock_conn.assert_called_once()
+
+
+def test_db_status_error_is_not_cached():
+    with patch("src.api.main._connect", side_effect=RuntimeError("db down")) as mock_conn:
+        assert client.get("/api/db-status").status_code == 500
+        assert client.get("/api/db-status").status_code == 500
+    assert mock_conn.call_count == 2
+
+
+def test_db_status_runs_one_query_for_all_tables():
+    from datetime import datetime, timezone
+
+    t0 = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    with patch("src.api.main._connect") as mock_conn:
+        cur = mock_conn.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        cur.fetchall.return_value = [("entsoe", 42, t0, t0), ("features", 0, None, None)]
+        resp = client.get("/api/db-status")
+
+    assert resp.json() == {
+        "entsoe":   {"count": 42, "oldest": t0.isoformat(), "newest": t0.isoformat()},
+        "features": {"count": 0, "oldest": None, "newest": None},
+    }
+    cur.execute.assert_called_once()
+    sql = cur.execute.call_args.args[0]
+    assert sql.count("UNION ALL") == len(main_module._TABLES) - 1
+    assert "approximate_row_count('entsoe_day_ahead_prices')" in sql
+    assert "ORDER BY time DESC LIMIT 1" in sql
+    assert "count(*) FROM training_features" in sql
+
+
+# ── GET /api/airflow/dags ─────────────────────────────────────────────────────
+
+
+def _airflow_response(payload: dict) -> MagicMock:
+    resp = MagicMock()
+    resp.is_success = True
+    resp.json.return_value = payload
+    return resp
+
+
+def test_airflow_dags_batches_dag_run_lookup():
+    http = MagicMock()
+    http.get.return_value = _airflow_response(
+        {"dags": [{"dag_id": "etl"}, {"dag_id": "training"}, {"dag_id": "never_ran"}]}
+    )
+    http.post.return_value = _airflow_response({
+        "dag_runs": [
+            {"dag_id": "etl", "state": "success", "execution_date": "2026-03-02"},
+            {"dag_id": "training", "state": "failed", "execution_date": "2026-03-01"},
+            {"dag_id": "etl", "state": "success", "execution_date": "2026-03-01"},
+        ],
+        "total_entries": 3,
+    })
+    with patch("src.api.main.httpx.Client") as mock_client:
+        mock_client.return_value.__enter__.return_value = http
+        resp = client.get("/api/airflow/dags")
+
+    assert resp.status_code == 200
+    by_id = {d["dag_id"]: d["last_run"] for d in resp.json()}
+    assert by_id["etl"]["execution_date"] == "2026-03-02"
+    assert by_id["training"]["state"] == "failed"
+    assert by_id["never_ran"] is None
+    http.get.assert_called_once()   # only the /dags listing, no per-DAG calls
+    assert http.post.call_args.kwargs["json"]["dag_ids"] == ["etl", "training", "never_ran"]
+
+
+# ── GET /api/db-explorer/rows/{table} ─────────────────────────────────────────
+
+
+def test_db_rows_keyset_page_keeps_timestamp_ties_together():
+    from datetime import datetime, timezone
+
+    t1 = datetime(2026, 3, 2, 1, tzinfo=timezone.utc)
+    t0 = datetime(2026, 3, 2, 0, tzinfo=timezone.utc)
+    with patch("src.api.main._connect") as mock_conn:
+        cur = mock_conn.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        cur.description = [("time",), ("station_id",)]
+        cur.fetchall.side_effect = [
+            # page hits the limit …
+            [{"time": t1, "station_id": "2018"}, {"time": t0, "station_id": "2018"}],
+            # … so all rows at t0 are fetched
+            [{"time": t0, "station_id": "2018"}, {"time": t0, "station_id": "2019"}],
+        ]
+        resp = client.get(
+            "/api/db-explorer/rows/bafu_hydro",
+            params={"limit": 2, "before": "2026-03-02T02:00:00+00:00"},
+        )
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [r["station_id"] for r in body["rows"]] == ["2018", "2018", "2019"]
+    assert body["next_before"] == t0.isoformat()
+    page_sql = cur.execute.call_args_list[0].args[0]
+    assert "WHERE time < %s ORDER BY time DESC LIMIT %s" in page_sql
+    assert "OFFSET" not in page_sql
+
+
+def test_db_rows_encodes_decimal_and_datetime():
+    from datetime import datetime, timezone
+    from decimal import Decimal
+
+    t0 = datetime(2026, 3, 2, 0, 30, tzinfo=timezone.utc)
+    with patch("src.api.main._connect") as mock_conn:
+        cur = mock_conn.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        cur.description = [("time",), ("price_eur_mwh",)]
+        cur.fetchall.return_value = [{"time": t0, "price_eur_mwh": Decimal("81.25")}]
+        resp = client.get("/api/db-explorer/rows/entsoe_day_ahead_prices")
+
+    assert resp.status_code == 200
+    assert resp.json()["rows"] == [
+        {"time": "2026-03-02T00:30:00+00:00", "price_eur_mwh": 81.25}
+    ]
+
+
+def test_serialize_dispatches_on_type():
+    from datetime import date
+    from decimal import Decimal
+
+    import pandas as pd
+
+    from src.api.main import _serialize
+
+    assert _serialize(Decimal("1.5")) == 1.5
+    assert _serialize(pd.Timestamp("2026-03-02 00:30", tz="UTC")) == "2026-03-02T00:30:00+00:00"
+    assert _serialize(date(2026, 3, 2)) == "2026-03-02"
+    with pytest.raises(TypeError):
+        _serialize(object())
+
+
+def test_serialize_covers_former_jsonable_encoder_types():
+    import uuid
+    from datetime import timedelta
+
+    import orjson
+
+    from src.api.main import _serialize
+
+    row = {
+        "interval": timedelta(hours=1, seconds=30),
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "blob": memoryview(b"\x00\xff"),
+        "raw": b"\x01",
+    }
+    assert orjson.loads(orjson.dumps(row, default=_serialize)) == {
+        "interval": 3630.0,
+        "id": "12345678-1234-5678-1234-567812345678",
+        "blob": "00ff",
+        "raw": "01",
+    }
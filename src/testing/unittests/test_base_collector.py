@@ -0,0 +1,96 @@
+"""
+Unit tests for the shared HTTP plumbing in BaseCollector.
+
+HTTP is mocked – no real API calls are made.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+import src.data_collection.base_collector as bc
+from src.data_collection.base_collector import BaseCollector
+
+
+def _response(status_code: int, headers: dict | None = None) -> SimpleNamespace:
+    resp = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+    def _raise_for_status():
+        if status_code >= 400:
+            raise httpx.HTTPStatusError("error", request=None, response=resp)
+
+    resp.raise_for_status = _raise_for_status
+    return resp
+
+
+class TestSharedClient:
+    def test_client_is_reused_across_calls(self, monkeypatch):
+        monkeypatch.setattr(bc, "_CLIENT", None)
+        first = bc._get_client()
+        assert bc._get_client() is first
+        first.close()
+
+    def test_client_requests_compressed_responses(self, monkeypatch):
+        monkeypatch.setattr(bc, "_CLIENT", None)
+        client = bc._get_client()
+        assert "gzip" in client.headers["Accept-Encoding"]
+        client.close()
+
+
+class TestFetchWithRetry:
+    def test_retries_after_429_honouring_retry_after(self):
+        responses = [_response(429, {"Retry-After": "7"}), _response(200)]
+        with patch.object(bc, "_http_get", side_effect=responses) as mock_get, \
+             patch.object(bc.time, "sleep") as mock_sleep:
+            resp = BaseCollector._fetch_with_retry("https://example.test")
+        assert resp is responses[1]
+        assert mock_get.call_count == 2
+        mock_sleep.assert_called_once_with(7)
+
+    def test_raises_after_retries_exhausted(self):
+        with patch.object(bc, "_http_get", return_value=_response(503)), \
+             patch.object(bc.time, "sleep"):
+            with pytest.raises(httpx.HTTPStatusError):
+                BaseCollector._fetch_with_retry("https://example.test", max_retries=2)
+
+
+class _StubCollector(BaseCollector):
+    def __init__(self, payload):
+        self.payload = payload
+
+    def fetch(self):
+        if isinstance(self.payload, Exception):
+            raise self.payload
+        return self.payload
+
+    def parse(self, raw):
+        return [{"time": raw}]
+
+
+class TestRunAndArun:
+    def test_both_paths_share_parse_and_validate(self):
+        from datetime import datetime, timezone
+
+        t0 = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        collector = _StubCollector(t0)
+        with patch.object(_StubCollector, "_finish", wraps=collector._finish) as mock_finish:
+            assert collector.run() == [{"time": t0}]
+            assert asyncio.run(collector.arun()) == [{"time": t0}]
+        assert [c.args for c in mock_finish.call_args_list] == [(t0,), (t0,)]
+
+
+class TestRunConcurrently:
+    def test_results_keep_input_order_and_errors(self):
+        from datetime import datetime, timezone
+
+        t0 = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        t1 = datetime(2026, 3, 2, tzinfo=timezone.utc)
+        boom = RuntimeError("boom")
+        results = bc.run_concurrently(
+            [_StubCollector(t0), _StubCollector(boom), _StubCollector(t1)],
+            max_concurrency=2,
+        )
+        assert results == [[{"time": t0}], boom, [{"time": t1}]]
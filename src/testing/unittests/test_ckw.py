@@ -5,13 +5,9 @@ HTTP is mocked – no real API calls are made.
 """
 
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
 
 import pytest
 
-import sys
-sys.path.insert(0, str(__import__("pathlib").Path(__file__).parents[3]))
-
 from src.data_collection.ckw_collector import CKWCollector
 
 
@@ -100,19 +96,14 @@ class TestCKWCollectorParse:
 
 
 class TestCKWCollectorFetch:
-    def test_fetch_passes_correct_params(self):
-        mock_response = MagicMock()
-        mock_response.text = '{"prices": []}'
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("src.data_collection.base_collector.httpx.get", return_value=mock_response) as mock_get:
-            collector = CKWCollector(date="2026-02-28", tariff_name="home_dynamic")
-            collector.fetch()
-            params = mock_get.call_args.kwargs.get("params", {})
-            assert params.get("tariff_name") == "home_dynamic"
-            assert params.get("start_timestamp") == "2026-02-28T00:00:00+01:00"
-            assert params.get("end_timestamp") == "2026-02-28T23:59:59+01:00"
+    def test_fetch_passes_correct_params(self, mock_http_get):
+        collector = CKWCollector(date="2026-02-28", tariff_name="home_dynamic")
+        collector.fetch()
+        _, kwargs = mock_http_get[-1]
+        params = kwargs["params"]
+        assert params.get("tariff_name") == "home_dynamic"
+        assert params.get("start_timestamp") == "2026-02-28T00:00:00+01:00"
+        assert params.get("end_timestamp") == "2026-02-28T23:59:59+01:00"
 
     def test_default_date_is_today_utc(self):
         collector = CKWCollector()
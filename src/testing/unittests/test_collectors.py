@@ -0,0 +1,61 @@
+"""
+Contract tests shared by the BAFU, EKZ, ENTSO-E and open-meteo collectors.
+
+Each test runs once per collector against the session-scoped parsed records
+from conftest.  Source-specific parsing and request parameters are covered in
+the per-collector modules.
+
+HTTP is mocked – no real API calls are made.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.data_collection.bafu_collector import BafuCollector
+from src.data_collection.ekz_collector import EkzCollector
+from src.data_collection.entsoe_collector import EntsoeCollector
+from src.data_collection.openmeteo_collector import OpenMeteoCollector
+
+_IDS = ["bafu", "ekz", "entsoe", "openmeteo"]
+
+# (records fixture, record count, first timestamp)
+_PARSED = [
+    # 4 payload entries (2 timestamps × 2 params) → 2 merged records
+    ("bafu_records", 2, datetime(2026, 2, 28, 0, 0, 0, tzinfo=timezone.utc)),
+    # 3 electricity + 3 integrated entries; 2026-02-28T00:00:00+01:00 → 23:00Z
+    ("ekz_records", 6, datetime(2026, 2, 27, 23, 0, 0, tzinfo=timezone.utc)),
+    ("entsoe_records", 2, datetime(2026, 2, 28, 0, 0, 0, tzinfo=timezone.utc)),
+    ("openmeteo_records", 2, datetime(2026, 2, 28, 0, 0, 0, tzinfo=timezone.utc)),
+]
+
+# (collector factory, expected endpoint)
+_FETCHERS = [
+    (BafuCollector, "api.existenz.ch/apiv1/hydro/daterange"),
+    (lambda: EkzCollector(date="2026-02-28"), "api.tariffs.ekz.ch"),
+    (lambda: EntsoeCollector(token="my-token"), "web-api.tp.entsoe.eu"),
+    (OpenMeteoCollector, "open-meteo.com"),
+]
+
+
+@pytest.mark.parametrize("fixture_name,n_records,_", _PARSED, ids=_IDS)
+def test_parse_returns_correct_number_of_records(request, fixture_name, n_records, _):
+    assert len(request.getfixturevalue(fixture_name)) == n_records
+
+
+@pytest.mark.parametrize("fixture_name,_,expected_ts0", _PARSED, ids=_IDS)
+def test_parse_first_record_timestamp(request, fixture_name, _, expected_ts0):
+    assert request.getfixturevalue(fixture_name)[0]["time"] == expected_ts0
+
+
+@pytest.mark.parametrize("fixture_name", [p[0] for p in _PARSED], ids=_IDS)
+def test_all_timestamps_are_utc_aware(request, fixture_name):
+    for rec in request.getfixturevalue(fixture_name):
+        assert rec["time"].tzinfo is not None
+
+
+@pytest.mark.parametrize("make_collector,endpoint", _FETCHERS, ids=_IDS)
+def test_fetch_calls_expected_endpoint(mock_http_get, make_collector, endpoint):
+    make_collector().fetch()
+    assert mock_http_get
+    assert all(endpoint in url for url, _ in mock_http_get)
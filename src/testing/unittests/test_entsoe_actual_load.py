@@ -5,13 +5,10 @@ HTTP is mocked – no real API calls are made.
 """
 
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
-import sys
-sys.path.insert(0, str(__import__("pathlib").Path(__file__).parents[3]))
-
 from src.data_collection.entsoe_collector import EntsoeActualLoadCollector
 
 
@@ -94,23 +91,29 @@ class TestEntsoeActualLoadCollector:
         records = collector.parse(xml)
         assert records == []
 
-    def test_fetch_calls_api_with_correct_params(self):
-        mock_response = MagicMock()
-        mock_response.content = b"<root/>"
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("src.data_collection.base_collector.httpx.get", return_value=mock_response) as mock_get:
-            collector = EntsoeActualLoadCollector(token="my-token")
-            collector.fetch()
-            call_kwargs = mock_get.call_args
-            params = call_kwargs.kwargs.get("params", call_kwargs.args[1] if len(call_kwargs.args) > 1 else {})
-            assert params["securityToken"] == "my-token"
-            assert params["documentType"] == "A65"
-            assert params["processType"] == "A16"
-            assert params["outBiddingZone_Domain"] == "10YCH-SWISSGRIDZ"
-            assert "in_Domain" not in params
-            assert "out_Domain" not in params
+    def test_parse_reads_every_time_series(self, sample_a65_xml):
+        # Two TimeSeries: the second must still be found after the first
+        # has been cleared by the streaming parser.
+        series = sample_a65_xml.split(b"<TimeSeries>")[1].split(b"</GL_MarketDocument>")[0]
+        xml = sample_a65_xml.replace(
+            b"</GL_MarketDocument>",
+            b"<TimeSeries>" + series.replace(b"2026-02-27T00:00Z", b"2026-02-27T02:00Z")
+            + b"</GL_MarketDocument>",
+        )
+        records = EntsoeActualLoadCollector().parse(xml)
+        assert [r["time"].hour for r in records] == [0, 1, 2, 3]
+
+    def test_fetch_calls_api_with_correct_params(self, mock_http_get):
+        collector = EntsoeActualLoadCollector(token="my-token")
+        collector.fetch()
+        _, kwargs = mock_http_get[-1]
+        params = kwargs["params"]
+        assert params["securityToken"] == "my-token"
+        assert params["documentType"] == "A65"
+        assert params["processType"] == "A16"
+        assert params["outBiddingZone_Domain"] == "10YCH-SWISSGRIDZ"
+        assert "in_Domain" not in params
+        assert "out_Domain" not in params
 
     def test_run_validates_utc_aware_timestamps(self, sample_a65_xml):
         collector = EntsoeActualLoadCollector()
@@ -6,13 +6,10 @@ HTTP is mocked – no real API calls are made.
 """
 
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
-import sys
-sys.path.insert(0, str(__import__("pathlib").Path(__file__).parents[3]))
-
 from src.data_collection.entsoe_collector import (
     EntsoeGenerationCollector,
     EntsoeCrossBorderFlowCollector,
@@ -178,44 +175,32 @@ class TestEntsoeGenerationCollector:
             assert rec["domain"] == "10Y1001A1001A83F"
             assert rec["psr_type"] == "B19"
 
-    def test_fetch_calls_api_with_correct_params(self):
-        mock_response = MagicMock()
-        mock_response.content = b"<root/>"
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("src.data_collection.base_collector.httpx.get", return_value=mock_response) as mock_get:
-            collector = EntsoeGenerationCollector(
-                domain="10YCH-SWISSGRIDZ",
-                psr_type="B16",
-                token="my-token",
-            )
-            collector.fetch()
-            call_kwargs = mock_get.call_args
-            params = call_kwargs.kwargs.get("params", call_kwargs.args[1] if len(call_kwargs.args) > 1 else {})
-            assert params["securityToken"] == "my-token"
-            assert params["documentType"] == "A75"
-            assert params["processType"] == "A16"
-            assert params["in_Domain"] == "10YCH-SWISSGRIDZ"
-            assert params["psrType"] == "B16"
-
-    def test_fetch_uses_de_domain(self):
-        mock_response = MagicMock()
-        mock_response.content = b"<root/>"
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("src.data_collection.base_collector.httpx.get", return_value=mock_response) as mock_get:
-            collector = EntsoeGenerationCollector(
-                domain="10Y1001A1001A83F",
-                psr_type="B19",
-                token="my-token",
-            )
-            collector.fetch()
-            call_kwargs = mock_get.call_args
-            params = call_kwargs.kwargs.get("params", call_kwargs.args[1] if len(call_kwargs.args) > 1 else {})
-            assert params["in_Domain"] == "10Y1001A1001A83F"
-            assert params["psrType"] == "B19"
+    def test_fetch_calls_api_with_correct_params(self, mock_http_get):
+        collector = EntsoeGenerationCollector(
+            domain="10YCH-SWISSGRIDZ",
+            psr_type="B16",
+            token="my-token",
+        )
+        collector.fetch()
+        _, kwargs = mock_http_get[-1]
+        params = kwargs["params"]
+        assert params["securityToken"] == "my-token"
+        assert params["documentType"] == "A75"
+        assert params["processType"] == "A16"
+        assert params["in_Domain"] == "10YCH-SWISSGRIDZ"
+        assert params["psrType"] == "B16"
+
+    def test_fetch_uses_de_domain(self, mock_http_get):
+        collector = EntsoeGenerationCollector(
+            domain="10Y1001A1001A83F",
+            psr_type="B19",
+            token="my-token",
+        )
+        collector.fetch()
+        _, kwargs = mock_http_get[-1]
+        params = kwargs["params"]
+        assert params["in_Domain"] == "10Y1001A1001A83F"
+        assert params["psrType"] == "B19"
 
 
 # ─── EntsoeCrossBorderFlowCollector tests ─────────────────────────────────────
@@ -308,43 +293,31 @@ class TestEntsoeCrossBorderFlowCollector:
         records = collector.parse(empty_xml)
         assert records == []
 
-    def test_fetch_calls_api_with_correct_params(self):
-        mock_response = MagicMock()
-        mock_response.content = b"<root/>"
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("src.data_collection.base_collector.httpx.get", return_value=mock_response) as mock_get:
-            collector = EntsoeCrossBorderFlowCollector(
-                in_domain="10YCH-SWISSGRIDZ",
-                out_domain="10Y1001A1001A83F",
-                token="my-token",
-            )
-            collector.fetch()
-            call_kwargs = mock_get.call_args
-            params = call_kwargs.kwargs.get("params", call_kwargs.args[1] if len(call_kwargs.args) > 1 else {})
-            assert params["securityToken"] == "my-token"
-            assert params["documentType"] == "A11"
-            assert params["in_Domain"] == "10YCH-SWISSGRIDZ"
-            assert params["out_Domain"] == "10Y1001A1001A83F"
-
-    def test_fetch_reverse_direction(self):
-        mock_response = MagicMock()
-        mock_response.content = b"<root/>"
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("src.data_collection.base_collector.httpx.get", return_value=mock_response) as mock_get:
-            collector = EntsoeCrossBorderFlowCollector(
-                in_domain="10Y1001A1001A83F",
-                out_domain="10YCH-SWISSGRIDZ",
-                token="my-token",
-            )
-            collector.fetch()
-            call_kwargs = mock_get.call_args
-            params = call_kwargs.kwargs.get("params", call_kwargs.args[1] if len(call_kwargs.args) > 1 else {})
-            assert params["in_Domain"] == "10Y1001A1001A83F"
-            assert params["out_Domain"] == "10YCH-SWISSGRIDZ"
+    def test_fetch_calls_api_with_correct_params(self, mock_http_get):
+        collector = EntsoeCrossBorderFlowCollector(
+            in_domain="10YCH-SWISSGRIDZ",
+            out_domain="10Y1001A1001A83F",
+            token="my-token",
+        )
+        collector.fetch()
+        _, kwargs = mock_http_get[-1]
+        params = kwargs["params"]
+        assert params["securityToken"] == "my-token"
+        assert params["documentType"] == "A11"
+        assert params["in_Domain"] == "10YCH-SWISSGRIDZ"
+        assert params["out_Domain"] == "10Y1001A1001A83F"
+
+    def test_fetch_reverse_direction(self, mock_http_get):
+        collector = EntsoeCrossBorderFlowCollector(
+            in_domain="10Y1001A1001A83F",
+            out_domain="10YCH-SWISSGRIDZ",
+            token="my-token",
+        )
+        collector.fetch()
+        _, kwargs = mock_http_get[-1]
+        params = kwargs["params"]
+        assert params["in_Domain"] == "10Y1001A1001A83F"
+        assert params["out_Domain"] == "10YCH-SWISSGRIDZ"
 
 
 # ─── EntsoeLoadForecastCollector tests ────────────────────────────────────────
@@ -401,24 +374,18 @@ class TestEntsoeLoadForecastCollector:
         records = collector.parse(empty_xml)
         assert records == []
 
-    def test_fetch_calls_api_with_correct_params(self):
-        mock_response = MagicMock()
-        mock_response.content = b"<root/>"
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("src.data_collection.base_collector.httpx.get", return_value=mock_response) as mock_get:
-            collector = EntsoeLoadForecastCollector(token="my-token")
-            collector.fetch()
-            call_kwargs = mock_get.call_args
-            params = call_kwargs.kwargs.get("params", call_kwargs.args[1] if len(call_kwargs.args) > 1 else {})
-            assert params["securityToken"] == "my-token"
-            assert params["documentType"] == "A65"
-            assert params["processType"] == "A01"
-            assert params["outBiddingZone_Domain"] == "10YCH-SWISSGRIDZ"
-            assert "in_Domain" not in params
-            assert "out_Domain" not in params
-            assert "psrType" not in params
+    def test_fetch_calls_api_with_correct_params(self, mock_http_get):
+        collector = EntsoeLoadForecastCollector(token="my-token")
+        collector.fetch()
+        _, kwargs = mock_http_get[-1]
+        params = kwargs["params"]
+        assert params["securityToken"] == "my-token"
+        assert params["documentType"] == "A65"
+        assert params["processType"] == "A01"
+        assert params["outBiddingZone_Domain"] == "10YCH-SWISSGRIDZ"
+        assert "in_Domain" not in params
+        assert "out_Domain" not in params
+        assert "psrType" not in params
 
     def test_run_validates_utc_aware_timestamps(self, sample_a65_a01_xml):
         collector = EntsoeLoadForecastCollector()
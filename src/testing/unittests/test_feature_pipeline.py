@@ -4,21 +4,28 @@ Unit tests for src/processing/export_pipeline.py – Phase 2 feature pipeline.
 All tests operate on in-memory DataFrames; no database connection is required.
 """
 
-import sys
-from pathlib import Path
-
+import csv
+import io
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
-# Make project root importable so `from src.processing...` works
-sys.path.insert(0, str(Path(__file__).parents[3]))
-
 from src.processing.export_pipeline import (
     FEATURE_COLS,
     LOAD_FEATURE_COLS,
     LOAD_TARGET_COL,
     TARGET_COL,
     _add_holiday_flags,
+    _query_frame,
+    _stream_feature_splits,
+    query_features,
+    run_load_export,
     save_parquet,
     split_by_dates,
     split_chronological,
@@ -36,16 +43,39 @@ def _make_feature_df(n: int = 200) -> pd.DataFrame:
     Prices increase linearly so chronological ordering is easy to verify.
     All feature columns are filled with deterministic floats.
     """
-    times = pd.date_range("2026-01-01", periods=n, freq="h", tz="UTC")
+    idx = np.arange(n)
+    base = (idx % 10).astype(np.float64)
     data: dict = {
-        "time": times,
-        TARGET_COL: [float(50 + i % 30) for i in range(n)],
+        "time": pd.date_range("2026-01-01", periods=n, freq="h", tz="UTC"),
+        TARGET_COL: (50 + idx % 30).astype(np.float64),
     }
-    for col in FEATURE_COLS:
-        data[col] = [float(i % 10) for i in range(n)]
+    # pd.DataFrame copies dict-of-ndarray input, so sharing *base* is safe
+    data.update({col: base for col in FEATURE_COLS})
     return pd.DataFrame(data)
 
 
+def _prepare_splits(df: pd.DataFrame):
+    """80/20 chronological split of *df* into (X_train, X_test, y_train, y_test)."""
+    train_df, test_df = split_chronological(df, test_ratio=0.2)
+    return (
+        train_df[FEATURE_COLS],
+        test_df[FEATURE_COLS],
+        train_df[[TARGET_COL]],
+        test_df[[TARGET_COL]],
+    )
+
+
+# Built once per session – tests only read them (copy before mutating).
+@pytest.fixture(scope="session")
+def feature_df_100() -> pd.DataFrame:
+    return _make_feature_df(100)
+
+
+@pytest.fixture(scope="session")
+def feature_df_50() -> pd.DataFrame:
+    return _make_feature_df(50)
+
+
 # ─── Test: lag feature logic ──────────────────────────────────────────────────
 
 
@@ -70,7 +100,7 @@ class TestLagFeaturesCorrect:
         df["lag_24h"] = df["price_eur_mwh"].shift(24)
 
         # Row 24 → lag_24h should equal price at row 0
-        assert df["lag_24h"].iloc[24] == pytest.approx(df["price_eur_mwh"].iloc[0])
+        assert df["lag_24h"].iloc[24] == df["price_eur_mwh"].iloc[0]
         # Row 0 → lag_24h is NaN (no prior data)
         assert pd.isna(df["lag_24h"].iloc[0])
 
@@ -102,6 +132,12 @@ class TestNoDataLeakage:
         with pytest.raises(ValueError, match=TARGET_COL):
             validate_no_leakage(bad_features, TARGET_COL)
 
+    def test_raises_when_feature_is_derived_from_target(self):
+        """A column named after the target (e.g. a shifted copy) must raise."""
+        bad_features = FEATURE_COLS + [f"{TARGET_COL}_lag_24h"]
+        with pytest.raises(ValueError, match=f"{TARGET_COL}_lag_24h"):
+            validate_no_leakage(bad_features, TARGET_COL)
+
 
 # ─── Test: chronological split ───────────────────────────────────────────────
 
@@ -109,41 +145,32 @@ class TestNoDataLeakage:
 class TestChronologicalSplit:
     """Verify train/test split preserves temporal ordering with no leakage."""
 
-    def test_test_data_is_strictly_after_train_data(self):
+    def test_test_data_is_strictly_after_train_data(self, feature_df_100):
         """The latest train timestamp must be earlier than the earliest test timestamp."""
-        df = _make_feature_df(100)
-        train, test = split_chronological(df, test_ratio=0.2)
+        train, test = split_chronological(feature_df_100, test_ratio=0.2)
         assert train["time"].max() < test["time"].min()
 
-    def test_split_sizes_match_ratio(self):
+    def test_split_sizes_match_ratio(self, feature_df_100):
         """80 / 20 split on 100 rows → 80 train, 20 test."""
-        df = _make_feature_df(100)
-        train, test = split_chronological(df, test_ratio=0.2)
+        train, test = split_chronological(feature_df_100, test_ratio=0.2)
         assert len(train) == 80
         assert len(test) == 20
 
-    def test_no_timestamp_overlap(self):
+    def test_no_timestamp_overlap(self, feature_df_100):
         """No timestamp should appear in both train and test sets."""
-        df = _make_feature_df(100)
-        train, test = split_chronological(df, test_ratio=0.2)
+        train, test = split_chronological(feature_df_100, test_ratio=0.2)
         overlap = set(train["time"]) & set(test["time"])
         assert len(overlap) == 0
 
-    def test_train_plus_test_equals_full_dataset(self):
+    def test_train_plus_test_equals_full_dataset(self, feature_df_100):
         """Row counts must sum to the original dataset size."""
-        df = _make_feature_df(100)
-        train, test = split_chronological(df, test_ratio=0.2)
-        assert len(train) + len(test) == len(df)
-
-    def test_invalid_ratio_zero_raises(self):
-        df = _make_feature_df(50)
-        with pytest.raises(ValueError):
-            split_chronological(df, test_ratio=0.0)
+        train, test = split_chronological(feature_df_100, test_ratio=0.2)
+        assert len(train) + len(test) == len(feature_df_100)
 
-    def test_invalid_ratio_one_raises(self):
-        df = _make_feature_df(50)
+    @pytest.mark.parametrize("ratio", [0.0, 1.0], ids=["zero", "one"])
+    def test_invalid_ratio_raises(self, feature_df_50, ratio):
         with pytest.raises(ValueError):
-            split_chronological(df, test_ratio=1.0)
+            split_chronological(feature_df_50, test_ratio=ratio)
 
 
 # ─── Test: parquet export ─────────────────────────────────────────────────────
@@ -152,44 +179,209 @@ class TestChronologicalSplit:
 class TestExportFilesExist:
     """Verify that save_parquet creates all four expected files."""
 
-    def _prepare_splits(self, n: int = 100):
-        df = _make_feature_df(n)
-        train_df, test_df = split_chronological(df, test_ratio=0.2)
-        return (
-            train_df[FEATURE_COLS],
-            test_df[FEATURE_COLS],
-            train_df[[TARGET_COL]],
-            test_df[[TARGET_COL]],
+    @pytest.fixture(scope="class")
+    def exported_splits(self, tmp_path_factory, feature_df_100):
+        """Run save_parquet once for the whole class; tests only read the output."""
+        out = tmp_path_factory.mktemp("export")
+        X_train, X_test, y_train, y_test = _prepare_splits(feature_df_100)
+        paths = save_parquet(X_train, X_test, y_train, y_test, str(out))
+        return SimpleNamespace(
+            out=out, paths=paths,
+            X_train=X_train, X_test=X_test, y_train=y_train, y_test=y_test,
         )
 
-    def test_all_four_parquet_files_created(self, tmp_path):
+    def test_all_four_parquet_files_created(self, exported_splits):
         """After save_parquet, all four split files must exist on disk."""
-        X_train, X_test, y_train, y_test = self._prepare_splits()
-        save_parquet(X_train, X_test, y_train, y_test, str(tmp_path))
-
         for name in ("X_train", "X_test", "y_train", "y_test"):
-            assert (tmp_path / f"{name}.parquet").exists(), (
+            assert (exported_splits.out / f"{name}.parquet").exists(), (
                 f"Missing file: {name}.parquet"
             )
 
-    def test_loaded_x_train_matches_input(self, tmp_path):
+    def test_loaded_x_train_matches_input(self, exported_splits):
         """X_train.parquet, when loaded, must have identical shape and columns."""
-        X_train, X_test, y_train, y_test = self._prepare_splits()
-        paths = save_parquet(X_train, X_test, y_train, y_test, str(tmp_path))
+        loaded = pd.read_parquet(exported_splits.paths["X_train"])
+        assert loaded.shape == exported_splits.X_train.shape
+        assert list(loaded.columns) == list(exported_splits.X_train.columns)
 
-        loaded = pd.read_parquet(paths["X_train"])
-        assert loaded.shape == X_train.shape
-        assert list(loaded.columns) == list(X_train.columns)
-
-    def test_train_larger_than_test(self, tmp_path):
+    def test_train_larger_than_test(self, exported_splits):
         """Parquet row counts must reflect the 80/20 split."""
-        X_train, X_test, y_train, y_test = self._prepare_splits(100)
-        paths = save_parquet(X_train, X_test, y_train, y_test, str(tmp_path))
-
-        n_train = len(pd.read_parquet(paths["X_train"]))
-        n_test = len(pd.read_parquet(paths["X_test"]))
+        n_train = len(pd.read_parquet(exported_splits.paths["X_train"]))
+        n_test = len(pd.read_parquet(exported_splits.paths["X_test"]))
         assert n_train > n_test
 
+    def test_files_are_zstd_compressed(self, exported_splits):
+        import pyarrow.parquet as pq
+
+        column = pq.ParquetFile(exported_splits.paths["X_train"]).metadata.row_group(0).column(0)
+        assert column.compression == "ZSTD"
+
+
+# ─── Test: streaming export ──────────────────────────────────────────────────
+
+
+class _FakeCursor:
+    """Minimal stand-in for a psycopg2 named cursor over a DataFrame."""
+
+    def __init__(self, df: pd.DataFrame):
+        from collections import namedtuple
+
+        col = namedtuple("Column", "name type_code")
+        self.description = [
+            col(c, 1184 if c == "time" else 701) for c in df.columns
+        ]
+        self._rows = [
+            tuple(r) for r in df.astype(object).itertuples(index=False)
+        ]
+        self.itersize = None
+        self.executed: list[str] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        self.executed.append(sql)
+
+    def fetchmany(self, size):
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+    def copy_expert(self, sql, file):
+        """Write the rows the way ``COPY ... TO STDOUT (FORMAT csv, HEADER)`` does."""
+        self.executed.append(sql)
+
+        def _cell(v):
+            if v is None or v != v:  # NULL / NaN
+                return ""
+            if isinstance(v, bool):
+                return "t" if v else "f"
+            if isinstance(v, datetime):
+                return v.isoformat(sep=" ")
+            return str(v)
+
+        text = io.StringIO()
+        writer = csv.writer(text, lineterminator="\n")
+        writer.writerow(d.name for d in self.description)
+        writer.writerows([_cell(v) for v in row] for row in self._rows)
+        file.write(text.getvalue().encode())
+
+
+class _FakeConn:
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+
+    def cursor(self, name=None):
+        self.last_cursor = _FakeCursor(self._df)
+        return self.last_cursor
+
+
+class TestStreamFeatureSplits:
+    """run_export's batch-wise writer must route rows exactly like the in-memory split."""
+
+    def test_batches_are_routed_to_the_right_split(self, tmp_path):
+        df = _make_feature_df(100)
+        paths, available = _stream_feature_splits(
+            _FakeConn(df), (70, 85), tmp_path, batch_rows=30,
+        )
+
+        assert available == FEATURE_COLS
+        assert len(pd.read_parquet(paths["X_train"])) == 70
+        assert len(pd.read_parquet(paths["X_val"])) == 15
+        assert len(pd.read_parquet(paths["X_test"])) == 15
+        y_val = pd.read_parquet(paths["y_val"])[TARGET_COL].tolist()
+        assert y_val == df[TARGET_COL].iloc[70:85].tolist()
+        ts_val = pd.read_parquet(tmp_path / "timestamps_val.parquet")["time"]
+        assert ts_val.iloc[0] == pd.Timestamp(df["time"].iloc[70])
+
+    def test_exported_columns_are_narrowed(self, tmp_path):
+        paths, _ = _stream_feature_splits(
+            _FakeConn(_make_feature_df(20)), (10, 15), tmp_path, batch_rows=8,
+        )
+        X_train = pd.read_parquet(paths["X_train"])
+        assert X_train["lag_1h"].dtype == "float32"
+        assert X_train["hour_of_day"].dtype == "int8"
+        assert X_train["is_weekend"].dtype == "bool"
+        assert pd.read_parquet(paths["y_train"])[TARGET_COL].dtype == "float32"
+
+    def test_batches_are_combined_into_full_row_groups(self, tmp_path, monkeypatch):
+        import pyarrow.parquet as pq
+
+        import src.processing.export_pipeline as ep
+
+        monkeypatch.setattr(ep, "EXPORT_ROW_GROUP_ROWS", 40)
+        paths, _ = _stream_feature_splits(
+            _FakeConn(_make_feature_df(100)), (70, 85), tmp_path, batch_rows=10,
+        )
+        meta = pq.ParquetFile(paths["X_train"]).metadata
+        # 70 rows in 10-row batches → one 40-row group + the 30-row remainder
+        assert [meta.row_group(i).num_rows for i in range(meta.num_row_groups)] == [40, 30]
+
+
+class TestQueryFeatures:
+    def test_rows_become_typed_columns(self):
+        df = _make_feature_df(5)
+        out = query_features(_FakeConn(df))
+        assert list(out.columns) == list(df.columns)
+        assert str(out["time"].dt.tz) == "UTC"
+        assert out["time"].tolist() == df["time"].tolist()
+        assert out[TARGET_COL].dtype == pd.ArrowDtype(pa.float64())
+
+    def test_result_is_streamed_with_copy(self):
+        conn = _FakeConn(_make_feature_df(3))
+        query_features(conn)
+        probe, copy = conn.last_cursor.executed
+        assert probe.endswith("LIMIT 0")
+        assert copy.startswith("COPY (SELECT * FROM training_features ORDER BY time) TO STDOUT")
+
+    def test_postgres_csv_values_are_typed(self):
+        from collections import namedtuple
+
+        col = namedtuple("Column", "name type_code")
+        cur = MagicMock()
+        cur.__enter__.return_value = cur
+        cur.description = [col("time", 1184), col("flag", 16), col("label", 25), col("v", 701)]
+        cur.copy_expert.side_effect = lambda sql, f: f.write(
+            b"time,flag,label,v\n"
+            b"2026-02-28 01:00:00+01,t,\"\",NaN\n"
+            b"2026-02-28 00:30:00.5+00,,,\n"
+        )
+        conn = MagicMock()
+        conn.cursor.return_value = cur
+
+        out = _query_frame(conn, "SELECT 1")
+        assert out["time"].tolist() == [
+            pd.Timestamp("2026-02-28 00:00", tz="UTC"),
+            pd.Timestamp("2026-02-28 00:30:00.5", tz="UTC"),
+        ]
+        # Unquoted empty fields are NULL; a quoted "" stays an empty string
+        assert out["flag"].iloc[0] is True and out["flag"].iloc[1] is pd.NA
+        assert out["label"].iloc[0] == "" and out["label"].iloc[1] is pd.NA
+        assert np.isnan(out["v"].iloc[0]) and out["v"].iloc[1] is pd.NA
+
+    def test_arrow_backed_frame_writes_numpy_dtypes(self, tmp_path):
+        from src.processing.export_pipeline import _write_parquet
+
+        out = query_features(_FakeConn(_make_feature_df(5)))
+        _write_parquet(out, tmp_path / "X.parquet")
+        back = pd.read_parquet(tmp_path / "X.parquet")
+        assert back[TARGET_COL].dtype == "float64"
+        assert str(back["time"].dt.tz) == "UTC"
+
+    def test_numpy_frame_keeps_pandas_metadata(self, tmp_path):
+        import pyarrow.parquet as pq
+
+        from src.processing.export_pipeline import _write_parquet
+
+        _write_parquet(_make_feature_df(5), tmp_path / "X.parquet")
+        assert b"pandas" in pq.read_schema(tmp_path / "X.parquet").metadata
+
+    def test_empty_result_keeps_columns(self):
+        out = query_features(_FakeConn(_make_feature_df(0)))
+        assert out.empty
+        assert list(out.columns) == ["time", TARGET_COL, *FEATURE_COLS]
+
 
 # ─── Test: no nulls in key columns ───────────────────────────────────────────
 
@@ -197,16 +389,15 @@ class TestExportFilesExist:
 class TestNoNullsInKeyColumns:
     """Ensure that null-free DataFrames pass and null-containing ones fail."""
 
-    def test_clean_feature_df_has_no_nulls_in_lag_cols(self):
+    def test_clean_feature_df_has_no_nulls_in_lag_cols(self, feature_df_50):
         """A fully populated DataFrame must have zero NaN values in lag columns."""
-        df = _make_feature_df(50)
         lag_cols = ["lag_1h", "lag_24h", "lag_168h"]
         for col in lag_cols:
-            assert df[col].isna().sum() == 0, f"Unexpected NaN in '{col}'"
+            assert feature_df_50[col].isna().sum() == 0, f"Unexpected NaN in '{col}'"
 
-    def test_null_in_lag_column_is_detected(self):
+    def test_null_in_lag_column_is_detected(self, feature_df_50):
         """Introduce a NaN and confirm it can be found programmatically."""
-        df = _make_feature_df(50)
+        df = feature_df_50.copy()
         df.loc[5, "lag_24h"] = float("nan")
         assert df["lag_24h"].isna().sum() == 1
 
@@ -337,3 +528,70 @@ class TestLoadFeatureColsNoLeakage:
         bad = LOAD_FEATURE_COLS + [LOAD_TARGET_COL]
         with pytest.raises(ValueError, match="leakage"):
             validate_no_leakage(bad, LOAD_TARGET_COL)
+
+
+# ─── Test: Model A – run_load_export ─────────────────────────────────────────
+
+
+def _make_load_view_df(days: int = 30) -> pd.DataFrame:
+    """``winterthur_net_load_features`` rows for the last *days* days, up to now."""
+    end = pd.Timestamp.now(tz="UTC").floor("h")
+    times = pd.date_range(end=end, periods=days * 24, freq="h")
+    n = len(times)
+    view_cols = [
+        c for c in LOAD_FEATURE_COLS
+        if c not in ("is_holiday_zh", "is_school_holiday", "temp_deviation")
+    ]
+    df = pd.DataFrame({"time": times})
+    for i, c in enumerate(view_cols):
+        df[c] = np.arange(n, dtype=float) + i
+    df["temperature_2m"] = times.hour.astype(float)
+    df[LOAD_TARGET_COL] = np.arange(n, dtype=float)
+    return df
+
+
+class TestRunLoadExport:
+    """run_load_export over the Arrow-backed frame _query_frame returns."""
+
+    @pytest.fixture
+    def exported(self, tmp_path, monkeypatch):
+        import db.timescale_client as tc
+
+        df = _make_load_view_df()
+        conn = _FakeConn(df)
+
+        @contextmanager
+        def _fake_get_conn():
+            yield conn
+
+        monkeypatch.setattr(tc, "get_conn", _fake_get_conn)
+        paths = run_load_export(output_dir=str(tmp_path))
+        return SimpleNamespace(df=df, paths=paths, out=tmp_path)
+
+    def test_splits_cover_all_rows_in_date_order(self, exported):
+        sizes = {
+            name: len(pd.read_parquet(exported.paths[f"y_{name}"]))
+            for name in ("train", "val", "test")
+        }
+        assert sum(sizes.values()) == len(exported.df)
+        ts_val = pd.read_parquet(exported.out / "timestamps_val.parquet")["time"]
+        ts_test = pd.read_parquet(exported.out / "timestamps_test.parquet")["time"]
+        assert len(ts_test) == sizes["test"]
+        assert ts_val.max() < ts_test.min()
+        assert ts_test.dt.date.nunique() == 7
+
+    def test_files_read_back_with_numpy_dtypes(self, exported):
+        X_train = pd.read_parquet(exported.paths["X_train"])
+        assert list(X_train.columns) == LOAD_FEATURE_COLS
+        assert X_train["load_lag_1h"].dtype == "float64"
+        assert X_train["is_holiday_zh"].dtype == "int64"
+        assert pd.read_parquet(exported.paths["y_train"])[LOAD_TARGET_COL].dtype == "float64"
+        ts = pd.read_parquet(exported.out / "timestamps_test.parquet")["time"]
+        assert str(ts.dt.tz) == "UTC"
+
+    def test_temp_deviation_is_relative_to_daily_mean(self, exported):
+        X_test = pd.read_parquet(exported.paths["X_test"])
+        days = pd.read_parquet(exported.out / "timestamps_test.parquet")["time"].dt.date
+        per_day = X_test["temp_deviation"].groupby(days.values).sum()
+        assert per_day.abs().max() == pytest.approx(0.0, abs=1e-9)
+        assert X_test["temp_deviation"].abs().max() > 0
@@ -0,0 +1,137 @@
+"""
+Unit tests for etl.fetch_tasks.fetch_daily_core.
+
+Collectors, upserts and the DB connection are mocked – no HTTP or database
+access.
+"""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+pytest.importorskip("pendulum")  # ships with Airflow, not in requirements.txt
+
+import etl.fetch_tasks as ft  # noqa: E402
+
+_DATE = "2026-02-28"
+_DELIVERY_DATE = "2026-03-01"
+
+# Job order inside fetch_daily_core: ENTSO-E, one per weather location, EKZ, BAFU
+_UPSERTS = {
+    "ENTSO-E": "upsert_entsoe",
+    **{f"Weather {loc['label']}": "upsert_weather" for loc in ft._WEATHER_LOCATIONS},
+    "EKZ": "upsert_ekz",
+    "BAFU": "upsert_bafu",
+}
+_LABELS = list(_UPSERTS)
+
+
+def _http_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://web-api.tp.entsoe.eu/api")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status_code, request=request)
+    )
+
+
+@pytest.fixture
+def daily_core(monkeypatch):
+    """
+    Patch run_concurrently, get_conn and the upserts used by fetch_daily_core.
+
+    Returns ``run(results)``: calls fetch_daily_core with *results* (a
+    ``{label: records | exception}`` mapping, missing labels fetch ``[]``) as
+    the concurrent fetch output.  ``run.upserts`` holds the upsert mocks by
+    function name and ``run.conn`` the connection yielded by get_conn.
+    """
+    monkeypatch.setenv("ENTSOE_API_TOKEN", "test-token")
+    upserts = {name: MagicMock(return_value=1) for name in set(_UPSERTS.values())}
+    for name, mock in upserts.items():
+        monkeypatch.setattr(ft, name, mock)
+
+    conn = MagicMock()
+
+    @contextmanager
+    def _fake_conn():
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    monkeypatch.setattr(ft, "get_conn", _fake_conn)
+
+    def run(results: dict):
+        def _run_concurrently(collectors):
+            assert len(list(collectors)) == len(_LABELS)
+            return [results.get(label, []) for label in _LABELS]
+
+        monkeypatch.setattr(ft, "run_concurrently", _run_concurrently)
+        ft.fetch_daily_core(_DATE, _DELIVERY_DATE)
+
+    run.upserts = upserts
+    run.conn = conn
+    return run
+
+
+class TestFetchDailyCore:
+    def test_failed_source_does_not_block_others_and_is_reraised(self, daily_core):
+        boom = RuntimeError("EKZ down")
+        with pytest.raises(RuntimeError, match="EKZ down"):
+            daily_core({"EKZ": boom})
+        daily_core.upserts["upsert_ekz"].assert_not_called()
+        daily_core.upserts["upsert_entsoe"].assert_called_once()
+        daily_core.upserts["upsert_bafu"].assert_called_once()
+        assert daily_core.upserts["upsert_weather"].call_count == len(ft._WEATHER_LOCATIONS)
+
+    def test_first_failure_is_reraised(self, daily_core):
+        first, second = RuntimeError("first"), RuntimeError("second")
+        with pytest.raises(RuntimeError, match="first"):
+            daily_core({"EKZ": first, "BAFU": second})
+
+    def test_entsoe_404_is_skipped(self, daily_core):
+        daily_core({"ENTSO-E": _http_error(404)})  # should not raise
+        daily_core.upserts["upsert_entsoe"].assert_not_called()
+        daily_core.upserts["upsert_ekz"].assert_called_once()
+
+    def test_entsoe_other_http_error_is_reraised(self, daily_core):
+        with pytest.raises(httpx.HTTPStatusError):
+            daily_core({"ENTSO-E": _http_error(503)})
+
+    def test_results_go_to_matching_upsert_when_a_job_fails(self, daily_core):
+        weather_labels = [label for label in _LABELS if label.startswith("Weather")]
+        results = {label: [{"source": label}] for label in _LABELS}
+        results[weather_labels[1]] = RuntimeError("open-meteo down")
+
+        with pytest.raises(RuntimeError):
+            daily_core(results)
+
+        upserts = daily_core.upserts
+        assert upserts["upsert_entsoe"].call_args.args[0] == [{"source": "ENTSO-E"}]
+        assert upserts["upsert_ekz"].call_args.args[0] == [{"source": "EKZ"}]
+        assert upserts["upsert_bafu"].call_args.args[0] == [{"source": "BAFU"}]
+        assert [c.args[0] for c in upserts["upsert_weather"].call_args_list] == [
+            [{"source": weather_labels[0]}],
+            [{"source": weather_labels[2]}],
+        ]
+
+
+class TestFetchDailyCoreTransaction:
+    def test_all_upserts_share_one_connection(self, daily_core):
+        daily_core({})
+        calls = [c for mock in daily_core.upserts.values() for c in mock.call_args_list]
+        assert len(calls) == len(_LABELS)
+        assert all(c.kwargs["conn"] is daily_core.conn for c in calls)
+        daily_core.conn.commit.assert_called_once()
+        daily_core.conn.rollback.assert_not_called()
+
+    def test_failed_upsert_rolls_back_whole_batch(self, daily_core):
+        daily_core.upserts["upsert_ekz"].side_effect = RuntimeError("constraint violated")
+        with pytest.raises(RuntimeError, match="constraint violated"):
+            daily_core({})
+        daily_core.conn.rollback.assert_called_once()
+        daily_core.conn.commit.assert_not_called()
+        # BAFU comes after EKZ and is never attempted once the batch is aborted
+        daily_core.upserts["upsert_bafu"].assert_not_called()
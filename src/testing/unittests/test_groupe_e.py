@@ -5,13 +5,9 @@ HTTP is mocked – no real API calls are made.
 """
 
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
 
 import pytest
 
-import sys
-sys.path.insert(0, str(__import__("pathlib").Path(__file__).parents[3]))
-
 from src.data_collection.groupe_e_collector import GroupeECollector
 
 
@@ -99,18 +95,13 @@ class TestGroupeECollectorParse:
 
 
 class TestGroupeECollectorFetch:
-    def test_fetch_passes_timestamp_range_params(self):
-        mock_response = MagicMock()
-        mock_response.text = '{"prices": []}'
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("src.data_collection.base_collector.httpx.get", return_value=mock_response) as mock_get:
-            collector = GroupeECollector(date="2026-02-28")
-            collector.fetch()
-            params = mock_get.call_args.kwargs.get("params", {})
-            assert params.get("start_timestamp") == "2026-02-28T00:00:00+01:00"
-            assert params.get("end_timestamp") == "2026-03-01T00:00:00+01:00"
+    def test_fetch_passes_timestamp_range_params(self, mock_http_get):
+        collector = GroupeECollector(date="2026-02-28")
+        collector.fetch()
+        _, kwargs = mock_http_get[-1]
+        params = kwargs["params"]
+        assert params.get("start_timestamp") == "2026-02-28T00:00:00+01:00"
+        assert params.get("end_timestamp") == "2026-03-01T00:00:00+01:00"
 
     def test_default_date_is_today_utc(self):
         collector = GroupeECollector()
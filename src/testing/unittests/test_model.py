@@ -7,16 +7,10 @@ are required (tmp_path fixture handles serialisation tests).
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
 import numpy as np
 import pandas as pd
 import pytest
 
-# ── Path setup (mirrors the pattern in test_feature_pipeline.py) ──────────────
-sys.path.insert(0, str(Path(__file__).parents[3]))
-
 from src.modelling.evaluate import (
     LOAD_MAPE_THRESHOLD,
     check_load_quality,
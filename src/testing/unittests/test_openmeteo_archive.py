@@ -8,15 +8,10 @@ Tests verify:
 """
 
 import json
-import sys
 from datetime import datetime, timezone, timedelta
-from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parents[3]))
-
 from src.data_collection.openmeteo_collector import (
     OpenMeteoCollector,
     _is_historical,
@@ -75,42 +70,25 @@ class TestIsHistoricalFlag:
 
 
 class TestUrlSelection:
-    def _mock_response(self):
-        mock = MagicMock()
-        mock.text = json.dumps(_ARCHIVE_RESPONSE)
-        return mock
-
-    def test_forecast_collector_uses_forecast_url(self):
+    def test_forecast_collector_uses_forecast_url(self, mock_http_get):
         """No date given → forecast endpoint."""
         collector = OpenMeteoCollector()
-        with patch(
-            "src.data_collection.base_collector.httpx.get",
-            return_value=self._mock_response(),
-        ) as mock_get:
-            collector.fetch()
-        called_url = mock_get.call_args[0][0]
+        collector.fetch()
+        called_url, _ = mock_http_get[-1]
         assert "open-meteo.com/v1/forecast" in called_url
 
-    def test_archive_collector_uses_archive_url(self):
+    def test_archive_collector_uses_archive_url(self, mock_http_get):
         """Date 30 days ago → archive endpoint."""
         collector = OpenMeteoCollector(date=_date_str(-30))
-        with patch(
-            "src.data_collection.base_collector.httpx.get",
-            return_value=self._mock_response(),
-        ) as mock_get:
-            collector.fetch()
-        called_url = mock_get.call_args[0][0]
+        collector.fetch()
+        called_url, _ = mock_http_get[-1]
         assert "archive-api.open-meteo.com/v1/archive" in called_url
 
-    def test_recent_date_uses_forecast_url(self):
+    def test_recent_date_uses_forecast_url(self, mock_http_get):
         """Date 2 days ago → forecast endpoint."""
         collector = OpenMeteoCollector(date=_date_str(-2))
-        with patch(
-            "src.data_collection.base_collector.httpx.get",
-            return_value=self._mock_response(),
-        ) as mock_get:
-            collector.fetch()
-        called_url = mock_get.call_args[0][0]
+        collector.fetch()
+        called_url, _ = mock_http_get[-1]
         assert "open-meteo.com/v1/forecast" in called_url
 
 
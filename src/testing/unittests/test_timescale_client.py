@@ -0,0 +1,196 @@
+"""
+Unit tests for the bulk upsert helpers in db.timescale_client.
+
+The database is mocked – no TimescaleDB connection is required.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import src.db.timescale_client as tc
+
+_T0 = datetime(2026, 2, 28, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def _ekz_records(n: int) -> list[dict]:
+    return [
+        {"time": _T0, "tariff_type": f"type_{i}", "price_chf_kwh": 0.1 + i}
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def mock_cursor():
+    """Patch get_conn() so upserts run against a MagicMock cursor."""
+    cur = MagicMock()
+    cur.rowcount = 3
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cur
+
+    @contextmanager
+    def _fake_conn():
+        yield conn
+
+    with patch.object(tc, "get_conn", _fake_conn):
+        yield cur
+
+
+class TestBulkUpsert:
+    def test_empty_records_skip_db(self):
+        with patch.object(tc, "get_conn") as mock_get_conn:
+            assert tc.upsert_ekz([]) == 0
+            mock_get_conn.assert_not_called()
+
+    def test_small_batch_uses_execute_values(self, mock_cursor):
+        with patch.object(tc, "execute_values", return_value=[(1,)] * 2) as mock_ev:
+            inserted = tc.upsert_ekz(_ekz_records(3))
+        # Count comes from RETURNING rows (2 new, 1 duplicate), not cur.rowcount
+        assert inserted == 2
+        sql = mock_ev.call_args.args[1]
+        assert "INSERT INTO ekz_tariffs_raw (time, tariff_type, price_chf_kwh) VALUES %s" in sql
+        assert "ON CONFLICT (time, tariff_type) DO NOTHING RETURNING 1" in sql
+        assert "template" not in mock_ev.call_args.kwargs
+        assert list(mock_ev.call_args.args[2]) == [
+            (_T0, "type_0", 0.1), (_T0, "type_1", 1.1), (_T0, "type_2", 2.1),
+        ]
+        assert mock_ev.call_args.kwargs["fetch"] is True
+        assert mock_ev.call_args.kwargs["page_size"] == tc._PAGE_SIZE
+        mock_cursor.copy_expert.assert_not_called()
+
+    def test_bulk_upsert_uses_callers_connection(self):
+        conn = MagicMock()
+        with patch.object(tc, "execute_values", return_value=[(1,)]), \
+             patch.object(tc, "get_conn") as mock_get_conn:
+            inserted = tc._bulk_upsert(
+                conn, "bafu_hydro", ("time", "station_id"),
+                [{"time": _T0, "station_id": "2018"}], conflict_cols=("time", "station_id"),
+            )
+        assert inserted == 1
+        conn.cursor.assert_called_once()
+        mock_get_conn.assert_not_called()
+
+    def test_upserts_share_callers_transaction(self):
+        conn = MagicMock()
+        with patch.object(tc, "execute_values", return_value=[(1,)]), \
+             patch.object(tc, "get_conn") as mock_get_conn:
+            tc.upsert_ekz(_ekz_records(1), conn=conn)
+            tc.upsert_bafu([{"time": _T0, "station_id": "2018", "discharge_m3s": 1.0,
+                             "level_masl": 322.1}], conn=conn)
+        assert conn.cursor.call_count == 2
+        conn.commit.assert_not_called()
+        mock_get_conn.assert_not_called()
+
+    def test_large_batch_uses_copy_staging_table(self, mock_cursor, monkeypatch):
+        monkeypatch.setattr(tc, "_COPY_THRESHOLD", 2)
+        with patch.object(tc, "execute_values") as mock_ev:
+            tc.upsert_ekz(_ekz_records(3))
+        mock_ev.assert_not_called()
+
+        copy_sql, buf = mock_cursor.copy_expert.call_args.args
+        assert copy_sql.startswith("COPY _stage_ekz_tariffs_raw (time, tariff_type, price_chf_kwh)")
+        assert len(buf.getvalue().splitlines()) == 3
+
+        executed = [c.args[0] for c in mock_cursor.execute.call_args_list]
+        assert "CREATE TEMP TABLE _stage_ekz_tariffs_raw" in executed[0]
+        assert "ON COMMIT DROP" in executed[0]
+        assert "SELECT time, tariff_type, price_chf_kwh FROM _stage_ekz_tariffs_raw" in executed[1]
+        assert "ON CONFLICT (time, tariff_type) DO NOTHING" in executed[1]
+
+    def test_copy_upserts_share_one_transaction(self):
+        # Like Postgres, reject a second CREATE of a temp table that is still alive
+        live: set[str] = set()
+
+        def _execute(sql, *args):
+            words = sql.split()
+            if sql.startswith("CREATE TEMP TABLE"):
+                if words[3] in live:
+                    raise RuntimeError(f'relation "{words[3]}" already exists')
+                live.add(words[3])
+            elif sql.startswith("DROP TABLE"):
+                live.discard(words[2])
+
+        cur = MagicMock()
+        cur.rowcount = 1
+        cur.execute.side_effect = _execute
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cur
+
+        tc.upsert_ekz(_ekz_records(2), method="copy", conn=conn)
+        tc.upsert_ekz(_ekz_records(2), method="copy", conn=conn)
+
+        assert cur.copy_expert.call_count == 2
+        assert not live
+        conn.commit.assert_not_called()
+
+    def test_copy_writes_none_as_empty_field(self, mock_cursor, monkeypatch):
+        monkeypatch.setattr(tc, "_COPY_THRESHOLD", 1)
+        tc.upsert_bafu([
+            {"time": _T0, "station_id": "2018", "discharge_m3s": None, "level_masl": 322.1},
+        ])
+        _, buf = mock_cursor.copy_expert.call_args.args
+        assert buf.getvalue().strip() == "2026-02-28 00:00:00+00:00,2018,,322.1"
+
+    def test_method_copy_forces_copy_for_small_batch(self, mock_cursor):
+        with patch.object(tc, "execute_values") as mock_ev:
+            tc.upsert_ekz(_ekz_records(2), method="copy")
+        mock_ev.assert_not_called()
+        mock_cursor.copy_expert.assert_called_once()
+
+    def test_unknown_method_rejected(self, mock_cursor):
+        with pytest.raises(ValueError, match="method"):
+            tc.upsert_ekz(_ekz_records(1), method="bulk")
+
+    def test_column_mapping_is_zipped_into_rows(self, mock_cursor):
+        columns = {
+            "time": [_T0, _T0],
+            "tariff_type": ["a", "b"],
+            "price_chf_kwh": [0.1, 0.2],
+        }
+        with patch.object(tc, "execute_values", return_value=[(1,)] * 2) as mock_ev:
+            assert tc.upsert_ekz(columns) == 2
+        assert list(mock_ev.call_args.args[2]) == [(_T0, "a", 0.1), (_T0, "b", 0.2)]
+
+    def test_empty_column_mapping_skips_db(self):
+        with patch.object(tc, "get_conn") as mock_get_conn:
+            assert tc.upsert_weather({"time": []}) == 0
+            mock_get_conn.assert_not_called()
+
+
+class TestMakeUpsert:
+    def test_helpers_keep_name_and_docstring(self):
+        assert tc.upsert_bafu.__name__ == "upsert_bafu"
+        assert "BAFU hydro" in tc.upsert_bafu.__doc__
+
+    def test_helper_sends_prebuilt_sql(self, mock_cursor):
+        with patch.object(tc, "execute_values", return_value=[(1,)]) as mock_ev, \
+             patch.object(tc, "_values_sql") as mock_values_sql:
+            tc.upsert_ekz(_ekz_records(1))
+        # Built once at import, not per call
+        mock_values_sql.assert_not_called()
+        assert mock_ev.call_args.args[1] == tc._values_sql(
+            "ekz_tariffs_raw", ("time", "tariff_type", "price_chf_kwh"), ("time", "tariff_type"),
+        )
+
+
+class TestConnectionPool:
+    def test_get_pool_creates_pool_once(self, monkeypatch):
+        monkeypatch.setattr(tc, "_pool", None)
+        monkeypatch.setenv("BDSP_DB_PASSWORD", "x")
+        with patch.object(tc.pool, "ThreadedConnectionPool") as mock_cls:
+            mock_cls.return_value.closed = False
+            first = tc.get_pool()
+            assert tc.get_pool() is first
+        mock_cls.assert_called_once()
+
+    def test_get_conn_returns_connection_to_same_pool(self):
+        fake_pool = MagicMock()
+        conn = fake_pool.getconn.return_value
+        with patch.object(tc, "get_pool", return_value=fake_pool) as mock_get_pool:
+            with tc.get_conn() as c:
+                assert c is conn
+        mock_get_pool.assert_called_once()
+        conn.commit.assert_called_once()
+        fake_pool.putconn.assert_called_once_with(conn)
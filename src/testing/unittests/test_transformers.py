@@ -4,12 +4,10 @@ Unit tests for data_cleaning.transformers.
 
 from datetime import datetime, timezone
 
+import numpy as np
 import pandas as pd
 import pytest
 
-import sys
-sys.path.insert(0, str(__import__("pathlib").Path(__file__).parents[3]))
-
 from src.data_cleaning.transformers import (
     aggregate_to_hourly,
     to_utc,
@@ -41,28 +39,36 @@ class TestToUtc:
 
 
 class TestAggregateToHourly:
-    def _make_15min_df(self) -> pd.DataFrame:
-        times = pd.date_range("2026-02-28", periods=8, freq="15min", tz="UTC")
-        values = [10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0, 80.0]
-        return pd.DataFrame({"time": times, "price": values})
-
-    def test_output_has_hourly_frequency(self):
-        df = self._make_15min_df()
-        result = aggregate_to_hourly(df, "price")
+    @pytest.fixture(scope="class")
+    def df_15min(self) -> pd.DataFrame:
+        """Two hours of 15-min prices 10, 20, …, 80, built once per class."""
+        return pd.DataFrame({
+            "time": pd.date_range("2026-02-28", periods=8, freq="15min", tz="UTC"),
+            "price": np.arange(10.0, 90.0, 10.0),
+        })
+
+    def test_output_has_hourly_frequency(self, df_15min):
+        result = aggregate_to_hourly(df_15min, "price")
         assert len(result) == 2
 
-    def test_mean_aggregation_correct(self):
-        df = self._make_15min_df()
-        result = aggregate_to_hourly(df, "price")
+    def test_mean_aggregation_correct(self, df_15min):
+        result = aggregate_to_hourly(df_15min, "price")
         # First hour: mean(10, 20, 30, 40) = 25
-        assert result["price"].iloc[0] == pytest.approx(25.0)
+        assert result["price"].iloc[0] == 25.0
 
-    def test_output_contains_time_and_value_columns(self):
-        df = self._make_15min_df()
-        result = aggregate_to_hourly(df, "price")
+    def test_output_contains_time_and_value_columns(self, df_15min):
+        result = aggregate_to_hourly(df_15min, "price")
         assert "time" in result.columns
         assert "price" in result.columns
 
+    def test_original_dataframe_not_mutated(self, df_15min):
+        # Copy so the shared fixture stays in UTC for the other tests
+        df = df_15min.copy()
+        df["time"] = df["time"].dt.tz_convert("Europe/Zurich")
+        aggregate_to_hourly(df, "price")
+        assert str(df["time"].dt.tz) == "Europe/Zurich"
+        assert len(df) == 8
+
 
 class TestValidateNoNulls:
     def test_passes_when_no_nulls(self):
@@ -74,6 +80,11 @@ class TestValidateNoNulls:
         with pytest.raises(ValueError, match="a"):
             validate_no_nulls(df, ["a"])
 
+    def test_error_lists_every_column_with_nulls(self):
+        df = pd.DataFrame({"a": [1, None, None], "b": [1, 2, 3], "c": [None, 2, 3]})
+        with pytest.raises(ValueError, match=r"'a' \(2\), 'c' \(1\)"):
+            validate_no_nulls(df, ["a", "b", "c"])
+
     def test_raises_on_missing_column(self):
         df = pd.DataFrame({"a": [1, 2]})
         with pytest.raises(ValueError, match="nonexistent"):
@@ -83,7 +94,13 @@ class TestValidateNoNulls:
 class TestValidateAscendingTimestamps:
     def test_passes_for_sorted_timestamps(self):
         df = pd.DataFrame(
-            {"time": pd.date_range("2026-02-28", periods=5, freq="h", tz="UTC")}
+            {
+                "time": [
+                    datetime(2026, 2, 28, 0, tzinfo=timezone.utc),
+                    datetime(2026, 2, 28, 1, tzinfo=timezone.utc),
+                    datetime(2026, 2, 28, 2, tzinfo=timezone.utc),
+                ]
+            }
         )
         validate_ascending_timestamps(df)  # should not raise
 
@@ -99,3 +116,9 @@ class TestValidateAscendingTimestamps:
         )
         with pytest.raises(ValueError, match="ascending"):
             validate_ascending_timestamps(df)
+
+    def test_string_timestamps_are_parsed(self):
+        df = pd.DataFrame({"time": ["2026-02-28T01:00:00+01:00", "2026-02-28T00:30:00+00:00"]})
+        validate_ascending_timestamps(df)  # 00:00Z < 00:30Z – should not raise
+        with pytest.raises(ValueError, match="ascending"):
+            validate_ascending_timestamps(df.iloc[::-1])
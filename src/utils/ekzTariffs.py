@@ -1,34 +1,41 @@
-import requests
 import json
-from datetime import datetime
+import sys
+from datetime import date
+from pathlib import Path
+
+# Allow running from project root without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.data_collection.ekz_collector import EkzCollector
 
 # Einstellungen
-URL = "https://api.tariffs.ekz.ch/v1/tariffs"
-TARGET_DATE = datetime.now().strftime("%Y-%m-%d")
-REGION_NAME = "Sihl" # Fokusregion 
-
-params = {
-    "date": TARGET_DATE,
-    "TarifffName": "electricity_dynamic"
-}
-
-try:
-    response = requests.get(URL, params=params)
-    response.raise_for_status()
-    data = response.json()
-
-    # Region manuell zu den Metadaten im JSON hinzu
-    data["metadata"] = {
-        "region": REGION_NAME,
-        "description": "Repräsentative Daten für das EKZ-Versorgungsgebiet (Limmattal)"
-    }
-
-    filename = f"ekz_15min_{REGION_NAME}_{TARGET_DATE}.json"
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
-        
-    print(f"Datei gespeichert: {filename}")
-    print(f"Info: EKZ-Tarife sind für alle Regionen (inkl. {REGION_NAME}) identisch.")
-
-except Exception as e:
-    print(f"Fehler: {e}")
+REGION_NAME = "Sihl" # Fokusregion
+
+
+def main() -> None:
+    target_date = date.today().isoformat()
+
+    try:
+        # EkzCollector holt electricity_dynamic + integrated_400D über den
+        # gemeinsamen httpx-Client (inkl. Retry)
+        data = json.loads(EkzCollector(date=target_date).fetch())
+
+        # Region manuell zu den Metadaten im JSON hinzu
+        data["metadata"] = {
+            "region": REGION_NAME,
+            "description": "Repräsentative Daten für das EKZ-Versorgungsgebiet (Limmattal)"
+        }
+
+        filename = f"ekz_15min_{REGION_NAME}_{target_date}.json"
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"), default=str)
+
+        print(f"Datei gespeichert: {filename}")
+        print(f"Info: EKZ-Tarife sind für alle Regionen (inkl. {REGION_NAME}) identisch.")
+
+    except Exception as e:
+        print(f"Fehler: {e}")
+
+
+if __name__ == "__main__":
+    main()